@@ -15,6 +15,9 @@ ISI, SOUND_LENGTH 等）はそのまま再利用し、以下の 3 関数だけ
   3. useModelToPredict()         : model.py(SVM) ではなく model_2x.py
                                    （two-band LDA, model_2x.pkl）で予測する。
 
+加えて、UI ループを止めずに予測するための PredictionWorker を提供する
+（モデルはファイル更新時刻をキーにキャッシュし、起動時に事前ロードできる）。
+
 B2J-User_2x.py から呼び出される。B2J-User.py / ABMI_Utils.py は変更しない。
 """
 
@@ -22,6 +25,8 @@ import os
 import time
 import random
 import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import joblib
 import numpy as np
@@ -77,7 +82,7 @@ def generateSequence(num_sequences=NUM_SEQUENCES):
 	return stimulation_sequence, sequence_ids
 
 
-def startSingleTrainingSequence(board, user_id, timestamp, lcr_value, base_path):
+def startSingleTrainingSequence(board, user_id, timestamp, lcr_value, base_path, done_event=None):
 	"""
 	単一トレーニングシーケンスをバックグラウンドスレッドで開始する。
 
@@ -85,6 +90,8 @@ def startSingleTrainingSequence(board, user_id, timestamp, lcr_value, base_path)
 	  - generateSequence は本モジュールの 5(+1) セット版を使用
 	  - 刺激再生後の末尾インターバル time.sleep(2) を 0.05 秒に短縮
 	    （末尾区間はボーナスセットが埋めるため）
+	  - done_event（threading.Event）を渡すと、スレッド終了時に set する
+	    （メインループがポーリングせずに待機できるように）
 
 	Returns a tuple of (worker_thread, cancel_event).
 	"""
@@ -209,6 +216,8 @@ def startSingleTrainingSequence(board, user_id, timestamp, lcr_value, base_path)
 		finally:
 			board.stimulus_sound = 0
 			board.sequence_id = 0
+			if done_event is not None:
+				done_event.set()
 
 	sequence_thread = threading.Thread(target=_sequence_worker, daemon=True)
 	sequence_thread.start()
@@ -275,6 +284,30 @@ def _diagnose_recording(test_file_path):
 		print("[DIAG] -> L/C/R 全てエポックあり。特徴抽出は成功する見込み")
 
 
+# model_2x.pkl のキャッシュ: path -> (mtime, clf)。ファイルが差し替わると再ロードする。
+_model_cache = {}
+_model_cache_lock = threading.Lock()
+
+
+def loadModel(model_folder="Model/"):
+	"""
+	model_2x.pkl をロードして返す。更新時刻が変わっていなければキャッシュを返す。
+	Cloud_Utils.ModelFetcher が os.replace でファイルを差し替えると更新時刻が
+	変わるので、次の予測で自動的に新しいモデルが読み直される（通知は不要）。
+	"""
+	model_path = os.path.join(model_folder, "model_2x.pkl")
+	mtime = os.path.getmtime(model_path)
+
+	with _model_cache_lock:
+		cached = _model_cache.get(model_path)
+		if cached is not None and cached[0] == mtime:
+			return cached[1]
+
+		clf = joblib.load(model_path)
+		_model_cache[model_path] = (mtime, clf)
+		return clf
+
+
 def useModelToPredict(test_file_path, model_folder="Model/"):
 	"""
 	model_2x.py（two-band LDA）で予測する。
@@ -290,7 +323,7 @@ def useModelToPredict(test_file_path, model_folder="Model/"):
 
 	# 1) モデル読み込み
 	try:
-		clf = joblib.load(model_path)
+		clf = loadModel(model_folder)
 	except Exception as e:
 		print(f"[ERROR] 段階1: モデル読み込み失敗 ({model_path}): {e}")
 		raise
@@ -318,3 +351,50 @@ def useModelToPredict(test_file_path, model_folder="Model/"):
 	result = int(predictions[0])
 	print(f"[DIAG] 段階3 OK: prediction={result}")
 	return result
+
+
+PredictionResult = namedtuple("PredictionResult", ["prediction", "elapsed"])
+
+
+class PredictionWorker:
+	"""
+	useModelToPredict を専用スレッドで実行するワーカー。
+
+	submit() は concurrent.futures.Future を返し、結果は
+	PredictionResult(prediction, elapsed[秒])。呼び出し側（pygame ループ）は
+	future.done() を見るだけなので、描画や ESC / B キー入力は止まらない。
+
+	実行中の予測は途中で止められないため、cancel() は未着手なら取り消し、
+	着手済みなら結果を捨てる（呼び出し側が future を破棄する）運用とする。
+	プロセスではなくスレッドを使うのは、Pi 上でモデルやフィルタを子プロセスへ
+	渡すコストを避けるため（numpy/scipy の計算中は GIL が解放される）。
+	"""
+
+	def __init__(self, model_folder="Model/"):
+		self.model_folder = model_folder
+		self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PredictionWorker")
+
+	def prewarm(self):
+		"""モデルのロードとフィルタ設計を先に済ませておく（起動時に 1 回呼ぶ）。"""
+		return self._executor.submit(self._prewarm)
+
+	def _prewarm(self):
+		start = time.perf_counter()
+		try:
+			loadModel(self.model_folder)
+		except Exception as e:
+			print(f"[WARN] モデルの事前ロードに失敗: {e}")
+		model_2x.prewarm_filters()
+		if DEBUG:
+			print(f"[DIAG] 予測ワーカー準備完了 ({time.perf_counter() - start:.2f}s)")
+
+	def submit(self, test_file_path):
+		return self._executor.submit(self._predict, test_file_path)
+
+	def _predict(self, test_file_path):
+		start = time.perf_counter()
+		prediction = useModelToPredict(test_file_path, self.model_folder)
+		return PredictionResult(prediction, time.perf_counter() - start)
+
+	def shutdown(self):
+		self._executor.shutdown(wait=False, cancel_futures=True)
@@ -3,8 +3,10 @@ import sys
 import random
 import math
 import threading
+import time
 import serial
 import Arm_Utils
+import UI_Utils
 import ALS_Utils
 from dynamixel_sdk import *
 from serial.tools import list_ports
@@ -84,16 +86,22 @@ def toggle_recording(slot_index, label):
 	else:
 		for arm in [a for a in (RightArm, LeftArm) if a]:
 			threading.Thread(target=arm.end_record, daemon=True).start()
+		motion_library.reload_after_recording(slot_index + 1)
 		send_m5("RECORDING_END")
 
 def play_animation(motion_number):
 	def worker():
-		arms = [a for a in (RightArm, LeftArm) if a]
-		for arm in arms:
-			filename = f"Motion{motion_number}{'R' if arm == RightArm else 'L'}.csv"
-			arm.play_positions(csv_filename=filename)
-		for arm in arms:
-			arm.task_done_event.wait()
+		assignments = []
+		for arm in [a for a in (RightArm, LeftArm) if a]:
+			side = 'R' if arm == RightArm else 'L'
+			clip = motion_library.get(motion_number, side)
+			if clip is None:
+				print(f"[ERROR] No valid recording for {motion_library.filename(motion_number, side)}")
+				continue
+			assignments.append((arm, clip))
+		# Both arms share one clock so choreographed motions stay in step
+		arms = multi_arm_player.play(assignments, speed=ANIMATION_SPEED)
+		multi_arm_player.wait(arms)
 		global animation_lock_interrupt
 		if animation_lock_interrupt:
 			animation_lock_interrupt = False
@@ -112,11 +120,13 @@ def apply_gesture(gesture_name):
 		positions = load_gesture_positions().get(gesture_name)
 		if not positions:
 			return
-		for motor_id, value in positions.items():
-			if value is None:
-				RightArm.enable_single_motor_torque(motor_id, False)
-			else:
-				RightArm.set_motor_position(motor_id, RightArm.default_speed, value)
+		# One packet for the released motors, one for profile + goal of the rest
+		released = [motor_id for motor_id, value in positions.items() if value is None]
+		goals = {motor_id: value for motor_id, value in positions.items() if value is not None}
+		if released:
+			RightArm.set_torque_bulk(False, released)
+		if goals:
+			RightArm.set_motor_positions(goals, RightArm.default_speed)
 	threading.Thread(target=worker, daemon=True).start()
 
 def detect_arm_ports():
@@ -126,100 +136,108 @@ def detect_arm_ports():
 	right_arm = expected_ports[0]
 	left_arm = expected_ports[1]
 
+	# Both U2D2 ports are probed at once; one broadcast ping per port lists its IDs
+	discovered = Arm_Utils.probe_ports(expected_ports, [right_arm_expected_motors, left_arm_expected_motors])
+	for port, ids in discovered.items():
+		# Motor ID 1 (right) or ID 11 (left) identifies the arm
+		if 1 in ids:
+			right_arm = port
+		elif 11 in ids:
+			left_arm = port
 
-	for port in expected_ports:
-		handler = PortHandler(port)
-		if handler.openPort():
-			handler.setBaudRate(BAUDRATE)
-			packetHandler = PacketHandler(PROTOCOL_VERSION)
-			# Check if motor ID 1 (right) or ID 11 (left) responds
-			model, result, error = packetHandler.ping(handler, 1)
-			if result == COMM_SUCCESS:
-				right_arm = port
-			else:
-				model, result, error = packetHandler.ping(handler, 11)
-				if result == COMM_SUCCESS:
-					left_arm = port
-			handler.closePort()
-
-	return right_arm, left_arm
+	return right_arm, left_arm, discovered
 
 def ping_arm(index):
 
-	global RightArm, LeftArm
 	global right_arm_motors_alive, left_arm_motors_alive
 
-	def worker(arm, expected_ids, update_alive):
-		if arm.ping_thread_running:
-			return
-		arm.ping_thread_running = True
-		successful_ids = arm.ping_motors()
-		update_alive(match_lists(expected_ids, successful_ids))
-		arm.ping_thread_running = False
-		
-	if index == 0 and RightArm: # Motors 1-9
-		threading.Thread(
-			target=worker,
-			args=(RightArm, right_arm_expected_motors, lambda v: globals().__setitem__('right_arm_motors_alive', v)),
-			daemon=True
-		).start()
-
-	elif index == 1 and LeftArm: # Motors 11-18
-		threading.Thread(
-			target=worker,
-			args=(LeftArm, left_arm_expected_motors, lambda v: globals().__setitem__('left_arm_motors_alive', v)),
-			daemon=True
-		).start()
+	# Alive values come from the arm's telemetry snapshot; nothing touches the bus here
+	telemetry = arm_telemetry[index]
+	if telemetry is None:
+		return
 
-def draw_language_selection():
-	render_surface.fill(black)
+	if index == 0: # Motors 1-9
+		right_arm_motors_alive = match_lists(right_arm_expected_motors, telemetry.snapshot.alive)
+
+	elif index == 1: # Motors 11-18
+		left_arm_motors_alive = match_lists(left_arm_expected_motors, telemetry.snapshot.alive)
+
+def present():
+	# Optional draw-time readout, then push only the regions that changed
+	if SHOW_FRAME_TIME:
+		ui.blit("frame_time", text_cache.render(frame_timer.readout(), 13, light_yellow),
+				topright=(render_surface.get_width() - 5, 5))
+	ui.present()
+
+def draw_chrome(show_controller_icon=True):
+	# Controller icon and blue outline sit on top of every scene
+	if show_controller_icon and not joystick_connected:
+		ui.blit("controller_icon", controller_disconnected_icon_scaled, topleft=controller_icon_pos)
+	ui.add("outline", render_surface.get_rect(), cool_blue,
+		   lambda surface: pygame.draw.rect(surface, cool_blue, surface.get_rect(), 1))
+
+def draw_pill(key, x, y, w, h, color, text):
+	text_surf = text_cache.render(text, 40, white, language)
+	text_rect = text_surf.get_rect(center=(x + w//2, y + h//2 - 2))
 
-	font = pygame.font.Font("/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf", 23)
-	bigfont = pygame.font.Font("/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf", 40)
-	smallfont = pygame.font.Font("/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf", 16)
+	def paint(surface):
+		radius = h // 2
+		# pill shape: 2 circles connected by a rect
+		pygame.draw.circle(surface, color, (x + radius, y + radius), radius)
+		pygame.draw.circle(surface, color, (x + w - radius, y + radius), radius)
+		pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
+		# draw text centered in pill
+		surface.blit(text_surf, text_rect)
+
+	ui.add(key, pygame.Rect(x, y, w, h).union(text_rect), (color, text_surf), paint)
+
+def draw_letter_button(key, cx, cy, color, letter):
+	letter_surf = text_cache.render(letter, 36, black, language)
+	letter_rect = letter_surf.get_rect(center=(cx, cy - 2))
+
+	def paint(surface):
+		pygame.draw.circle(surface, color, (cx, cy), 25)
+		surface.blit(letter_surf, letter_rect)
+
+	ui.add(key, pygame.Rect(cx - 25, cy - 25, 50, 50).union(letter_rect), (color, letter_surf), paint)
+
+def draw_language_selection():
+	ui.begin(SCENE_LANGUAGE_SELECT)
 
 	# Warning if controller not connected
 	if pygame.joystick.get_count() == 0:
 		warning_text = "WARNING: CONTROLLER NOT DETECTED"
-		warning_surface = smallfont.render(warning_text, True, soft_red)
-		warning_rect = warning_surface.get_rect(center=(render_surface.get_width() // 2, 35))
-		render_surface.blit(warning_surface, warning_rect)
+		warning_surface = text_cache.render(warning_text, 16, soft_red, language)
+		ui.blit("warning", warning_surface, center=(render_surface.get_width() // 2, 35))
 
 	# Prompt
 	prompt = "Select Language / 言語を選択してください"
-	prompt_surface = font.render(prompt, True, white)
-	prompt_rect = prompt_surface.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() // 3 - 30))
-	render_surface.blit(prompt_surface, prompt_rect)
+	prompt_surface = text_cache.render(prompt, 23, white, language)
+	ui.blit("prompt", prompt_surface, center=(render_surface.get_width() // 2, render_surface.get_height() // 3 - 30))
 
 	# Languages
 	for i, lang in enumerate(languages):
 		color = cool_blue if i == selected_lang_index else white
-		lang_surface = bigfont.render(lang, True, color)
+		lang_surface = text_cache.render(lang, 40, color, language)
 		offset_x = -100 if i == 0 else 100
-		lang_rect = lang_surface.get_rect(center=(render_surface.get_width() // 2 + offset_x, render_surface.get_height() // 2))
-		render_surface.blit(lang_surface, lang_rect)
+		ui.blit(("lang", i), lang_surface, center=(render_surface.get_width() // 2 + offset_x, render_surface.get_height() // 2))
 
 	# Confirm text
 	confirm_text = "Press ♥ to confirm / 決定するには♥を押してください"
-	confirm_surface = smallfont.render(confirm_text, True, white)
-	confirm_rect = confirm_surface.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() - 80))
-	render_surface.blit(confirm_surface, confirm_rect)
+	confirm_surface = text_cache.render(confirm_text, 16, white, language)
+	ui.blit("confirm", confirm_surface, center=(render_surface.get_width() // 2, render_surface.get_height() - 80))
 
 	# Draw to screen
-	screen.blit(render_surface, (0, 0))
-	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	draw_chrome(show_controller_icon=False)
+	present()
 
 def draw_motor_readings(index):
-	render_surface.fill(black)
+	ui.begin((SCENE_MOTOR_READINGS, index))
 	
 	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	title_font = pygame.font.Font(font_path, 20)
-	status_font = pygame.font.Font(font_path, 16)
-	instruction_font = pygame.font.Font(font_path, 13)
-	notice_font = pygame.font.Font(font_path, 18)
-	controls_font = pygame.font.Font(font_path, 30)
+	instruction_font = fonts.get(13)
+	notice_font = fonts.get(18)
+	controls_font = fonts.get(30)
 
 	# Ping for motor alive values
 	ping_arm(index)
@@ -265,32 +283,32 @@ def draw_motor_readings(index):
 		controls = "♥: 次へ\n–: 戻る"
 
 	# Draw status line
-	status_surf = status_font.render(status_text, True, white)
-	render_surface.blit(status_surf, (left_margin, top_margin))
+	status_surf = text_cache.render(status_text, 16, white, language)
+	ui.blit("status", status_surf, topleft=(left_margin, top_margin))
 
 	# Draw instruction text
 	lines = instructions.split("\n")
 	for i, line in enumerate(lines):
-		line_surf = instruction_font.render(line, True, warning_orange)
+		line_surf = text_cache.render(line, 13, warning_orange, language)
 		y = top_margin + 35 + i * (instruction_font.get_height() + text_spacing)
-		render_surface.blit(line_surf, (left_margin, y))
+		ui.blit(("instruction", i), line_surf, topleft=(left_margin, y))
 
 	# Draw notice text
 	notice_lines = notice.split("\n")
 	notice_start_y = top_margin + 35 + len(lines) * (instruction_font.get_height() + text_spacing) + 10
 	for i, line in enumerate(notice_lines):
-		line_surf = notice_font.render(line, True, white)
+		line_surf = text_cache.render(line, 18, white, language)
 		y = notice_start_y + i * (notice_font.get_height() + text_spacing)
-		render_surface.blit(line_surf, (left_margin + 5, y))
+		ui.blit(("notice", i), line_surf, topleft=(left_margin + 5, y))
 
 	# Draw controls (bottom right)
 	controls_lines = controls.split("\n")
 	controls_x = 325
 	controls_y = top_margin + 10
 	for i, line in enumerate(controls_lines):
-		line_surf = controls_font.render(line, True, white)
+		line_surf = text_cache.render(line, 30, white, language)
 		y = controls_y + i * (controls_font.get_height() + text_spacing)
-		render_surface.blit(line_surf, (controls_x, y))
+		ui.blit(("controls", i), line_surf, topleft=(controls_x, y))
 
 	# Draw 3x3 grid of connection circles (right side)
 	circle_radius = 20
@@ -313,35 +331,33 @@ def draw_motor_readings(index):
 			cx = grid_x + col * (circle_radius * 2 + gap)
 			cy = grid_y + row * (circle_radius * 2 + gap)
 			num = idx + 1 + (current_motor_reading * 10)
+			alive = motor_status[idx] == 1
+			num_surf = text_cache.render(str(num), 20, white, language)
 
-			if motor_status[idx] == 1:
-				pygame.draw.circle(render_surface, white, (cx, cy), circle_radius, 1)
-				num_surf = title_font.render(str(num), True, white)
-				num_rect = num_surf.get_rect(center=(cx, cy))
-				render_surface.blit(num_surf, num_rect)
-			else:
-				pygame.draw.line(render_surface, soft_red, (cx - circle_radius, cy - circle_radius), (cx + circle_radius, cy + circle_radius), 5)
-				pygame.draw.line(render_surface, soft_red, (cx + circle_radius, cy - circle_radius), (cx - circle_radius, cy + circle_radius), 5)
+			def paint(surface, cx=cx, cy=cy, alive=alive, num_surf=num_surf):
+				if alive:
+					pygame.draw.circle(surface, white, (cx, cy), circle_radius, 1)
+					surface.blit(num_surf, num_surf.get_rect(center=(cx, cy)))
+				else:
+					pygame.draw.line(surface, soft_red, (cx - circle_radius, cy - circle_radius), (cx + circle_radius, cy + circle_radius), 5)
+					pygame.draw.line(surface, soft_red, (cx + circle_radius, cy - circle_radius), (cx - circle_radius, cy + circle_radius), 5)
 
-	# Final blits and outlines
-	screen.blit(render_surface, (0, 0))
-	if not joystick_connected:
-		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
+			# Line width 5 reaches a few pixels past the circle's box
+			dot_rect = pygame.Rect(cx - circle_radius - 3, cy - circle_radius - 3, 2 * circle_radius + 6, 2 * circle_radius + 6)
+			ui.add(("motor", idx), dot_rect.union(num_surf.get_rect(center=(cx, cy))), (alive, num_surf), paint)
 
-	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	# Final blits and outlines
+	draw_chrome()
+	present()
 
 def draw_lock_release():
 
 	global lock_button_held, release_button_held
-	render_surface.fill(black)
+	ui.begin(SCENE_LOCK_RELEASE)
 
 	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	message_font = pygame.font.Font(font_path, 30)
-	controls_font = pygame.font.Font(font_path, 30)
-	button_font = pygame.font.Font(font_path, 40)
-	warning_font = pygame.font.Font(font_path, 18)
+	message_font = fonts.get(30)
+	controls_font = fonts.get(30)
 
 	# Text by language
 	if language == "en":
@@ -362,17 +378,17 @@ def draw_lock_release():
 	# Render top-left message (multi-line)
 	message_lines = message.split("\n")
 	for i, line in enumerate(message_lines):
-		line_surf = message_font.render(line, True, white)
-		render_surface.blit(line_surf, (30, 25 + i * (message_font.get_height() + 5)))
+		line_surf = text_cache.render(line, 30, white, language)
+		ui.blit(("message", i), line_surf, topleft=(30, 25 + i * (message_font.get_height() + 5)))
 
 	# Render controls (top right)
 	controls_lines = controls.split("\n")
 	controls_x = 325
 	controls_y = 25
 	for i, line in enumerate(controls_lines):
-		line_surf = controls_font.render(line, True, white)
+		line_surf = text_cache.render(line, 30, white, language)
 		y = controls_y + i * (controls_font.get_height() + 5)
-		render_surface.blit(line_surf, (controls_x, y))
+		ui.blit(("controls", i), line_surf, topleft=(controls_x, y))
 
 	# Lock Release Variable Check
 	l_held = lock_button_held
@@ -387,8 +403,8 @@ def draw_lock_release():
 
 	# Render LOCK and RELEASE text centered horizontally, below message and controls
 	mid_y = 125
-	lock_surf = button_font.render(lock_text, True, lock_text_color)
-	release_surf = button_font.render(release_text, True, release_text_color)
+	lock_surf = text_cache.render(lock_text, 40, lock_text_color, language)
+	release_surf = text_cache.render(release_text, 40, release_text_color, language)
 
 	# Calculate positions
 	screen_width = render_surface.get_width()
@@ -398,53 +414,27 @@ def draw_lock_release():
 	lock_x = (center_x - spacing) - shift_amount
 	release_x = (center_x + spacing) - shift_amount
 
-	render_surface.blit(lock_surf, (lock_x - lock_surf.get_width()//2, mid_y))
-	render_surface.blit(release_surf, (release_x - release_surf.get_width()//2, mid_y))
+	ui.blit("lock_label", lock_surf, topleft=(lock_x - lock_surf.get_width()//2, mid_y))
+	ui.blit("release_label", release_surf, topleft=(release_x - release_surf.get_width()//2, mid_y))
 
 	# Draw red pill-shaped capsules under the LOCK and RELEASE text
 	capsule_width, capsule_height = 100, 50
-	text_color = white
-
-	def draw_pill(surface, x, y, w, h, color, text):
-		radius = h // 2
-		# pill shape: 2 circles connected by a rect
-		pygame.draw.circle(surface, color, (x + radius, y + radius), radius)
-		pygame.draw.circle(surface, color, (x + w - radius, y + radius), radius)
-		pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
-		# draw text centered in pill
-		text_surf = button_font.render(text, True, text_color)
-		text_rect = text_surf.get_rect(center=(x + w//2, -2 + y + h//2))
-		surface.blit(text_surf, text_rect)
-
 	pill_y = mid_y + lock_surf.get_height() + 15
-	draw_pill(render_surface, lock_x - capsule_width//2, pill_y, capsule_width, capsule_height, lock_pill_color, "L")
-	draw_pill(render_surface, release_x - capsule_width//2, pill_y, capsule_width, capsule_height, release_pill_color, "R")
+	draw_pill("lock_pill", lock_x - capsule_width//2, pill_y, capsule_width, capsule_height, lock_pill_color, "L")
+	draw_pill("release_pill", release_x - capsule_width//2, pill_y, capsule_width, capsule_height, release_pill_color, "R")
 
 	# Final warning message at the bottom
-	warning_surf = warning_font.render(warning_text, True, white)
-	warning_rect = warning_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() - 35))
-	render_surface.blit(warning_surf, warning_rect)
+	warning_surf = text_cache.render(warning_text, 18, white, language)
+	ui.blit("warning", warning_surf, center=(render_surface.get_width() // 2, render_surface.get_height() - 35))
 
 	# Final blits and outline
-	screen.blit(render_surface, (0, 0))
-	if not joystick_connected:
-		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
-
-	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	draw_chrome()
+	present()
 
 def draw_recording_stage():
 	global recording_states, playback_button_states
-	render_surface.fill(black)
+	ui.begin(SCENE_RECORDING_STAGE)
 
-	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	title_font = pygame.font.Font(font_path, 30)
-	label_font = pygame.font.Font(font_path, 22)
-	status_font = pygame.font.Font(font_path, 25)
-	letter_font = pygame.font.Font(font_path, 36)
-	hint_font = pygame.font.Font(font_path, 20)
- 
 	# Text by language
 	if language == "en":
 		title_text = "Record Today's Animations"
@@ -460,9 +450,8 @@ def draw_recording_stage():
 		hint_text = "♥: 次へ          –: 戻る"
 
 	# Top Title
-	title_surf = title_font.render(title_text, True, white)
-	title_rect = title_surf.get_rect(center=(render_surface.get_width() // 2, 40))
-	render_surface.blit(title_surf, title_rect)
+	title_surf = text_cache.render(title_text, 30, white, language)
+	ui.blit("title", title_surf, center=(render_surface.get_width() // 2, 40))
 
 	# Setup for columns
 	center_x = render_surface.get_width() // 2
@@ -473,19 +462,16 @@ def draw_recording_stage():
 		section_x = center_x + (i - 1) * section_spacing
 
 		# "Press X/Y/Z to"
-		press_surf = label_font.render(press_texts[i], True, white)
-		press_rect = press_surf.get_rect(center=(section_x, base_y))
-		render_surface.blit(press_surf, press_rect)
+		press_surf = text_cache.render(press_texts[i], 22, white, language)
+		ui.blit(("press", i), press_surf, center=(section_x, base_y))
 
 		# "START"/"STOP"
-		status_surf = status_font.render(status_texts[i], True, red if status_texts[i] in ["START", "開始"] else green)
-		status_rect = status_surf.get_rect(center=(section_x, base_y + 40))
-		render_surface.blit(status_surf, status_rect)
+		status_surf = text_cache.render(status_texts[i], 25, red if status_texts[i] in ["START", "開始"] else green, language)
+		ui.blit(("status", i), status_surf, center=(section_x, base_y + 40))
 
 		# "Playback 1/2/3"
-		playback_surf = label_font.render(playback_labels[i], True, white)
-		playback_rect = playback_surf.get_rect(center=(section_x, base_y + 90))
-		render_surface.blit(playback_surf, playback_rect)
+		playback_surf = text_cache.render(playback_labels[i], 22, white, language)
+		ui.blit(("playback", i), playback_surf, center=(section_x, base_y + 90))
 
 		# Circle with letter A/B/C and color Green/Blue/Yellow
 		circle_y = base_y + 150
@@ -493,50 +479,28 @@ def draw_recording_stage():
 		pressed_colors = [mint_green, light_yellow, light_blue]
 		playback_colors = [t if b else f for b, t, f in zip(playback_button_states, pressed_colors, unpressed_colors)]
 		letters = ["A", "B", "C"]
-		pygame.draw.circle(render_surface, playback_colors[i], (section_x, circle_y), 25)
-		letter_surf = letter_font.render(letters[i], True, black)
-		letter_rect = letter_surf.get_rect(center=(section_x, circle_y-2))
-		render_surface.blit(letter_surf, letter_rect)
+		draw_letter_button(("button", i), section_x, circle_y, playback_colors[i], letters[i])
 
 	# Bottom-center control hint
-	hint_surf = hint_font.render(hint_text, True, white)
-	hint_rect = hint_surf.get_rect(
-		center=(render_surface.get_width() // 2, render_surface.get_height() - 30)
-	)
-	render_surface.blit(hint_surf, hint_rect)
+	hint_surf = text_cache.render(hint_text, 20, white, language)
+	ui.blit("hint", hint_surf, center=(render_surface.get_width() // 2, render_surface.get_height() - 30))
 
 	# Final display
-	screen.blit(render_surface, (0, 0))
-	if not joystick_connected:
-		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
-  
-	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	draw_chrome()
+	present()
 
 def draw_live_mode():
 	global lock_button_held, release_button_held, playback_button_states
-	render_surface.fill(black)
-
-	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	title_font = pygame.font.Font(font_path, 30)
-	letter_font = pygame.font.Font(font_path, 36)
-	hint_font = pygame.font.Font(font_path, 20)
-	button_font = pygame.font.Font(font_path, 40)
-	label_font = pygame.font.Font(font_path, 22)
+	ui.begin(SCENE_LIVE_MODE)
 
 	# Watermark background: "LIVE\nMODE"
-	watermark_font = pygame.font.Font(font_path, 150)  # Large font size
 	watermark_color = (40, 40, 40)  # Very low brightness gray
 
-	live_surf = watermark_font.render("LIVE", True, watermark_color)
-	mode_surf = watermark_font.render("MODE", True, watermark_color)
-
-	live_rect = live_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() // 2 - 90))
-	mode_rect = mode_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() // 2 + 70))
+	live_surf = text_cache.render("LIVE", 150, watermark_color, language)
+	mode_surf = text_cache.render("MODE", 150, watermark_color, language)
 
-	render_surface.blit(live_surf, live_rect)
-	render_surface.blit(mode_surf, mode_rect)
+	ui.blit("watermark_live", live_surf, center=(render_surface.get_width() // 2, render_surface.get_height() // 2 - 90))
+	ui.blit("watermark_mode", mode_surf, center=(render_surface.get_width() // 2, render_surface.get_height() // 2 + 70))
 
 	# Text by language
 	if language == "en":
@@ -567,24 +531,15 @@ def draw_live_mode():
 	release_x = (center_x + spacing) - shift_amount
 	capsule_width, capsule_height = 100, 50
 
-	def draw_pill(surface, x, y, w, h, color, text):
-		radius = h // 2
-		pygame.draw.circle(surface, color, (x + radius, y + radius), radius)
-		pygame.draw.circle(surface, color, (x + w - radius, y + radius), radius)
-		pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
-		text_surf = button_font.render(text, True, white)
-		text_rect = text_surf.get_rect(center=(x + w//2, y + h//2 - 2))
-		surface.blit(text_surf, text_rect)
-
 	# Lock/Release Labels
-	lock_label = button_font.render(lock_text, True, lock_text_color)
-	release_label = button_font.render(release_text, True, release_text_color)
-	render_surface.blit(lock_label, (lock_x - lock_label.get_width()//2 + capsule_width//2, 25))
-	render_surface.blit(release_label, (release_x - release_label.get_width()//2 + capsule_width//2, 25))
+	lock_label = text_cache.render(lock_text, 40, lock_text_color, language)
+	release_label = text_cache.render(release_text, 40, release_text_color, language)
+	ui.blit("lock_label", lock_label, topleft=(lock_x - lock_label.get_width()//2 + capsule_width//2, 25))
+	ui.blit("release_label", release_label, topleft=(release_x - release_label.get_width()//2 + capsule_width//2, 25))
 
 	# Pills
-	draw_pill(render_surface, lock_x, mid_y, capsule_width, capsule_height, lock_color, "L")
-	draw_pill(render_surface, release_x, mid_y, capsule_width, capsule_height, release_color, "R")
+	draw_pill("lock_pill", lock_x, mid_y, capsule_width, capsule_height, lock_color, "L")
+	draw_pill("release_pill", release_x, mid_y, capsule_width, capsule_height, release_color, "R")
 
 	# Playback buttons A/B/C
 	section_spacing = 140
@@ -599,27 +554,19 @@ def draw_live_mode():
 		x = center_x + (i - 1) * section_spacing
 
 		# Playback labels above buttons
-		label_surf = label_font.render(playback_labels[i], True, white)
-		label_rect = label_surf.get_rect(center=(x, base_y))
-		render_surface.blit(label_surf, label_rect)
+		label_surf = text_cache.render(playback_labels[i], 22, white, language)
+		ui.blit(("label", i), label_surf, center=(x, base_y))
 
 		# Circle button with A/B/C
-		pygame.draw.circle(render_surface, playback_colors[i], (x, circle_y), 25)
-		letter_surf = letter_font.render(letters[i], True, black)
-		letter_rect = letter_surf.get_rect(center=(x, circle_y - 2))
-		render_surface.blit(letter_surf, letter_rect)
+		draw_letter_button(("button", i), x, circle_y, playback_colors[i], letters[i])
 
 	# Bottom hint
-	hint_surf = hint_font.render(hint_text, True, white)
-	hint_rect = hint_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() - 30))
-	render_surface.blit(hint_surf, hint_rect)
+	hint_surf = text_cache.render(hint_text, 20, white, language)
+	ui.blit("hint", hint_surf, center=(render_surface.get_width() // 2, render_surface.get_height() - 30))
 
 	# Final display
-	screen.blit(render_surface, (0, 0))
-	if not joystick_connected:
-		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
-	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	draw_chrome()
+	present()
 
 #--------------------------------------------------------------------
 #----Main Code
@@ -627,6 +574,7 @@ def draw_live_mode():
 
 # Developer Mode
 DEVELOPER_MODE = False
+SHOW_FRAME_TIME = False  # Draw the average frame draw time on screen
 
 # Scene Vars
 SCENE_LANGUAGE_SELECT = "language_select"
@@ -703,21 +651,39 @@ playback_button_states = [False, False, False]
 #----Start of Code
 
 # Initialize Arms and packetHandlers
+startup_time = time.monotonic()
 if not DEVELOPER_MODE:
-	RIGHTARM_PORT_NAME, LEFTARM_PORT_NAME = detect_arm_ports()
-	# Right Arm has 9 Motors, Left has 8 Motors. Create and Test in one line below
-	RightArm = arm if (arm := Arm_Utils.RoboticArm(RIGHTARM_PORT_NAME, [1,2,3,4,5,6,7,8,9])).open_port() else None
-	LeftArm = arm if (arm := Arm_Utils.RoboticArm(LEFTARM_PORT_NAME, [11,12,13,14,15,16,17,18])).open_port() else None
+	RIGHTARM_PORT_NAME, LEFTARM_PORT_NAME, discovered_ids = detect_arm_ports()
+	# Right Arm has 9 Motors, Left has 8 Motors. Both are opened in parallel
+	RightArm, LeftArm = Arm_Utils.bring_up_arms(
+		[(RIGHTARM_PORT_NAME, [1,2,3,4,5,6,7,8,9]), (LEFTARM_PORT_NAME, [11,12,13,14,15,16,17,18])],
+		discovered_ids)
+	print(f"[OK] Arms ready in {time.monotonic() - startup_time:.2f}s")
+
+# One telemetry poller per arm (Right, Left) feeds the motor-readings screens
+arm_telemetry = [Arm_Utils.ArmTelemetry(arm).start() if arm else None for arm in (RightArm, LeftArm)]
+
+# Preload the recorded A/B/C motions so a selection starts moving immediately
+motion_library = Arm_Utils.MotionLibrary({'R': RightArm, 'L': LeftArm})
+motion_library.load_all()
+multi_arm_player = Arm_Utils.MultiArmPlayer()
+ANIMATION_SPEED = 1.0  # >1 shortens recorded motions for quicker responses
 
 # Initialize Pygame
 pygame.init()
 
+# Fonts are loaded once per size and text surfaces are reused across frames
+fonts = UI_Utils.FontRegistry()
+text_cache = UI_Utils.TextCache(fonts)
+frame_timer = UI_Utils.FrameTimer()
+
 #Create Display
 info = pygame.display.Info()
 screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
 pygame.display.set_caption("Augmented Arms")
 clock = pygame.time.Clock()
 render_surface = pygame.Surface((480, 320))
+ui = UI_Utils.RetainedRenderer(render_surface, screen)
 
 #Init Joysticks
 if pygame.joystick.get_count() > 0:
@@ -742,6 +708,8 @@ if m5_port is None:
 else:
 	print(f"[OK] M5 port found: {m5_port}")
 
+print(f"[OK] Startup complete in {time.monotonic() - startup_time:.2f}s")
+
 # ---- MAIN LOOP ----
 while True:
 	for event in pygame.event.get():
@@ -1055,6 +1023,7 @@ while True:
 		send_m5("SCAN_END")
 
 	# --- Scene drawing ---
+	frame_timer.begin()
 	if current_scene == SCENE_LANGUAGE_SELECT:
 		draw_language_selection()
 	elif current_scene == SCENE_MOTOR_READINGS:
@@ -1066,4 +1035,6 @@ while True:
 	elif current_scene == SCENE_LIVE_MODE:
 		draw_live_mode()
 
+	frame_timer.end()
+
 	clock.tick(30)
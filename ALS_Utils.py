@@ -12,6 +12,7 @@ class PiezoSensor:
 		self.pin = pin
 		self._tap_flag = False
 		self._flag_lock = threading.Lock()
+		self._listeners = []
 		GPIO.setup(self.pin, GPIO.IN)
 		# Sensor idles LOW and pulses HIGH on a tap; GPIO's own bouncetime
 		# debounce handles the ringing, same as the known-working standalone test.
@@ -20,6 +21,12 @@ class PiezoSensor:
 	def _handle_tap(self, channel):
 		with self._flag_lock:
 			self._tap_flag = True
+		for callback in self._listeners:
+			callback()
+
+	def add_listener(self, callback):
+		"""Call callback() from the GPIO thread on every tap (e.g. to wake a sleeping loop)"""
+		self._listeners.append(callback)
 
 	def is_pressed(self):
 		"""Returns True if currently pressed"""
@@ -1,10 +1,430 @@
 import time
 import os
 import csv
+import struct
 import threading
 import logging
+from collections import namedtuple
 from dynamixel_sdk import *
 
+#-----------------------------------------------------------------------
+#----Motion clips
+#-----------------------------------------------------------------------
+def goal_position_bytes(position_value):
+	"""4-byte little-endian Goal Position parameter (same layout as DXL_LO/HIBYTE)."""
+	return list(struct.pack('<I', int(position_value) & 0xFFFFFFFF))
+
+def _signed(value, length):
+	bits = 8 * length
+	return value - (1 << bits) if value >= 1 << (bits - 1) else value
+
+def _parse_position(position):
+	# Older recordings hold negative extended positions as unsigned 32-bit values
+	return _signed(int(position) & 0xFFFFFFFF, 4)
+
+class MotionClip:
+	"""
+	A recorded movement parsed once into integer frames, with the sync-write
+	parameter block of every frame pre-serialized so playback only transmits.
+
+	Recordings start with a "t,<id>,<id>..." header and carry a timestamp
+	(seconds) per row. Headerless legacy files are assumed to be sampled at
+	`frequency`.
+	"""
+
+	TIME_COLUMN = 't'
+
+	def __init__(self, frames, dxl_ids, frequency=30, source=None, timestamps=None):
+		self.frames = frames            # list of tuples, one position per motor
+		self.dxl_ids = list(dxl_ids)
+		self.frequency = frequency
+		self.source = source
+		self.uniform = timestamps is None  # Frames exactly 1/frequency apart
+		if timestamps is None:
+			timestamps = [i / frequency for i in range(len(frames))]
+		self.timestamps = timestamps    # seconds from the first frame
+		self._payloads = {}             # excluded-ids tuple -> per-frame params
+		self._retimed = {}              # (rate_hz, speed) -> MotionClip
+
+	@classmethod
+	def from_csv(cls, filepath, dxl_ids, frequency=30):
+		frames, timestamps = [], []
+		columns = None                  # header column per dxl_id, [] for legacy files
+		with open(filepath, mode='r', newline='') as file:
+			for line_number, row in enumerate(csv.reader(file), start=1):
+				if not row:
+					continue
+				if columns is None:
+					if row[0] == cls.TIME_COLUMN:
+						header_ids = [int(dxl_id) for dxl_id in row[1:]]
+						if sorted(header_ids) != sorted(dxl_ids):
+							raise ValueError(f"{filepath}: recorded IDs {header_ids} do not match {list(dxl_ids)}")
+						columns = [header_ids.index(dxl_id) + 1 for dxl_id in dxl_ids]
+						continue
+					columns = []
+				if columns:
+					if len(row) != len(dxl_ids) + 1:
+						raise ValueError(f"{filepath}:{line_number}: expected {len(dxl_ids) + 1} "
+										 f"values, got {len(row)}")
+					timestamps.append(float(row[0]))
+					frames.append(tuple(_parse_position(row[c]) for c in columns))
+				else:
+					if len(row) != len(dxl_ids):
+						raise ValueError(f"{filepath}:{line_number}: expected {len(dxl_ids)} "
+										 f"positions, got {len(row)}")
+					frames.append(tuple(_parse_position(position) for position in row))
+
+		if not columns:
+			return cls(frames, dxl_ids, frequency, source=filepath)
+		origin = timestamps[0] if timestamps else 0.0
+		timestamps = [t - origin for t in timestamps]
+		if len(timestamps) > 1 and timestamps[-1] > 0:
+			frequency = (len(timestamps) - 1) / timestamps[-1]
+		return cls(frames, dxl_ids, frequency, source=filepath, timestamps=timestamps)
+
+	@property
+	def frame_count(self):
+		return len(self.frames)
+
+	@property
+	def duration(self):
+		if not self.timestamps:
+			return 0.0
+		return self.timestamps[-1] + 1.0 / self.frequency
+
+	def resample(self, rate_hz):
+		"""Copy of the clip linearly interpolated onto a uniform `rate_hz` grid."""
+		if self.frame_count < 2:
+			return MotionClip(list(self.frames), self.dxl_ids, rate_hz, self.source)
+		timestamps = self.timestamps
+		end = timestamps[-1]
+		frames = []
+		j = 0
+		for n in range(int(end * rate_hz + 1e-9) + 1):
+			t = n / rate_hz
+			while j < self.frame_count - 2 and timestamps[j + 1] <= t:
+				j += 1
+			t0, t1 = timestamps[j], timestamps[j + 1]
+			a = min(max((t - t0) / (t1 - t0), 0.0), 1.0) if t1 > t0 else 1.0
+			frames.append(tuple(int(round(p0 + (p1 - p0) * a))
+								for p0, p1 in zip(self.frames[j], self.frames[j + 1])))
+		# The grid usually stops short of the last recorded frame; always end on the final pose
+		if (len(frames) - 1) / rate_hz < end - 1e-9:
+			frames.append(self.frames[-1])
+		return MotionClip(frames, self.dxl_ids, rate_hz, self.source)
+
+	def retimed(self, rate_hz=None, speed=1.0):
+		"""
+		Clip for playback at `rate_hz` output frames per second (default: the
+		recording's own rate), `speed` times faster than recorded. Cached, so
+		its payloads are only packed once.
+		"""
+		if rate_hz is None:
+			rate_hz = self.frequency
+		# A uniformly sampled clip played as recorded needs no resampling
+		if self.uniform and speed == 1.0 and rate_hz == self.frequency:
+			return self
+		key = (rate_hz, speed)
+		clip = self._retimed.get(key)
+		if clip is None:
+			# Sampling the recording every speed/rate seconds gives one frame per output tick
+			frames = self.resample(rate_hz / speed).frames
+			clip = MotionClip(frames, self.dxl_ids, rate_hz, self.source)
+			self._retimed[key] = clip
+		return clip
+
+	def payloads(self, exclude=()):
+		"""Per-frame sync-write params ([id, b0..b3, id, ...]) skipping excluded motors."""
+		key = tuple(sorted(exclude))
+		payloads = self._payloads.get(key)
+		if payloads is None:
+			columns = [(i, dxl_id) for i, dxl_id in enumerate(self.dxl_ids) if dxl_id not in key]
+			payloads = []
+			for frame in self.frames:
+				param = []
+				for i, dxl_id in columns:
+					param.append(dxl_id)
+					param.extend(goal_position_bytes(frame[i]))
+				payloads.append(param)
+			self._payloads[key] = payloads
+		return payloads
+
+# Parsed clips: (path, dxl_ids, frequency) -> (mtime, MotionClip)
+_motion_clip_cache = {}
+_motion_clip_cache_lock = threading.Lock()
+
+def load_motion_clip(filepath, dxl_ids, frequency=30):
+	"""Load a clip, reusing the parsed copy until the file changes on disk."""
+	key = (os.path.abspath(filepath), tuple(dxl_ids), frequency)
+	mtime = os.path.getmtime(filepath)
+	with _motion_clip_cache_lock:
+		cached = _motion_clip_cache.get(key)
+		if cached is not None and cached[0] == mtime:
+			return cached[1]
+	clip = MotionClip.from_csv(filepath, dxl_ids, frequency)
+	with _motion_clip_cache_lock:
+		_motion_clip_cache[key] = (mtime, clip)
+	return clip
+
+#-----------------------------------------------------------------------
+#----Discovery and bring-up
+#-----------------------------------------------------------------------
+def broadcast_ping(port_handler, packet_handler, expected_ids, id_sets=None):
+	"""
+	Protocol 2.0 broadcast ping returning the IDs that answered. Unlike the
+	SDK's broadcastPing, which always waits for all 252 possible replies
+	(~0.8 s at 1 Mbps), it only waits long enough for IDs up to
+	max(expected_ids) and returns as soon as every expected ID has replied.
+	`id_sets` (alternative groups within expected_ids, e.g. the ID lists of
+	the arms that may be on this port) returns as soon as any one group is
+	complete instead.
+	"""
+	status_length = 14
+	max_id = max(expected_ids)
+	groups = [set(ids) for ids in id_sets] if id_sets else [set(expected_ids)]
+	txpacket = [0] * 10
+	txpacket[PKT_ID] = BROADCAST_ID
+	txpacket[PKT_LENGTH_L] = 3
+	txpacket[PKT_LENGTH_H] = 0
+	txpacket[PKT_INSTRUCTION] = INST_PING
+	if packet_handler.txPacket(port_handler, txpacket) != COMM_SUCCESS:
+		port_handler.is_using = False
+		return []
+
+	# Motors reply in ID order, each after its own return delay
+	tx_time_per_byte = (1000.0 / port_handler.getBaudRate()) * 10.0
+	port_handler.setPacketTimeoutMillis(status_length * max_id * tx_time_per_byte + 3.0 * max_id + 16.0)
+	rxpacket = []
+	wait_length = status_length * len(expected_ids)
+	found = set()
+	idx = 0
+	while True:
+		rxpacket += port_handler.readPort(wait_length - len(rxpacket))
+		# Status packets are parsed as they arrive so a complete group ends the wait
+		while idx + status_length <= len(rxpacket):
+			packet = rxpacket[idx:idx + status_length]
+			if packet[:3] == [0xFF, 0xFF, 0xFD] and \
+					packet_handler.updateCRC(0, packet, status_length - 2) == DXL_MAKEWORD(packet[-2], packet[-1]):
+				found.add(packet[PKT_ID])
+				idx += status_length
+			else:
+				idx += 1
+		if any(group <= found for group in groups) or len(rxpacket) >= wait_length \
+				or port_handler.isPacketTimeout():
+			break
+	port_handler.is_using = False
+	return sorted(found)
+
+def probe_port(device_name, expected_ids, baudrate=1000000, protocol_version=2.0, id_sets=None):
+	"""Open `device_name`, broadcast-ping it and close it again; returns the responding IDs."""
+	port_handler = PortHandler(device_name)
+	try:
+		if not port_handler.openPort():
+			return []
+	except Exception as e:
+		logging.error(f"{device_name}: Cannot open port: {e}")
+		return []
+	try:
+		if not port_handler.setBaudRate(baudrate):
+			return []
+		return broadcast_ping(port_handler, PacketHandler(protocol_version), expected_ids, id_sets)
+	except Exception as e:
+		logging.error(f"{device_name}: Probe failed: {e}")
+		return []
+	finally:
+		port_handler.closePort()
+
+def _run_parallel(targets):
+	"""Run callables on one thread each and return their results in order."""
+	results = [None] * len(targets)
+	def worker(i, target):
+		results[i] = target()
+	threads = [threading.Thread(target=worker, args=(i, target), daemon=True)
+			   for i, target in enumerate(targets)]
+	for thread in threads:
+		thread.start()
+	for thread in threads:
+		thread.join()
+	return results
+
+def probe_ports(device_names, id_sets):
+	"""
+	Probe every port concurrently; returns {device_name: [responding IDs]}.
+	`id_sets` holds the ID list of each arm that may be on any of the ports;
+	a port's probe ends as soon as one arm's IDs have all replied.
+	"""
+	expected_ids = sorted({dxl_id for ids in id_sets for dxl_id in ids})
+	results = _run_parallel([
+		lambda name=name: probe_port(name, expected_ids, id_sets=id_sets) for name in device_names])
+	return dict(zip(device_names, results))
+
+def bring_up_arms(specs, discovered=None):
+	"""
+	Open several arms concurrently, one thread per port. `specs` is a list of
+	(device_name, dxl_ids); `discovered` ({device_name: ids} from probe_ports)
+	skips the discovery ping. Returns a RoboticArm or None per spec.
+	"""
+	discovered = discovered or {}
+	def open_arm(device_name, dxl_ids):
+		arm = RoboticArm(device_name, dxl_ids)
+		return arm if arm.open_port(known_ids=discovered.get(device_name)) else None
+	return _run_parallel([
+		lambda spec=spec: open_arm(*spec) for spec in specs])
+
+def recorded_movement_path(filename):
+	return os.path.join(os.getcwd(), "Recorded_movements", filename)
+
+class MotionLibrary:
+	"""
+	In-memory set of the recorded Motion{slot}{side}.csv clips, loaded and
+	validated up front so a selection can start playing without touching disk.
+
+	`arms` maps a side letter ('R' / 'L') to its RoboticArm (or None).
+	"""
+
+	def __init__(self, arms, slots=(1, 2, 3), frequency=30):
+		self.arms = arms
+		self.slots = tuple(slots)
+		self.frequency = frequency
+		self.clips = {}                 # (slot, side) -> MotionClip or None
+		self.lock = threading.Lock()
+
+	@staticmethod
+	def filename(slot, side):
+		return f"Motion{slot}{side}.csv"
+
+	def load_all(self):
+		for slot in self.slots:
+			self.load_slot(slot)
+
+	def load_slot(self, slot):
+		for side, arm in self.arms.items():
+			clip = None
+			filepath = recorded_movement_path(self.filename(slot, side))
+			if arm and os.path.exists(filepath):
+				try:
+					clip = load_motion_clip(filepath, arm.dxl_ids, self.frequency)
+					if clip.frame_count == 0:
+						logging.warning(f"{filepath}: Empty recording, ignored.")
+						clip = None
+					else:
+						# Retime and pack the frames for the arm's current motor set now, not on tap
+						clip.retimed().payloads(exclude=arm.faulty_motors)
+						logging.info(f"{filepath}: {clip.frame_count} frames, {clip.duration:.2f}s.")
+				except (OSError, ValueError) as e:
+					logging.error(f"{filepath}: Cannot load recording: {e}")
+					clip = None
+			with self.lock:
+				self.clips[(slot, side)] = clip
+
+	def reload_after_recording(self, slot):
+		"""Reload `slot` in the background once every arm has flushed its recording."""
+		def worker():
+			for arm in self.arms.values():
+				if arm:
+					arm.wait_for_recording()
+			self.load_slot(slot)
+		threading.Thread(target=worker, daemon=True).start()
+
+	def get(self, slot, side):
+		with self.lock:
+			return self.clips.get((slot, side))
+
+	def info(self):
+		"""(slot, side) -> (frame_count, duration) for every loaded clip."""
+		with self.lock:
+			return {key: (clip.frame_count, clip.duration)
+					for key, clip in self.clips.items() if clip is not None}
+
+class SharedTimeline:
+	"""
+	One monotonic clock origin shared by several arm playback threads. The
+	origin is fixed only once every thread has prepared its clip, so all arms
+	send frame N against the same deadline.
+	"""
+
+	def __init__(self, parties, lead_time=0.02, timeout=1.0):
+		self.lead_time = lead_time
+		self.timeout = timeout
+		self.start_time = None
+		self.barrier = threading.Barrier(parties, action=self._set_start)
+
+	def _set_start(self):
+		self.start_time = time.monotonic() + self.lead_time
+
+	def wait_start(self):
+		try:
+			self.barrier.wait(self.timeout)
+			return self.start_time
+		except threading.BrokenBarrierError:
+			logging.warning("Shared timeline broken, starting unsynchronized.")
+			return time.monotonic()
+
+	def abort(self):
+		# Releases arms already waiting when one of them cannot start
+		self.barrier.abort()
+
+class MultiArmPlayer:
+	"""Starts clips on several arms on one SharedTimeline and reports their drift."""
+
+	def __init__(self, lead_time=0.02):
+		self.lead_time = lead_time
+		self.last_stats = None
+
+	def play(self, assignments, speed=1.0):
+		"""Play [(arm, clip), ...]; returns the arms that actually started."""
+		assignments = [(arm, clip) for arm, clip in assignments if arm and clip]
+		if not assignments:
+			return []
+		timeline = SharedTimeline(len(assignments), self.lead_time)
+		started = []
+		for arm, clip in assignments:
+			if arm.play_positions(clip=clip, timeline=timeline, speed=speed):
+				started.append(arm)
+			else:
+				timeline.abort()
+		return started
+
+	def wait(self, arms):
+		for arm in arms:
+			arm.task_done_event.wait()
+		self.last_stats = self.drift_stats(arms)
+		if self.last_stats:
+			logging.info(f"Multi-arm playback: {self.last_stats}")
+		return self.last_stats
+
+	# Frames sent later than this after their deadline count as late
+	LATE_THRESHOLD = 0.005
+
+	@classmethod
+	def drift_stats(cls, arms):
+		"""Per-arm lateness and cross-arm spread (seconds) of each frame's send time."""
+		lateness = {arm.device_name: arm.frame_lateness for arm in arms}
+		if not lateness:
+			return None
+		stats = {}
+		for name, values in lateness.items():
+			sent = [v for v in values if v is not None]
+			stats[name] = {
+				'frames': len(sent),
+				'late_frames': sum(1 for v in sent if v > cls.LATE_THRESHOLD),
+				'max_lateness': max(sent, default=0.0),
+				'mean_lateness': sum(sent) / len(sent) if sent else 0.0}
+		spreads = []
+		for frame in zip(*lateness.values()):
+			sent = [v for v in frame if v is not None]
+			if len(sent) > 1:
+				spreads.append(max(sent) - min(sent))
+		stats['max_drift'] = max(spreads, default=0.0)
+		stats['mean_drift'] = sum(spreads) / len(spreads) if spreads else 0.0
+		return stats
+
+# One read of every motor's state. The dicts map motor ID -> value and are
+# never modified after the snapshot is published; fields the bus could not
+# provide are None.
+ArmState = namedtuple('ArmState', ['timestamp', 'positions', 'velocities', 'loads',
+								   'temperatures', 'torque', 'hardware_errors'])
+
 class RoboticArm:
 	#-----------------------------------------------------------------------
 	#----Dynamixel control constants
@@ -22,6 +442,10 @@ class RoboticArm:
 	ADDR_PRO_PROFILE_ACCELERATION_LEN = 4
 	ADDR_PRO_PROFILE_VELOCITY = 112
 	ADDR_PRO_PROFILE_VELOCITY_LEN = 4
+	ADDR_PRO_TORQUE_ENABLE_LEN = 1
+	# Acceleration (108), Velocity (112) and Goal Position (116) are contiguous
+	ADDR_PRO_MOTION_BLOCK = 108
+	ADDR_PRO_MOTION_BLOCK_LEN = 12
 	OP_MODE_ADDR = 11
 	EXTENDED_POSITION_CONTROL_MODE = 4
 	ADDR_PRO_HARDWARE_ERROR_STATUS = 70  # Hardware-error status address
@@ -37,6 +461,27 @@ class RoboticArm:
 	LIGHT_FINGER_DXL_ID = 10
 	ADDR_INDIRECT_DATA1 = 224
 
+	#State read: (field, source address, length). Mirrored through indirect
+	#slots starting at STATE_INDIRECT_SLOT (slot 1 is the light finger) so one
+	#sync read returns all of it; otherwise torque..hardware error and present
+	#load..temperature are read as two direct blocks. X-series motors have 20 indirect slots
+	#(addresses 168-207, data 224-243).
+	ADDR_INDIRECT_ADDRESS1 = 168
+	INDIRECT_SLOTS = 20
+	STATE_INDIRECT_SLOT = 2
+	STATE_ITEMS = (
+		('hardware_errors', 70, 1),
+		('torque', 64, 1),
+		('temperatures', 146, 1),
+		('loads', 126, 2),
+		('velocities', 128, 4),
+		('positions', 132, 4))
+	STATE_BYTES = sum(length for _, _, length in STATE_ITEMS)
+	assert STATE_INDIRECT_SLOT - 1 + STATE_BYTES <= INDIRECT_SLOTS, \
+		"STATE_ITEMS do not fit in the indirect slots after STATE_INDIRECT_SLOT"
+	ADDR_PRO_PRESENT_LOAD = 126
+	ADDR_PRO_PRESENT_TEMPERATURE = 146
+
 	def __init__(self, device_name, dxl_ids, is_admin=False):
 		self.device_name = device_name
 		self.dxl_ids = dxl_ids
@@ -48,7 +493,6 @@ class RoboticArm:
 		self.condition = threading.Condition()
 		self.is_admin = is_admin
 		self.task_running = False
-		self.ping_thread_running = False
 		self.current_positions = {}
 		self.lock = threading.RLock()
 		self.task_done_event = threading.Event()
@@ -64,39 +508,50 @@ class RoboticArm:
 		self.last_positions = {}       # motor_id -> last goal sent
 		self.realtime_thread = None
 		self.realtime_thread_stop_event = threading.Event()
+		self.realtime_targets = {}     # motor_id -> absolute goal waiting to be sent
+		self.realtime_mailbox_lock = threading.Lock()
+		self.realtime_sync_write = None
+		self.realtime_stats = self._new_realtime_stats()
 		self.updated_motor_ids = []
+		self.frame_lateness = []       # Send time minus deadline per frame of last playback
+		self.playback_stats = {}       # Sent/skipped frames and deadline misses of last playback
+		self.write_latency = {}        # bulk op -> {'calls', 'last', 'max'} seconds
+		self.state = None              # Latest ArmState snapshot
+		self.state_reader = None       # Persistent GroupSyncReads, built in open_port
+		self.state_layout = {}         # field -> (address, length) inside the read
+		self.state_ids = list(self.dxl_ids)  # Motors included in the state read
 	
-	def open_port(self):
+	def open_port(self, known_ids=None):
+		# `known_ids`: IDs already discovered on this port, skips the discovery ping
 		with self.lock:
 			if self.portHandler.openPort():
 				logging.info(f"{self.device_name}: Port opened successfully.")
 				if self.portHandler.setBaudRate(self.BAUDRATE):
 					logging.info(f"{self.device_name}: Baud rate set.")
 
-					successful_motors = 0  # Track how many motors responded
-
+					if known_ids is None:
+						known_ids = broadcast_ping(self.portHandler, self.packetHandler, self.dxl_ids)
+					present = [dxl_id for dxl_id in self.dxl_ids if dxl_id in known_ids]
 					for dxl_id in self.dxl_ids:
-						dxl_comm_result, dxl_error = self.packetHandler.write1ByteTxRx(
-							self.portHandler, dxl_id, self.OP_MODE_ADDR,
-							self.EXTENDED_POSITION_CONTROL_MODE)
-
-						if dxl_comm_result == self.COMM_SUCCESS and dxl_error == 0:
-							successful_motors += 1
-
-						if dxl_comm_result != self.COMM_SUCCESS or dxl_error != 0:
-							logging.error(f"{self.device_name} ID {dxl_id}: "
-										  "Failed to set operating mode.")
-							continue
+						if dxl_id not in present:
+							logging.error(f"{self.device_name} ID {dxl_id}: No response.")
 
 					# Driver connected, but no motors
-					if successful_motors == 0:
+					if not present:
 						logging.error(f"{self.device_name}: No motors responded. Closing port.")
 						self.portHandler.closePort()
 						return False
 
+					# Operating mode for every motor in one packet
+					self._sync_write(
+						'operating mode', self.OP_MODE_ADDR, 1,
+						{dxl_id: [self.EXTENDED_POSITION_CONTROL_MODE] for dxl_id in present})
+
 					self.port_is_open = True
 					# Initialize torque-status cache
-					self.update_torque_status()
+					self.update_torque_status(present)
+					self.state_ids = present
+					self.configure_state_reader()
 					return True
 				else:
 					logging.error(f"{self.device_name}: Failed to set baud rate.")
@@ -109,7 +564,7 @@ class RoboticArm:
 	def close_port(self):
 		with self.lock:
 			if self.port_is_open:
-				self.enable_torque(False)
+				self.enable_all_motor_torque(False)
 				self.portHandler.closePort()
 				self.port_is_open = False
 				logging.info(f"{self.device_name}: Port closed.")
@@ -132,6 +587,13 @@ class RoboticArm:
 				except Exception as e:
 					logging.error(f"{self.device_name} ID {dxl_id}: Exception during ping: {e}")
 			return successful_ids
+
+	def broadcast_ping_motors(self):
+		"""Responding IDs from one broadcast ping (a single short bus transaction)."""
+		with self.lock:
+			if not self.port_is_open:
+				return []
+			return broadcast_ping(self.portHandler, self.packetHandler, self.dxl_ids)
 	
 	#-----------------------------------------------------------------------
 	#----Positions Functions
@@ -173,43 +635,151 @@ class RoboticArm:
 			logging.warning(f"{self.device_name}: Port not open.")
 			return self.current_positions
 		try:
-			with self.lock:
-				groupSyncRead = GroupSyncRead(
-					self.portHandler, self.packetHandler,
-					self.ADDR_PRO_PRESENT_POSITION,
-					self.ADDR_PRO_PRESENT_POSITION_LEN)
-				for dxl_id in self.dxl_ids:
-					groupSyncRead.addParam(dxl_id)
-				dxl_comm_result = groupSyncRead.txRxPacket()
-				if dxl_comm_result != self.COMM_SUCCESS:
-					logging.error(f"{self.device_name}: Failed to read positions: "
-								  f"{self.packetHandler.getTxRxResult(dxl_comm_result)}")
-					return self.current_positions
-				for dxl_id in self.dxl_ids:
-					if not groupSyncRead.isAvailable(
-							dxl_id,
-							self.ADDR_PRO_PRESENT_POSITION,
-							self.ADDR_PRO_PRESENT_POSITION_LEN):
-						logging.error(f"{self.device_name} ID {dxl_id}: Data not available.")
-						continue
-					position = groupSyncRead.getData(
-						dxl_id, self.ADDR_PRO_PRESENT_POSITION,
-						self.ADDR_PRO_PRESENT_POSITION_LEN)
-					if position is not None:
-						self.current_positions[dxl_id] = position
-					else:
-						logging.error(f"{self.device_name} ID {dxl_id}: Failed to get data.")
-				groupSyncRead.clearParam()
+			state = self.read_state()
+			if state is not None:
+				self.current_positions.update(state.positions)
 		except Exception as e:
 			logging.exception(f"{self.device_name}: Exception in get_current_positions: {e}")
 		return self.current_positions
 
+	#-----------------------------------------------------------------------
+	#----State reads
+	#-----------------------------------------------------------------------
+	def configure_state_reader(self):
+		"""Build the persistent state reader, mapping STATE_ITEMS through indirect addresses if possible."""
+		with self.lock:
+			slot_offset = self.STATE_INDIRECT_SLOT - 1
+			address_start = self.ADDR_INDIRECT_ADDRESS1 + 2 * slot_offset
+			data_start = self.ADDR_INDIRECT_DATA1 + slot_offset
+			source_addresses = [address + i for _, address, length in self.STATE_ITEMS for i in range(length)]
+
+			if self._map_indirect(address_start, source_addresses):
+				layout, offset = {}, data_start
+				for field, _, length in self.STATE_ITEMS:
+					layout[field] = (offset, length)
+					offset += length
+				self._build_state_reader([(data_start, len(source_addresses), layout)])
+				logging.info(f"{self.device_name}: State read via indirect addresses.")
+			else:
+				# Two direct blocks: torque..hardware error status, present load..temperature
+				status_items = [item for item in self.STATE_ITEMS if item[1] < self.ADDR_PRO_PRESENT_LOAD]
+				status_start = min(address for _, address, _ in status_items)
+				status_end = max(address + length for _, address, length in status_items)
+				present_layout = {field: (address, length) for field, address, length in self.STATE_ITEMS
+								  if self.ADDR_PRO_PRESENT_LOAD <= address <= self.ADDR_PRO_PRESENT_TEMPERATURE}
+				self._build_state_reader([
+					(self.ADDR_PRO_PRESENT_LOAD,
+					 self.ADDR_PRO_PRESENT_TEMPERATURE + 1 - self.ADDR_PRO_PRESENT_LOAD, present_layout),
+					(status_start, status_end - status_start,
+					 {field: (address, length) for field, address, length in status_items})])
+				logging.warning(f"{self.device_name}: Indirect mapping unavailable, "
+								"reading state as two direct blocks.")
+
+	def _map_indirect(self, address_start, source_addresses):
+		"""Point consecutive indirect addresses at `source_addresses` on every motor and verify."""
+		param = []
+		for address in source_addresses:
+			param.extend([DXL_LOBYTE(address), DXL_HIBYTE(address)])
+		length = len(param)
+		if not self._sync_write('indirect', address_start, length,
+								{dxl_id: param for dxl_id in self.state_ids}):
+			return False
+
+		groupSyncRead = GroupSyncRead(self.portHandler, self.packetHandler, address_start, length)
+		for dxl_id in self.state_ids:
+			groupSyncRead.addParam(dxl_id)
+		if groupSyncRead.txRxPacket() != self.COMM_SUCCESS:
+			return False
+		for dxl_id in self.state_ids:
+			for i, address in enumerate(source_addresses):
+				if groupSyncRead.getData(dxl_id, address_start + 2 * i, 2) != address:
+					return False
+		return True
+
+	def _build_state_reader(self, blocks):
+		# blocks: [(start address, length, {field: (address, length)})], one sync read each
+		self.state_read_blocks = blocks
+		self.state_layout = {field: item for _, _, layout in blocks for field, item in layout.items()}
+		self.state_reader = None
+		self.set_state_ids(self.state_ids)
+
+	def new_state_reader(self, dxl_ids):
+		"""GroupSyncReads of the state blocks for `dxl_ids`, or None before open_port configured them."""
+		with self.lock:
+			if not self.state_layout:
+				return None
+			readers = []
+			for start_address, length, _ in self.state_read_blocks:
+				reader = GroupSyncRead(self.portHandler, self.packetHandler, start_address, length)
+				for dxl_id in dxl_ids:
+					reader.addParam(dxl_id)
+				readers.append(reader)
+			return readers
+
+	def set_state_ids(self, dxl_ids):
+		"""Restrict the state read to `dxl_ids` (one silent motor fails the whole sync read)."""
+		with self.lock:
+			if self.state_reader is not None and list(dxl_ids) == self.state_ids:
+				return
+			self.state_reader = self.new_state_reader(dxl_ids)
+			self.state_ids = list(dxl_ids)
+
+	def read_state(self, reader=None, dxl_ids=None):
+		"""
+		Read every motor's state (one sync read per block, a single one with
+		indirect addresses) and publish it as `self.state`.
+		With `reader`/`dxl_ids` (see new_state_reader) the read uses that reader
+		instead and the result is only returned, not published.
+		"""
+		publish = reader is None
+		if publish:
+			reader, dxl_ids = self.state_reader, self.state_ids
+		if reader is None or not dxl_ids:
+			return None
+		with self.lock:
+			values = {field: {} for field, _, _ in self.STATE_ITEMS}
+			timestamp = time.monotonic()
+			for block_reader, (_, _, layout) in zip(reader, self.state_read_blocks):
+				dxl_comm_result = block_reader.txRxPacket()
+				if dxl_comm_result != self.COMM_SUCCESS:
+					logging.error(f"{self.device_name}: Failed to read state: "
+								  f"{self.packetHandler.getTxRxResult(dxl_comm_result)}")
+					return None
+				for dxl_id in dxl_ids:
+					for field, (address, length) in layout.items():
+						if not block_reader.isAvailable(dxl_id, address, length):
+							logging.error(f"{self.device_name} ID {dxl_id}: Data not available.")
+							break
+						values[field][dxl_id] = block_reader.getData(dxl_id, address, length)
+
+		for field in ('loads', 'velocities', 'positions'):
+			length = self.state_layout[field][1]
+			values[field] = {dxl_id: _signed(v, length) for dxl_id, v in values[field].items()}
+		values['torque'] = {dxl_id: v == self.TORQUE_ENABLE for dxl_id, v in values['torque'].items()}
+
+		state = ArmState(timestamp=timestamp, **values)
+		if publish:
+			self.state = state
+		return state
+
 	#-----------------------------------------------------------------------
 	#----Torque Status Helpers
 	#-----------------------------------------------------------------------
-	def update_torque_status(self):
-		"""Refresh torque-enabled cache for all motors."""
-		for dxl_id in self.dxl_ids:
+	def update_torque_status(self, dxl_ids=None):
+		"""Refresh torque-enabled cache for all motors (one sync read, per-motor as fallback)."""
+		dxl_ids = self.dxl_ids if dxl_ids is None else dxl_ids
+		groupSyncRead = GroupSyncRead(
+			self.portHandler, self.packetHandler,
+			self.ADDR_PRO_TORQUE_ENABLE, self.ADDR_PRO_TORQUE_ENABLE_LEN)
+		for dxl_id in dxl_ids:
+			groupSyncRead.addParam(dxl_id)
+		if groupSyncRead.txRxPacket() == self.COMM_SUCCESS:
+			for dxl_id in dxl_ids:
+				torque_enabled = groupSyncRead.getData(
+					dxl_id, self.ADDR_PRO_TORQUE_ENABLE, self.ADDR_PRO_TORQUE_ENABLE_LEN)
+				self.torque_enabled[dxl_id] = (torque_enabled == self.TORQUE_ENABLE)
+			return
+		for dxl_id in dxl_ids:
 			torque_enabled, dxl_comm_result, dxl_error = \
 				self.packetHandler.read1ByteTxRx(
 					self.portHandler, dxl_id,
@@ -233,8 +803,7 @@ class RoboticArm:
 			if not self.port_is_open:
 				logging.warning(f"{self.device_name}: Port not open.")
 				return
-			for dxl_id in self.dxl_ids:
-				self.enable_single_motor_torque(dxl_id, enable)
+			self.set_torque_bulk(enable)
 	
 	def enable_single_motor_torque(self, dxl_id, enable):
 		with self.lock:
@@ -258,32 +827,84 @@ class RoboticArm:
 				logging.info(f"{self.device_name} ID {dxl_id}: Torque {status}.")
 	
 	#-----------------------------------------------------------------------
-	#----Direct motor control helpers
+	#----Bulk write helpers (one sync-write packet for many motors)
 	#-----------------------------------------------------------------------
-	def set_motor_position(self, motor_id, speed, position):
-		"""Set Profile Velocity and Goal Position for a single motor."""
+	def _sync_write(self, op, address, length, params):
+		"""Send {dxl_id: [bytes]} in one GroupSyncWrite and record its latency."""
+		groupSyncWrite = GroupSyncWrite(self.portHandler, self.packetHandler, address, length)
+		for dxl_id, data in params.items():
+			groupSyncWrite.addParam(dxl_id, data)
+		start = time.perf_counter()
+		dxl_comm_result = groupSyncWrite.txPacket()
+		elapsed = time.perf_counter() - start
+
+		stats = self.write_latency.setdefault(op, {'calls': 0, 'last': 0.0, 'max': 0.0})
+		stats['calls'] += 1
+		stats['last'] = elapsed
+		stats['max'] = max(stats['max'], elapsed)
+		logging.debug(f"{self.device_name}: {op} for {len(params)} motors in {elapsed * 1000:.2f} ms.")
+
+		if dxl_comm_result != self.COMM_SUCCESS:
+			logging.error(f"{self.device_name}: {op} failed: "
+						  f"{self.packetHandler.getTxRxResult(dxl_comm_result)}")
+			return False
+		return True
+
+	def set_torque_bulk(self, enable, dxl_ids=None):
+		"""Enable/disable torque on many motors (default: all) in one packet."""
 		with self.lock:
 			if not self.port_is_open:
 				logging.warning(f"{self.device_name}: Port not open.")
-				return
-			if motor_id not in self.dxl_ids:
-				logging.warning(f"{self.device_name}: Motor ID {motor_id} not found.")
-				return
-			self.enable_motor_torque(motor_id, True)
-
-			# Profile Acceleration & Velocity
-			self.packetHandler.write4ByteTxRx(
-				self.portHandler, motor_id,
-				self.ADDR_PRO_PROFILE_ACCELERATION, speed)
-			self.packetHandler.write4ByteTxRx(
-				self.portHandler, motor_id,
-				self.ADDR_PRO_PROFILE_VELOCITY, speed)
-
-			# Goal Position
-			position_value = int(position)
-			self.packetHandler.write4ByteTxRx(
-				self.portHandler, motor_id,
-				self.ADDR_PRO_GOAL_POSITION, position_value)
+				return False
+			dxl_ids = self.dxl_ids if dxl_ids is None else dxl_ids
+			pending = [dxl_id for dxl_id in dxl_ids if self.torque_enabled.get(dxl_id) != enable]
+			if not pending:
+				return True  # No state change
+			torque_status = self.TORQUE_ENABLE if enable else self.TORQUE_DISABLE
+			if not self._sync_write(
+					'torque', self.ADDR_PRO_TORQUE_ENABLE, self.ADDR_PRO_TORQUE_ENABLE_LEN,
+					{dxl_id: [torque_status] for dxl_id in pending}):
+				return False
+			for dxl_id in pending:
+				self.torque_enabled[dxl_id] = enable
+			status = "enabled" if enable else "disabled"
+			logging.info(f"{self.device_name} IDs {pending}: Torque {status}.")
+			return True
+
+	def set_motor_positions(self, goals, speed=None):
+		"""
+		Move many motors at once. `goals` maps motor ID -> goal position; with
+		`speed`, Profile Acceleration/Velocity are written in the same packet.
+		"""
+		with self.lock:
+			if not self.port_is_open:
+				logging.warning(f"{self.device_name}: Port not open.")
+				return False
+			unknown = [motor_id for motor_id in goals if motor_id not in self.dxl_ids]
+			if unknown:
+				logging.warning(f"{self.device_name}: Motor IDs {unknown} not found.")
+			goals = {motor_id: int(position) for motor_id, position in goals.items()
+					 if motor_id not in unknown}
+			if not goals:
+				return False
+			self.set_torque_bulk(True, list(goals))
+
+			if speed is None:
+				return self._sync_write(
+					'goal', self.ADDR_PRO_GOAL_POSITION, self.ADDR_PRO_GOAL_POSITION_LEN,
+					{motor_id: goal_position_bytes(position) for motor_id, position in goals.items()})
+			profile = goal_position_bytes(speed)
+			return self._sync_write(
+				'motion', self.ADDR_PRO_MOTION_BLOCK, self.ADDR_PRO_MOTION_BLOCK_LEN,
+				{motor_id: profile + profile + goal_position_bytes(position)
+				 for motor_id, position in goals.items()})
+
+	#-----------------------------------------------------------------------
+	#----Direct motor control helpers
+	#-----------------------------------------------------------------------
+	def set_motor_position(self, motor_id, speed, position):
+		"""Set Profile Velocity and Goal Position for a single motor."""
+		return self.set_motor_positions({motor_id: position}, speed)
 
 	def is_motor_at_position(self, motor_id, target_position, threshold=100):
 		"""Return True if motor is within threshold of target."""
@@ -302,7 +923,7 @@ class RoboticArm:
 	#-----------------------------------------------------------------------
 	#----Recording Functions
 	#-----------------------------------------------------------------------
-	def start_record(self, frequency=30, filename='NewMovement.csv', duration=None):
+	def start_record(self, frequency=100, filename='NewMovement.csv', duration=None):
 		with self.lock:
 			if not self.port_is_open:
 				logging.warning(f"{self.device_name}: Port not open.")
@@ -319,6 +940,7 @@ class RoboticArm:
 			try:
 				self.file = open(filepath, mode='w', newline='')
 				self.writer = csv.writer(self.file)
+				self.writer.writerow([MotionClip.TIME_COLUMN] + list(self.dxl_ids))
 				logging.info(f"{self.device_name}: Recording started.")
 			except PermissionError as e:
 				logging.error(f"{self.device_name}: Cannot open file: {e}")
@@ -330,47 +952,55 @@ class RoboticArm:
 			self.duration = duration
 			self.record_thread = threading.Thread(target=self.update_positions_during_recording)
 			self.record_thread.start()
+
+	def wait_for_recording(self, timeout=None):
+		# The file is only complete once the record thread has flushed and closed it
+		record_thread = getattr(self, 'record_thread', None)
+		if record_thread is not None and record_thread is not threading.current_thread():
+			record_thread.join(timeout)
 	
+	# Rows are flushed to disk at least this often while recording
+	RECORD_FLUSH_INTERVAL = 1.0
+
 	def update_positions_during_recording(self):
-		start_time = time.time()
-		cached_positions = []
+		start_time = time.monotonic()
+		next_time = start_time
+		last_flush = start_time
+		first_timestamp = None
 		try:
 			while not self.stop_event.is_set():
-				current_time = time.time()
-				next_time = current_time + self.interval
-				if self.duration is not None and (current_time - start_time) >= self.duration:
+				if self.duration is not None and (time.monotonic() - start_time) >= self.duration:
 					break
-				positions = self.get_current_positions()
-				if positions:
-					cached_positions.append(
-						[positions.get(dxl_id, 0) for dxl_id in self.dxl_ids])
+				state = self.read_state()
+				if state is not None:
+					self.current_positions.update(state.positions)
+					if first_timestamp is None:
+						first_timestamp = state.timestamp
+					self.writer.writerow(
+						[f"{state.timestamp - first_timestamp:.4f}"] +
+						[self.current_positions.get(dxl_id, 0) for dxl_id in self.dxl_ids])
+					if state.timestamp - last_flush >= self.RECORD_FLUSH_INTERVAL:
+						self.file.flush()
+						last_flush = state.timestamp
 				else:
 					logging.warning(f"{self.device_name}: No positions read, skipping.")
-				sleep_time = next_time - time.time()
-				if sleep_time > 0:
-					self.stop_event.wait(timeout=sleep_time)
+
+				# Keep the sampling grid; a late sample is never followed by a burst
+				next_time += self.interval
+				now = time.monotonic()
+				if next_time < now:
+					next_time = now
+				self.stop_event.wait(timeout=next_time - now)
 		except Exception as e:
 			logging.exception(f"{self.device_name}: Exception in update_positions: {e}")
 		finally:
-			# Flush cached data to CSV
-			if cached_positions:
+			if self.file:
 				try:
-					if self.file is None:
-						directory = os.path.join("Recorded_movements", self.device_name)
-						if not os.path.exists(directory):
-							os.makedirs(directory)
-						filepath = os.path.join(directory, 'NewMovement.csv')
-						self.file = open(filepath, mode='w', newline='')
-						self.writer = csv.writer(self.file)
-					self.writer.writerows(cached_positions)
-					logging.info(f"{self.device_name}: Cached data written.")
-				except Exception as e:
-					logging.error(f"{self.device_name}: Error writing cached data: {e}")
-				finally:
-					if self.file:
-						self.file.close()
-						self.file = None
-						logging.info(f"{self.device_name}: Recording finished.")
+					self.file.close()
+				except OSError as e:
+					logging.error(f"{self.device_name}: Error closing recording: {e}")
+				self.file = None
+				logging.info(f"{self.device_name}: Recording finished.")
 	
 	def end_record(self):
 		self.recording = False
@@ -380,15 +1010,19 @@ class RoboticArm:
 	#-----------------------------------------------------------------------
 	#----Playback Functions
 	#-----------------------------------------------------------------------
-	def play_positions(self, csv_filename, frequency=30):
+	def play_positions(self, csv_filename=None, frequency=30, clip=None, timeline=None,
+					   rate_hz=None, speed=1.0):
+		# `clip` (a preloaded MotionClip) takes precedence over reading csv_filename,
+		# `timeline` (a SharedTimeline) aligns frame deadlines with other arms,
+		# `rate_hz` (default: the recording's own rate) is the output rate, `speed` > 1 plays faster
 
 		with self.lock:
 			if not self.port_is_open:
 				logging.warning(f"{self.device_name}: Port not open.")
-				return
+				return False
 			if self.task_running:
 				logging.warning(f"{self.device_name}: Task already running.")
-				return
+				return False
 			self.task_running = True
 			self.task_done_event.clear()
 
@@ -398,16 +1032,27 @@ class RoboticArm:
 
 			self.playback_thread = threading.Thread(
 				target=self.play_positions_worker_thread,
-				args=(csv_filename, frequency))
+				args=(csv_filename, frequency, clip, timeline, rate_hz, speed))
 			self.playback_thread.start()
+			return True
 
-	def play_positions_worker_thread(self, csv_filename, frequency):
+	def play_positions_worker_thread(self, csv_filename, frequency, clip=None, timeline=None,
+									 rate_hz=None, speed=1.0):
+		started = False
 		try:
-			csv_filepath = os.path.join(os.path.join(os.getcwd(), "Recorded_movements", csv_filename))
-			print("Playing: " + csv_filename)
-			if not os.path.exists(csv_filepath):
-				logging.error(f"{self.device_name}: File not found.")
-				return
+			if clip is None:
+				csv_filepath = recorded_movement_path(csv_filename)
+				print("Playing: " + csv_filename)
+				if not os.path.exists(csv_filepath):
+					logging.error(f"{self.device_name}: File not found.")
+					return
+				# Parsed and packed once per file (cached until it changes)
+				clip = load_motion_clip(csv_filepath, self.dxl_ids, frequency)
+			else:
+				print("Playing: " + os.path.basename(clip.source or "clip"))
+			clip = clip.retimed(rate_hz, speed)
+			rate_hz = clip.frequency
+			interval = 1.0 / rate_hz
 
 			# Enable Movement
 			self.set_is_stop(False)
@@ -416,54 +1061,71 @@ class RoboticArm:
 			# Reset overload timers
 			self.overload_timers = {dxl_id: 0 for dxl_id in self.dxl_ids}
 
-			groupSyncWrite = GroupSyncWrite(
-				self.portHandler, self.packetHandler,
-				self.ADDR_PRO_GOAL_POSITION,
-				self.ADDR_PRO_GOAL_POSITION_LEN)
-			with open(csv_filepath, mode='r') as file:
-				reader = list(csv.reader(file))
-				desired_interval = 1.0 / frequency
-				start_time = time.time()
-				frame_count = 0
-				total_frames = len(reader)
-				while frame_count < total_frames:
-					with self.condition:
-						if self.is_stop:
-							logging.info(f"{self.device_name}: Movement stopped.")
-							break
+			payloads = clip.payloads(exclude=self.faulty_motors)
 
-					target_time = start_time + frame_count * desired_interval
-					current_time = time.time()
-					sleep_time = target_time - current_time
-					if sleep_time > 0:
-						time.sleep(sleep_time)
-					else:
-						logging.warning(f"{self.device_name}: Frame {frame_count} is late.")
-					row = reader[frame_count]
-					frame_count += 1
-
-					with self.lock:
-						groupSyncWrite.clearParam()
-						for i, position in enumerate(row):
-							dxl_id = self.dxl_ids[i]
-							if dxl_id in self.faulty_motors:
-								continue
-							position_value = int(position)
-							param_goal_position = [
-								DXL_LOBYTE(DXL_LOWORD(position_value)),
-								DXL_HIBYTE(DXL_LOWORD(position_value)),
-								DXL_LOBYTE(DXL_HIWORD(position_value)),
-								DXL_HIBYTE(DXL_HIWORD(position_value))]
-							groupSyncWrite.addParam(dxl_id, param_goal_position)
-							self.current_positions[dxl_id] = position_value
-						dxl_comm_result = groupSyncWrite.txPacket()
-						if dxl_comm_result != self.COMM_SUCCESS:
-							logging.error(f"{self.device_name}: Failed to send positions: "
-										  f"{self.packetHandler.getTxRxResult(dxl_comm_result)}")
-				logging.info(f"{self.device_name}: Playback completed.")
+			frame_count = 0
+			total_frames = clip.frame_count
+			frame_lateness = [None] * total_frames
+			self.frame_lateness = frame_lateness
+			frames_sent = 0
+			frames_skipped = 0
+			deadline_misses = 0
+			if timeline is not None:
+				start_time = timeline.wait_start()
+			else:
+				start_time = time.monotonic()
+			started = True
+			while frame_count < total_frames:
+				with self.condition:
+					if self.is_stop:
+						logging.info(f"{self.device_name}: Movement stopped.")
+						break
+
+				target_time = start_time + frame_count * interval
+				current_time = time.monotonic()
+				sleep_time = target_time - current_time
+				if sleep_time > 0:
+					time.sleep(sleep_time)
+				elif -sleep_time > interval / 2:
+					deadline_misses += 1
+					# Behind schedule: jump to the frame due now instead of replaying the backlog
+					due = min(int((current_time - start_time) / interval), total_frames - 1)
+					if due > frame_count:
+						logging.debug(f"{self.device_name}: Frames {frame_count}-{due - 1} skipped.")
+						frames_skipped += due - frame_count
+						frame_count = due
+						target_time = start_time + frame_count * interval
+				param = payloads[frame_count]
+				frame = clip.frames[frame_count]
+				frame_index = frame_count
+				frame_count += 1
+
+				if not param:
+					continue
+				frames_sent += 1
+				with self.lock:
+					frame_lateness[frame_index] = time.monotonic() - target_time
+					dxl_comm_result = self.packetHandler.syncWriteTxOnly(
+						self.portHandler, self.ADDR_PRO_GOAL_POSITION,
+						self.ADDR_PRO_GOAL_POSITION_LEN, param, len(param))
+					self.current_positions.update(zip(clip.dxl_ids, frame))
+					if dxl_comm_result != self.COMM_SUCCESS:
+						logging.error(f"{self.device_name}: Failed to send positions: "
+									  f"{self.packetHandler.getTxRxResult(dxl_comm_result)}")
+			elapsed = max(time.monotonic() - start_time, interval)
+			self.playback_stats = {
+				'frames_sent': frames_sent,
+				'frames_skipped': frames_skipped,
+				'deadline_misses': deadline_misses,
+				'misses_per_second': deadline_misses / elapsed}
+			logging.info(f"{self.device_name}: Playback completed "
+						 f"({frames_sent} frames at {rate_hz} Hz x{speed}, {frames_skipped} skipped, "
+						 f"{deadline_misses / elapsed:.2f} deadline misses/s).")
 		except Exception as e:
 			logging.exception(f"{self.device_name}: Exception in play_positions_thread: {e}")
 		finally:
+			if timeline is not None and not started:
+				timeline.abort()
 				
 			#If right arm, turn light off
 			if (self.device_name == '/dev/ttyUSB1'):
@@ -506,24 +1168,141 @@ class RoboticArm:
 		else:
 			logging.warning(f"{self.device_name}: {old_file_path} does not exist.")
   
+	#-----------------------------------------------------------------------
+	#----Realtime control (teleoperation)
+	#-----------------------------------------------------------------------
+	def _realtime_write(self):
+		# One GroupSyncWrite reused for every realtime packet
+		if self.realtime_sync_write is None:
+			self.realtime_sync_write = GroupSyncWrite(
+				self.portHandler, self.packetHandler,
+				self.ADDR_PRO_GOAL_POSITION,
+				self.ADDR_PRO_GOAL_POSITION_LEN)
+		return self.realtime_sync_write
+
+	def _set_realtime_param(self, groupSyncWrite, dxl_id, position_value):
+		param_goal_position = goal_position_bytes(position_value)
+		if not groupSyncWrite.changeParam(dxl_id, param_goal_position):
+			groupSyncWrite.addParam(dxl_id, param_goal_position)
+
+	@staticmethod
+	def _new_realtime_stats():
+		return {'ticks': 0, 'packets': 0, 'commands': 0, 'coalesced': 0,
+				'max_loop_time': 0.0, 'max_lateness': 0.0, 'late_ticks': 0}
+
+	def start_realtime(self, rate_hz=50):
+		"""Start the realtime loop: goals posted to the mailbox are sent at `rate_hz`."""
+		with self.lock:
+			if not self.port_is_open:
+				logging.warning(f"{self.device_name}: Port not open.")
+				return False
+			if self.realtime_thread is not None and self.realtime_thread.is_alive():
+				return True
+			positions = dict(self.get_current_positions())
+			groupSyncWrite = self._realtime_write()
+			groupSyncWrite.clearParam()
+			for dxl_id, position_value in positions.items():
+				self._set_realtime_param(groupSyncWrite, dxl_id, position_value)
+			self.realtime_positions = positions
+			self.last_positions = dict(positions)
+			with self.realtime_mailbox_lock:
+				self.realtime_targets = {}
+				self.realtime_increments = {}
+				self.realtime_stats = self._new_realtime_stats()
+			self.set_torque_bulk(True, list(positions))
+			self.realtime_thread_stop_event.clear()
+			self.realtime_thread = threading.Thread(
+				target=self._realtime_loop, args=(rate_hz,),
+				name=f"Realtime-{self.device_name}", daemon=True)
+			self.realtime_thread.start()
+			return True
+
+	def stop_realtime(self):
+		self.realtime_thread_stop_event.set()
+		if self.realtime_thread is not None and self.realtime_thread is not threading.current_thread():
+			self.realtime_thread.join(timeout=1)
+		self.realtime_thread = None
+
+	def set_realtime_targets(self, targets):
+		"""Post absolute goals {motor_id: position}; replaces any not yet sent."""
+		with self.realtime_mailbox_lock:
+			for motor_id, position in targets.items():
+				if motor_id in self.realtime_targets or motor_id in self.realtime_increments:
+					self.realtime_stats['coalesced'] += 1
+				self.realtime_targets[motor_id] = int(position)
+				self.realtime_increments.pop(motor_id, None)
+			self.realtime_stats['commands'] += 1
+
+	def add_realtime_increments(self, increments):
+		"""Post relative moves {motor_id: delta}; deltas not yet sent are summed."""
+		with self.realtime_mailbox_lock:
+			for motor_id, delta in increments.items():
+				if motor_id in self.realtime_increments:
+					self.realtime_stats['coalesced'] += 1
+				self.realtime_increments[motor_id] = self.realtime_increments.get(motor_id, 0) + int(delta)
+			self.realtime_stats['commands'] += 1
+
+	def _realtime_loop(self, rate_hz):
+		interval = 1.0 / rate_hz
+		next_time = time.monotonic()
+		stats = self.realtime_stats
+		groupSyncWrite = self._realtime_write()
+		while not self.realtime_thread_stop_event.is_set():
+			loop_start = time.monotonic()
+			lateness = loop_start - next_time
+			stats['max_lateness'] = max(stats['max_lateness'], lateness)
+			if lateness > interval:
+				stats['late_ticks'] += 1
+
+			# Take whatever arrived since the last tick; only the latest value counts
+			with self.realtime_mailbox_lock:
+				targets, self.realtime_targets = self.realtime_targets, {}
+				increments, self.realtime_increments = self.realtime_increments, {}
+
+			for motor_id, position in targets.items():
+				if motor_id in self.realtime_positions:
+					self.realtime_positions[motor_id] = position
+			for motor_id, delta in increments.items():
+				if motor_id in self.realtime_positions:
+					self.realtime_positions[motor_id] += delta
+
+			self.updated_motor_ids = [motor_id for motor_id, position in self.realtime_positions.items()
+									  if self.last_positions.get(motor_id) != position]
+			if self.updated_motor_ids:
+				with self.lock:
+					for motor_id in self.updated_motor_ids:
+						position_value = self.realtime_positions[motor_id]
+						self._set_realtime_param(groupSyncWrite, motor_id, position_value)
+						self.last_positions[motor_id] = position_value
+						self.current_positions[motor_id] = position_value
+					dxl_comm_result = groupSyncWrite.txPacket()
+				if dxl_comm_result != self.COMM_SUCCESS:
+					logging.error(f"{self.device_name}: Realtime send failed: "
+								  f"{self.packetHandler.getTxRxResult(dxl_comm_result)}")
+				stats['packets'] += 1
+
+			stats['ticks'] += 1
+			stats['max_loop_time'] = max(stats['max_loop_time'], time.monotonic() - loop_start)
+			next_time += interval
+			now = time.monotonic()
+			if next_time < now:
+				next_time = now
+			self.realtime_thread_stop_event.wait(next_time - now)
+
 	#-----------------------------------------------------------------------
 	#----One-shot realtime command (XYZ list -> motors 1..n)
 	#-----------------------------------------------------------------------
 	def play_realtime(self, motor_positions):
-		groupSyncWrite = GroupSyncWrite(
-			self.portHandler, self.packetHandler,
-			self.ADDR_PRO_GOAL_POSITION,
-			self.ADDR_PRO_GOAL_POSITION_LEN)
-		groupSyncWrite.clearParam()
-		for i, position in enumerate(motor_positions):
-			position_value = int(position)
-			param_goal_position = [
-				DXL_LOBYTE(DXL_LOWORD(position_value)),
-				DXL_HIBYTE(DXL_LOWORD(position_value)),
-				DXL_LOBYTE(DXL_HIWORD(position_value)),
-				DXL_HIBYTE(DXL_HIWORD(position_value))]
-			groupSyncWrite.addParam(self.dxl_ids[i], param_goal_position)
-		groupSyncWrite.txPacket()
+		goals = {self.dxl_ids[i]: int(position) for i, position in enumerate(motor_positions)}
+		# While the realtime loop runs it owns realtime_sync_write; hand the goals to it
+		if self.realtime_thread is not None and self.realtime_thread.is_alive():
+			self.set_realtime_targets(goals)
+			return
+		with self.lock:
+			self._sync_write(
+				'realtime', self.ADDR_PRO_GOAL_POSITION, self.ADDR_PRO_GOAL_POSITION_LEN,
+				{dxl_id: goal_position_bytes(position) for dxl_id, position in goals.items()})
+			self.current_positions.update(goals)
 
 	#-----------------------------------------------------------------------
 	#----Routines   
@@ -535,3 +1314,74 @@ class RoboticArm:
 	def release_arm(self):
 		self.set_is_stop(True)
 		self.enable_all_motor_torque(False)
+
+#-----------------------------------------------------------------------
+#----Telemetry
+#-----------------------------------------------------------------------
+# Published by ArmTelemetry; `alive` is a frozenset of responding motor IDs,
+# `state` the last ArmState (None while no motor answers).
+TelemetrySnapshot = namedtuple('TelemetrySnapshot', ['timestamp', 'alive', 'state'])
+
+class ArmTelemetry:
+	"""
+	Background poller for one arm. Reads the whole ArmState at `rate_hz` and
+	publishes an immutable TelemetrySnapshot, so UI and safety checks read
+	`snapshot` without touching the bus. It keeps its own reader over the
+	motors that answered the last ping, so the arm's `state_ids` (used by
+	recordings) are left alone. Missing motors and failed reads trigger a
+	re-ping at most every `rescan_interval` seconds.
+	"""
+
+	def __init__(self, arm, rate_hz=5, rescan_interval=2.0):
+		self.arm = arm
+		self.interval = 1.0 / rate_hz
+		self.rescan_interval = rescan_interval
+		self.snapshot = TelemetrySnapshot(time.monotonic(), frozenset(), None)
+		self._alive = []
+		self._reader = None
+		self._stop_event = threading.Event()
+		self._thread = None
+
+	def start(self):
+		if self._thread is None or not self._thread.is_alive():
+			self._stop_event.clear()
+			self._thread = threading.Thread(
+				target=self._run, name=f"ArmTelemetry-{self.arm.device_name}", daemon=True)
+			self._thread.start()
+		return self
+
+	def stop(self):
+		self._stop_event.set()
+		if self._thread is not None:
+			self._thread.join(timeout=1)
+		self._thread = None
+
+	def _rescan(self):
+		# One broadcast instead of per-ID pings, which hold the arm lock for each missing ID's timeout
+		responding = self.arm.broadcast_ping_motors()
+		alive = [dxl_id for dxl_id in self.arm.dxl_ids if dxl_id in responding]
+		if alive != self._alive or self._reader is None:
+			self._reader = self.arm.new_state_reader(alive)
+		self._alive = alive
+		return frozenset(alive)
+
+	def _run(self):
+		alive = frozenset()
+		last_rescan = None
+		while not self._stop_event.is_set():
+			state = None
+			try:
+				now = time.monotonic()
+				if last_rescan is None:
+					alive = self._rescan()
+					last_rescan = now
+				if self._reader is not None:
+					state = self.arm.read_state(self._reader, self._alive)
+				incomplete = len(alive) < len(self.arm.dxl_ids)
+				if (state is None or incomplete) and now - last_rescan >= self.rescan_interval:
+					alive = self._rescan()
+					last_rescan = now
+			except Exception as e:
+				logging.exception(f"{self.arm.device_name}: Exception in telemetry: {e}")
+			self.snapshot = TelemetrySnapshot(time.monotonic(), alive, state)
+			self._stop_event.wait(self.interval)
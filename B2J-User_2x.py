@@ -1,13 +1,15 @@
 import ABMI_Utils
 import ABMI_Utils_2x
 import ALS_Utils
+import M5_Utils
+import EEG_Utils
 import argparse
 import glob
-import serial
 import pygame
 import os
 import time
 import random
+import threading
 from datetime import datetime
 from serial.tools import list_ports
 from DroneMonitorClient import DroneMonitorClient
@@ -19,6 +21,13 @@ RESET = "\033[0m"
 
 baud = 115200
 MAX_ESP_PAYLOAD_BYTES = 240
+PREVIEW_RATE_HZ = M5_Utils.DEFAULT_PREVIEW_RATE_HZ
+
+# Main loop pacing: the loop sleeps out the rest of each frame (or until a
+# piezo tap / sequence end wakes it) so the stimulus thread keeps the GIL.
+FRAME_BUDGET_S = 1 / 20
+MAIN_LOOP_CPU_TARGET = 0.05  # fraction of one core
+CPU_REPORT_INTERVAL_S = 10
 
 
 def pick_m5_port():
@@ -42,6 +51,8 @@ if m5_port is None:
 else:
 	print(f"[OK] M5 port found: {m5_port}")
 
+m5_link = M5_Utils.M5Link(m5_port, baud)
+
 notoFont = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
 
 white = (217, 217, 217)
@@ -53,7 +64,13 @@ clock = None
 title_font = None
 state_font = None
 
-board = ABMI_Utils.BCIBoard(port="/dev/bci_dongle")
+BCI_PORT = "/dev/bci_dongle"
+
+# Created in main: either an in-process BCIBoard or an EEG_Utils client for
+# a board running in its own acquisition process (--acquisition-daemon).
+board = None
+acquisition_service = None
+live_samples = None  # latest()/since() view of the EEG stream (EEG_Utils)
 
 # 2x は 5 シーケンス（+ボーナス1セット = 6セット）で録音が約14秒（~3500行）と短い。
 # BCIBoard の既定 minimum_recorded_rows=5800 は 10 シーケンス前提なので、そのままだと
@@ -61,7 +78,7 @@ board = ABMI_Utils.BCIBoard(port="/dev/bci_dongle")
 # 2x の想定行数に合わせて下げる（共有の ABMI_Utils.py は変更せず、本 board のみ上書き）。
 _sets_2x = ABMI_Utils_2x.NUM_SEQUENCES + 1  # +1 はインターバル置換のボーナスセット
 _expected_rows_2x = int((2 + _sets_2x * 4 * (ABMI_Utils.ISI + ABMI_Utils.SOUND_LENGTH)) * 250)
-board.minimum_recorded_rows = int(_expected_rows_2x * 0.85)  # 15%マージン (~2975行)
+MINIMUM_RECORDED_ROWS_2X = int(_expected_rows_2x * 0.85)  # 15%マージン (~2975行)
 
 sequence_thread = None
 cancel_event = None
@@ -77,18 +94,47 @@ sound_map = {
 }
 
 prediction_choice = None
+prediction_worker = ABMI_Utils_2x.PredictionWorker(model_path)
+prediction_future = None
+prediction_started = 0
 keyboard_pressed = False
 
 userID = ABMI_Utils.getUserID()
 
 piezo = ALS_Utils.PiezoSensor(pin=21, cooldown=1)
 
+# Set by anything the main loop should react to without waiting a full frame
+wake_event = threading.Event()
+piezo.add_listener(wake_event.set)
+
 state = "idle"
 drone_monitor_client = None
 title_surface = None
 state_surface = None
 last_text_draw = 0
 text_draw_interval_ms = 200
+preview_streamer = None
+
+
+def create_board(use_acquisition_daemon):
+	global acquisition_service
+
+	if use_acquisition_daemon:
+		acquisition_service = EEG_Utils.AcquisitionService(port=BCI_PORT)
+		new_board = acquisition_service.start()
+	else:
+		new_board = ABMI_Utils.BCIBoard(port=BCI_PORT)
+
+	new_board.minimum_recorded_rows = MINIMUM_RECORDED_ROWS_2X
+	return new_board
+
+
+def latest_eeg_frame():
+	if live_samples is None:
+		return None
+
+	window = live_samples.latest(1)
+	return window[0] if len(window) else None
 
 
 def was_trigger_pressed():
@@ -101,28 +147,19 @@ def was_trigger_pressed():
 	return False
 
 
-def sendToM5(port: str, baud: int, message: str):
-	if not port:
-		print("[ERROR] No serial port selected")
-		return
-
-	if not message:
-		return
+def clear_trigger():
+	global keyboard_pressed
 
-	message = message.strip() + "\n"
+	piezo.was_pressed()
+	keyboard_pressed = False
 
-	try:
-		with serial.Serial(port, baud, timeout=1) as ser:
-			ser.write(message.encode("utf-8"))
-			ser.flush()
-			print(f"[TX M5] {message.strip()}")
 
-	except serial.SerialException as e:
-		print(f"[ERROR] Serial error: {e}")
+def send_m5(message: str):
+	m5_link.send(message)
 
 
 def _send_single_command(ch, val):
-	sendToM5(m5_port, baud, f"S,Ch{ch}-{val}")
+	send_m5(f"S,Ch{ch}-{val}")
 
 
 def send_led_command(ch, val):
@@ -202,38 +239,69 @@ def handleIdle():
 			userID,
 			timestamp,
 			lcr_choice,
-			testing_path
+			testing_path,
+			done_event=wake_event
 		)
 
 		send_led_all_off()
 
+		if preview_streamer is not None:
+			preview_streamer.start()
+
 
 def handleRecording():
 	global state, sequence_thread, latest_test_file
 
-	recent = str(board._last_data_frame)
-
-	sendToM5(m5_port, baud, f"E,{recent}")
+	# EEG preview is sent by preview_streamer on its own rate-limited thread
 
 	if not sequence_thread.is_alive():
+		if preview_streamer is not None:
+			preview_streamer.stop()
 		state = "predicting"
 
 
+def run_in_background(target):
+	threading.Thread(target=target, daemon=True).start()
+
+
 def handlePredicting():
-	global state, prediction_choice, sound_map, latest_test_file, model_path
+	global state, prediction_choice, sound_map, latest_test_file
+	global prediction_future, prediction_started
+
+	# Start the prediction on the worker; the loop keeps drawing and polling input
+	if prediction_future is None:
+		prediction_started = time.perf_counter()
+		prediction_future = prediction_worker.submit(latest_test_file)
+		prediction_future.add_done_callback(lambda _: wake_event.set())
+		# Forget taps latched before submitting; only a new tap cancels
+		clear_trigger()
+		return
+
+	# A tap while predicting cancels and returns to idle (the result is discarded)
+	if was_trigger_pressed():
+		print(f"{YELLOW}[BCI] Prediction cancelled{RESET}")
+		prediction_future.cancel()
+		prediction_future = None
+		state = "idle"
+		return
+
+	if not prediction_future.done():
+		return
+
+	future = prediction_future
+	prediction_future = None
 
 	try:
-		prediction_choice = ABMI_Utils_2x.useModelToPredict(
-			latest_test_file,
-			model_path
-		)
+		result = future.result()
+		prediction_choice = result.prediction
+		print(f"[BCI] Prediction {prediction_choice} in {result.elapsed:.2f}s")
 
 		if prediction_choice == 1:
-			send_led_left()
+			run_in_background(send_led_left)
 		elif prediction_choice == 2:
-			send_led_center()
+			run_in_background(send_led_center)
 		elif prediction_choice == 3:
-			send_led_right()
+			run_in_background(send_led_right)
 
 		if prediction_choice == -1:
 			ABMI_Utils.play_single_sound("Sounds/prediction_unknown.wav")
@@ -258,7 +326,7 @@ def handleTriggering():
 			sound_map.get(prediction_choice, "Sounds/prediction_unknown.wav")
 		)
 
-		sendToM5(m5_port, baud, f"T,{prediction_choice}")
+		send_m5(f"T,{prediction_choice}")
 
 		# Forward the confirmed choice to drone_monitor
 		if drone_monitor_client is not None and prediction_choice in (1, 2, 3):
@@ -289,7 +357,12 @@ def draw_status_text(force=False):
 	if state_font is None:
 		state_font = pygame.font.Font(notoFont, 36)
 
-	state_surface = state_font.render(state.upper(), True, white)
+	state_text = state.upper()
+
+	if state == "predicting" and prediction_future is not None:
+		state_text += f" {time.perf_counter() - prediction_started:.1f}s"
+
+	state_surface = state_font.render(state_text, True, white)
 
 	screen.fill(black)
 
@@ -308,6 +381,60 @@ def draw_status_text(force=False):
 	last_text_draw = now
 
 
+class FramePacer:
+	"""
+	Frame budget for the main loop.
+
+	end_frame() blocks on wake_event for whatever is left of the budget, so
+	an idle loop costs almost nothing while taps and sequence completion are
+	still handled immediately. Main-thread CPU use is measured with
+	time.thread_time() and reported when it exceeds cpu_target.
+	"""
+
+	def __init__(self, frame_budget, wake_event, cpu_target, report_interval):
+		self.frame_budget = frame_budget
+		self.wake_event = wake_event
+		self.cpu_target = cpu_target
+		self.report_interval = report_interval
+		self.frame_start = time.perf_counter()
+		self.overruns = 0
+		self.cpu_utilization = 0.0
+		self._report_wall = time.perf_counter()
+		self._report_cpu = time.thread_time()
+
+	def begin_frame(self):
+		self.frame_start = time.perf_counter()
+
+	def end_frame(self):
+		remaining = self.frame_budget - (time.perf_counter() - self.frame_start)
+
+		if remaining > 0:
+			self.wake_event.wait(remaining)
+		else:
+			self.overruns += 1
+
+		self.wake_event.clear()
+		self._measure()
+
+	def _measure(self):
+		now = time.perf_counter()
+		elapsed = now - self._report_wall
+
+		if elapsed < self.report_interval:
+			return
+
+		cpu_now = time.thread_time()
+		self.cpu_utilization = (cpu_now - self._report_cpu) / elapsed
+		self._report_wall = now
+		self._report_cpu = cpu_now
+
+		if self.cpu_utilization > self.cpu_target:
+			print(f"{YELLOW}[LOOP] Main loop CPU {self.cpu_utilization * 100:.1f}% "
+				  f"(target {self.cpu_target * 100:.1f}%), overruns: {self.overruns}{RESET}")
+
+		self.overruns = 0
+
+
 if __name__ == "__main__":
 	parser = argparse.ArgumentParser(
 		description="B2J BCI user runtime (2x). Uses model_2x (two-band LDA) and "
@@ -328,8 +455,35 @@ if __name__ == "__main__":
 		help="drone_monitor WebSocket port (default: 9090)."
 	)
 
+	parser.add_argument(
+		"--preview-rate",
+		type=float,
+		default=PREVIEW_RATE_HZ,
+		help=f"EEG preview rate sent to the M5 while recording, in Hz "
+			 f"(default: {PREVIEW_RATE_HZ}). 0 disables the preview."
+	)
+
+	parser.add_argument(
+		"--acquisition-daemon",
+		action="store_true",
+		help="Read the BCI board in a separate process and share samples through "
+			 "shared memory, so rendering and prediction cannot delay sample reads "
+			 "or label stamping."
+	)
+
 	args = parser.parse_args()
 
+	# Must happen before pygame.init(): the acquisition process is forked
+	board = create_board(args.acquisition_daemon)
+
+	if args.preview_rate > 0:
+		preview_streamer = M5_Utils.EEGPreviewStreamer(
+			m5_link,
+			latest_eeg_frame,
+			rate_hz=args.preview_rate,
+			max_payload_bytes=MAX_ESP_PAYLOAD_BYTES
+		)
+
 	# Window at top left
 	os.environ["SDL_VIDEO_WINDOW_POS"] = "0,0"
 
@@ -340,6 +494,12 @@ if __name__ == "__main__":
 	board.connect()
 	board.stream()
 
+	# Daemon client already exposes the shared ring; otherwise feed a local one
+	if acquisition_service is not None:
+		live_samples = board
+	else:
+		live_samples = EEG_Utils.BoardSampleBuffer(board).start()
+
 	pygame.init()
 	pygame.mixer.init()
 
@@ -357,14 +517,19 @@ if __name__ == "__main__":
 	screen.fill(black)
 	draw_status_text(force=True)
 
+	# Load the model and design the filters before the first recording ends
+	prediction_worker.prewarm()
+
 	send_led_flicker()
 
 	if not board.connected:
 		quit()
 
 	running = True
+	pacer = FramePacer(FRAME_BUDGET_S, wake_event, MAIN_LOOP_CPU_TARGET, CPU_REPORT_INTERVAL_S)
 
 	while running:
+		pacer.begin_frame()
 
 		for event in pygame.event.get():
 
@@ -394,12 +559,29 @@ if __name__ == "__main__":
 		elif state == "triggering":
 			handleTriggering()
 
+		pacer.end_frame()
+
 	send_led_all_off()
 
+	if preview_streamer is not None:
+		preview_streamer.stop()
+
+	prediction_worker.shutdown()
+
 	try:
 		board.stop_stream()
 	except:
 		pass
 
+	if live_samples is not None:
+		print(f"[EEG] Dropped samples this session: {live_samples.dropped_samples}")
+
+	if acquisition_service is not None:
+		acquisition_service.stop()
+	elif live_samples is not None:
+		live_samples.stop()
+
+	m5_link.close()
+
 	pygame.quit()
 	quit()
@@ -1,5 +1,14 @@
+import argparse
 from Scene_Utils import BMITrainer
 
 if __name__ == "__main__":
-	app = BMITrainer()
+	parser = argparse.ArgumentParser(description="BMI Trainer")
+	parser.add_argument(
+		"--acquisition-daemon",
+		action="store_true",
+		help="Read the BCI board in a separate process (shared-memory sample buffer)."
+	)
+	args = parser.parse_args()
+
+	app = BMITrainer(acquisition_daemon=args.acquisition_daemon)
 	app.main_loop()
\ No newline at end of file
@@ -0,0 +1,337 @@
+"""
+Catalog_Utils.py
+
+Persistent index of the BMI Trainer recordings under "BMI Trainer Data/".
+
+  - RecordingCatalog : JSON index of every recording (user, label, time,
+                       size, duration, upload status) plus running per-user
+                       totals, so the trainer's L/C/R counts and the most
+                       recent recording are lookups instead of a walk over
+                       the whole data folder.
+
+Recordings are named "<user_id>-<YYYY-mm-dd-HH-MM-SS>-<label>.csv"
+(label 0 testing, 1 left, 2 center, 3 right, 4 live). sync() only lists
+directories whose modification time changed since the last sync, so an
+unchanged tree costs one stat() per directory.
+"""
+
+import bisect
+import json
+import os
+import re
+import threading
+
+CATALOG_VERSION = 1
+DEFAULT_INDEX_PATH = "recording_catalog.json"
+SAMPLE_RATE_HZ = 250  # BCIBoard recording rate, one CSV row per sample
+LCR_LABELS = (1, 2, 3)
+
+RECORDING_PATTERN = re.compile(r"^(\d{9})-(\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2})-(\d)\.csv$")
+
+
+def parse_recording_name(filename):
+	"""Return (user_id, timestamp_str, label) for a recording file name, else None."""
+	match = RECORDING_PATTERN.match(filename)
+	if match is None:
+		return None
+	user_id, timestamp_str, label = match.groups()
+	return user_id, timestamp_str, int(label)
+
+
+def recording_duration(path, sample_rate=SAMPLE_RATE_HZ):
+	"""Seconds of data in a recording CSV (one header row, one row per sample)."""
+	rows = 0
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 16), b""):
+			rows += chunk.count(b"\n")
+	return max(rows - 1, 0) / sample_rate
+
+
+class RecordingCatalog:
+	"""
+	Incrementally updated recording index.
+
+	Entries are keyed by their path relative to base_folder. Every method is
+	thread-safe; the index file is rewritten atomically after each change.
+	"""
+
+	def __init__(self, base_folder="BMI Trainer Data/", index_path=DEFAULT_INDEX_PATH):
+		self.base_folder = os.path.abspath(base_folder)
+		self.index_path = index_path
+		self._lock = threading.RLock()
+		self._recordings = {}
+		self._dirs = {}
+		self._load()
+
+	#--------------------------------------------------------------------
+	#----Persistence
+
+	def _load(self):
+		try:
+			with open(self.index_path, "r", encoding="utf-8") as f:
+				data = json.load(f)
+		except FileNotFoundError:
+			data = None
+		except (OSError, ValueError) as e:
+			print(f"[WARN] Recording catalog unreadable, rebuilding: {e}")
+			data = None
+
+		if data and data.get("version") == CATALOG_VERSION and data.get("base_folder") == self.base_folder:
+			self._recordings = data.get("recordings", {})
+			self._dirs = data.get("dirs", {})
+		self._rebuild_totals()
+
+	def save(self):
+		with self._lock:
+			data = {
+				"version": CATALOG_VERSION,
+				"base_folder": self.base_folder,
+				"recordings": self._recordings,
+				"dirs": self._dirs,
+			}
+			tmp_path = self.index_path + ".tmp"
+			with open(tmp_path, "w", encoding="utf-8") as f:
+				json.dump(data, f)
+			os.replace(tmp_path, self.index_path)
+
+	#--------------------------------------------------------------------
+	#----Running totals
+
+	def _rebuild_totals(self):
+		self._counts = {}
+		self._bytes = {}
+		self._seconds = {}
+		self._by_time = {}
+		for rel_path, entry in self._recordings.items():
+			self._count_in(rel_path, entry)
+
+	def _count_in(self, rel_path, entry):
+		user = entry["user"]
+		counts = self._counts.setdefault(user, {})
+		counts[entry["label"]] = counts.get(entry["label"], 0) + 1
+		self._bytes[user] = self._bytes.get(user, 0) + entry["size"]
+		self._seconds[user] = self._seconds.get(user, 0.0) + entry["duration"]
+		# Kept sorted by (timestamp, path); new recordings land at the end
+		bisect.insort(self._by_time.setdefault(user, []), (entry["timestamp"], rel_path))
+
+	def _count_out(self, rel_path, entry):
+		user = entry["user"]
+		self._counts[user][entry["label"]] -= 1
+		self._bytes[user] -= entry["size"]
+		self._seconds[user] -= entry["duration"]
+		by_time = self._by_time[user]
+		i = bisect.bisect_left(by_time, (entry["timestamp"], rel_path))
+		if i < len(by_time) and by_time[i] == (entry["timestamp"], rel_path):
+			by_time.pop(i)
+
+	#--------------------------------------------------------------------
+	#----Updates
+
+	def _rel(self, path):
+		return os.path.relpath(os.path.abspath(path), self.base_folder)
+
+	def _put(self, rel_path, stat_result, parsed):
+		user, timestamp_str, label = parsed
+		previous = self._recordings.get(rel_path)
+		if previous is not None:
+			if previous["size"] == stat_result.st_size and previous["mtime"] == stat_result.st_mtime_ns:
+				return False
+			self._count_out(rel_path, previous)
+
+		try:
+			duration = recording_duration(os.path.join(self.base_folder, rel_path))
+		except OSError:
+			duration = 0.0
+		entry = {
+			"user": user,
+			"label": label,
+			"timestamp": timestamp_str,
+			"size": stat_result.st_size,
+			"mtime": stat_result.st_mtime_ns,
+			"duration": duration,
+			# New or rewritten files have to be uploaded (again); the hash and
+			# codec of the last upload are kept so an unchanged rewrite can be skipped
+			"uploaded": False,
+			"remote_hash": previous["remote_hash"] if previous is not None else None,
+			"remote_codec": previous.get("remote_codec") if previous is not None else None,
+		}
+		self._recordings[rel_path] = entry
+		self._count_in(rel_path, entry)
+		return True
+
+	def _drop(self, rel_path):
+		entry = self._recordings.pop(rel_path, None)
+		if entry is not None:
+			self._count_out(rel_path, entry)
+		return entry is not None
+
+	def add(self, path):
+		"""Index (or re-index) one recording file; returns False when it is missing or not a recording."""
+		parsed = parse_recording_name(os.path.basename(path))
+		if parsed is None:
+			return False
+		with self._lock:
+			rel_path = self._rel(path)
+			try:
+				stat_result = os.stat(path)
+			except FileNotFoundError:
+				if self._drop(rel_path):
+					self.save()
+				return False
+			if self._put(rel_path, stat_result, parsed):
+				self.save()
+			return True
+
+	def sync(self):
+		"""Bring the index in line with the disk, listing only directories that changed."""
+		with self._lock:
+			changed = False
+			seen_dirs = set()
+			stack = ["."]
+			while stack:
+				rel_dir = stack.pop()
+				abs_dir = os.path.normpath(os.path.join(self.base_folder, rel_dir))
+				try:
+					dir_mtime = os.stat(abs_dir).st_mtime_ns
+				except FileNotFoundError:
+					continue
+				seen_dirs.add(rel_dir)
+
+				known = self._dirs.get(rel_dir)
+				if known is not None and known["mtime"] == dir_mtime:
+					stack.extend(known["subdirs"])
+					continue
+
+				subdirs = []
+				present = set()
+				try:
+					entries = list(os.scandir(abs_dir))
+				except OSError:
+					entries = []
+				for entry in entries:
+					rel_path = os.path.normpath(os.path.join(rel_dir, entry.name))
+					if entry.is_dir(follow_symlinks=False):
+						subdirs.append(rel_path)
+						continue
+					parsed = parse_recording_name(entry.name)
+					if parsed is None:
+						continue
+					present.add(rel_path)
+					changed |= self._put(rel_path, entry.stat(), parsed)
+
+				# Recordings that disappeared from this directory
+				dir_key = "" if rel_dir == "." else rel_dir
+				for rel_path in [p for p in self._recordings if os.path.dirname(p) == dir_key]:
+					if rel_path not in present:
+						changed |= self._drop(rel_path)
+
+				self._dirs[rel_dir] = {"mtime": dir_mtime, "subdirs": subdirs}
+				changed = True
+				stack.extend(subdirs)
+
+			# Whole directories that were removed
+			for rel_dir in [d for d in self._dirs if d not in seen_dirs]:
+				del self._dirs[rel_dir]
+				prefix = rel_dir + os.sep
+				for rel_path in [p for p in self._recordings if p.startswith(prefix)]:
+					self._drop(rel_path)
+				changed = True
+
+			if changed:
+				self.save()
+			return changed
+
+	def mark_uploaded(self, path, remote_hash=None, codec=None, save=True):
+		"""Record that `path` is on the server with content hash `remote_hash`, compressed with `codec`."""
+		with self._lock:
+			entry = self._recordings.get(self._rel(path))
+			if entry is None:
+				return False
+			entry["uploaded"] = True
+			entry["remote_hash"] = remote_hash
+			entry["remote_codec"] = codec
+			if save:
+				self.save()
+			return True
+
+	#--------------------------------------------------------------------
+	#----Lookups
+
+	def counts(self, user_id):
+		"""(left, center, right) recording counts for a user."""
+		with self._lock:
+			counts = self._counts.get(str(user_id), {})
+			return tuple(counts.get(label, 0) for label in LCR_LABELS)
+
+	def total_bytes(self, user_id):
+		with self._lock:
+			return self._bytes.get(str(user_id), 0)
+
+	def total_seconds(self, user_id):
+		with self._lock:
+			return self._seconds.get(str(user_id), 0.0)
+
+	def most_recent(self, user_id):
+		"""Absolute path of the user's newest recording, or None."""
+		with self._lock:
+			by_time = self._by_time.get(str(user_id))
+			if not by_time:
+				return None
+			return os.path.join(self.base_folder, by_time[-1][1])
+
+	def upload_record(self, path):
+		"""(SHA-256, codec) of the content last uploaded for this recording; (None, None) if never."""
+		with self._lock:
+			entry = self._recordings.get(self._rel(path))
+			if entry is None:
+				return None, None
+			# Indexes written before codecs were recorded only held raw uploads
+			return entry["remote_hash"], entry.get("remote_codec")
+
+	def relative_path(self, path):
+		return self._rel(path)
+
+	def pending_uploads(self, user_id=None):
+		"""Absolute paths of recordings not uploaded yet, oldest first."""
+		with self._lock:
+			pending = [
+				(entry["timestamp"], rel_path)
+				for rel_path, entry in self._recordings.items()
+				if not entry["uploaded"] and (user_id is None or entry["user"] == str(user_id))
+			]
+		return [os.path.join(self.base_folder, rel_path) for _, rel_path in sorted(pending)]
+
+	#--------------------------------------------------------------------
+	#----Housekeeping
+
+	def delete_most_recent(self, user_id):
+		"""Delete the user's newest recording from disk and the index; returns its path or None."""
+		with self._lock:
+			path = self.most_recent(user_id)
+			if path is None:
+				return None
+			try:
+				os.remove(path)
+			except FileNotFoundError:
+				pass
+			self._drop(self._rel(path))
+			self.save()
+			return path
+
+	def delete_empty_folders(self):
+		"""Remove session folders that hold no recordings (os.rmdir refuses non-empty ones)."""
+		with self._lock:
+			occupied = {os.path.dirname(p) for p in self._recordings}
+			removed = []
+			# Deepest first, so parents emptied by the removal are handled too
+			for rel_dir in sorted(self._dirs, key=len, reverse=True):
+				if rel_dir == "." or rel_dir in occupied:
+					continue
+				try:
+					os.rmdir(os.path.join(self.base_folder, rel_dir))
+					removed.append(rel_dir)
+				except OSError:
+					continue
+			if removed:
+				self.sync()
+			return removed
@@ -0,0 +1,760 @@
+"""
+Cloud_Utils.py
+
+Upload side of the BMI Trainer cloud sync.
+
+  - CloudConfig  : host, port, protocol and credentials of the cloud
+                   server, shared by CloudConnection, the transports and
+                   the connectivity probe.
+  - FTPTransport : one ftplib connection with the few operations the sync
+                   needs (size, makedirs, resumable store, rename);
+                   FTPSTransport is the same over explicit TLS. Any object
+                   with the same methods can be used instead, e.g. for a
+                   local stand-in server (pyftpdlib) in testing.
+  - TransportPool : logged-in transports for one CloudConfig, kept open
+                   between runs so pressing Upload or Download again does
+                   not log every worker in again.
+  - SyncUploader : delta upload of the recordings in a RecordingCatalog.
+                   Only files whose content hash differs from the last
+                   upload are sent, over a small pool of connections.
+                   Each file goes to "<name>.part" first and is renamed
+                   when complete, so an interrupted transfer resumes from
+                   the bytes already on the server (APPE) on the next try
+                   or the next press of Upload.
+  - UploadStream : file-like view of a recording, compressed on the fly
+                   (zstd when the zstandard package is installed, gzip
+                   otherwise), so CSVs are never compressed to disk first.
+                   Remote files get the codec's suffix (.csv.zst / .csv.gz).
+  - ModelFetcher : download side. Reads a small manifest next to the remote
+                   model files and fetches only files whose SHA-256 differs
+                   from the local copy, into a temp file that is verified
+                   and then swapped in with os.replace (never a torn model).
+  - ConnectivityMonitor : background TCP probes (internet, cloud server)
+                   with TTL-cached status and latency stats, plus one warm
+                   cloud session shared by the scenes, so nothing on the
+                   UI thread waits on the network.
+"""
+
+import ftplib
+import hashlib
+import json
+import os
+import posixpath
+import socket
+import threading
+import time
+import zlib
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+	import zstandard
+except ImportError:  # optional; uploads fall back to gzip
+	zstandard = None
+
+DEFAULT_WORKERS = 3
+DEFAULT_RETRIES = 3
+BLOCK_SIZE = 64 * 1024
+PART_SUFFIX = ".part"
+
+# codec -> (remote suffix, default level)
+CODECS = {
+	"gzip": (".gz", 6),
+	"zstd": (".zst", 3),
+}
+
+DOWNLOAD_SUFFIX = ".download"
+MANIFEST_NAME = "manifest.json"
+
+SyncResult = namedtuple("SyncResult", ["uploaded", "skipped", "failed", "bytes_sent", "elapsed"])
+FetchResult = namedtuple("FetchResult", ["updated", "unchanged", "bytes_received", "elapsed"])
+ProbeStatus = namedtuple("ProbeStatus", ["ok", "latency", "checked_at"])
+
+
+def throughput(result):
+	"""Average upload rate of a SyncResult in bytes per second."""
+	return result.bytes_sent / result.elapsed if result.elapsed > 0 else 0.0
+
+
+def file_sha256(path):
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(BLOCK_SIZE), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def resolve_codec(compression="auto"):
+	"""Map a compression setting ("auto", "zstd", "gzip" or None) to the codec that will be used."""
+	if compression == "auto":
+		return "zstd" if zstandard is not None else "gzip"
+	if compression == "zstd" and zstandard is None:
+		raise ValueError("zstd compression needs the zstandard package")
+	if compression is not None and compression not in CODECS:
+		raise ValueError(f"Unknown compression: {compression}")
+	return compression
+
+
+class UploadStream:
+	"""
+	Read-only file object yielding the bytes of `path` as uploaded: compressed
+	with `codec`, or unchanged when codec is None.
+
+	The output is deterministic for a given file, codec and level (the gzip
+	header carries no timestamp), which is what lets an interrupted upload
+	resume: skip() regenerates and drops the bytes the server already has.
+	"""
+
+	def __init__(self, path, codec=None, level=None):
+		self._file = open(path, "rb")
+		if codec is not None and level is None:
+			level = CODECS[codec][1]
+		if codec is None:
+			self._compressor = None
+		elif codec == "zstd":
+			self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+		else:
+			# wbits 31 = gzip container, header mtime left at 0
+			self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+		self._buffer = b""
+		self._eof = False
+		self.produced = 0
+
+	def _fill(self, size):
+		while len(self._buffer) < size and not self._eof:
+			chunk = self._file.read(BLOCK_SIZE)
+			if self._compressor is None:
+				self._buffer += chunk
+				self._eof = not chunk
+			elif chunk:
+				self._buffer += self._compressor.compress(chunk)
+			else:
+				self._buffer += self._compressor.flush()
+				self._eof = True
+
+	def read(self, size=-1):
+		if size is None or size < 0:
+			self._fill(float("inf"))
+			size = len(self._buffer)
+		else:
+			self._fill(size)
+		data, self._buffer = self._buffer[:size], self._buffer[size:]
+		self.produced += len(data)
+		return data
+
+	def skip(self, count):
+		"""Drop `count` bytes of output; returns how many were actually available."""
+		skipped = 0
+		while skipped < count:
+			data = self.read(min(BLOCK_SIZE, count - skipped))
+			if not data:
+				break
+			skipped += len(data)
+		return skipped
+
+	def close(self):
+		self._file.close()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		self.close()
+
+
+# Where and how to reach the cloud server; see open_transport for the protocols
+CloudConfig = namedtuple("CloudConfig", ["host", "port", "protocol", "user", "password"])
+
+
+class FTPTransport:
+	"""Single FTP connection; not thread-safe, SyncUploader keeps one per worker."""
+
+	def __init__(self, host, port, user, password, timeout=30):
+		self.host = host
+		self.user = user
+		self.password = password
+		self.port = port
+		self.timeout = timeout
+		self._ftp = None
+		self._known_dirs = set()
+
+	def _new_client(self):
+		return ftplib.FTP()
+
+	def connect(self):
+		self._ftp = self._new_client()
+		self._ftp.connect(self.host, self.port, timeout=self.timeout)
+		self._ftp.login(self.user, self.password)
+		self._ftp.voidcmd("TYPE I")
+		return self
+
+	def noop(self):
+		"""Cheap round trip; raises when the connection is gone."""
+		self._ftp.voidcmd("NOOP")
+
+	def close(self):
+		if self._ftp is not None:
+			try:
+				self._ftp.quit()
+			except (ftplib.all_errors):
+				self._ftp.close()
+		self._ftp = None
+
+	def size(self, remote_path):
+		"""Size of a remote file in bytes, or None when it does not exist."""
+		try:
+			return self._ftp.size(remote_path)
+		except ftplib.error_perm:
+			return None
+
+	def makedirs(self, remote_dir):
+		parts = [p for p in remote_dir.split("/") if p]
+		path = ""
+		for part in parts:
+			path += "/" + part
+			if path in self._known_dirs:
+				continue
+			try:
+				self._ftp.mkd(path)
+			except ftplib.error_perm:
+				pass  # already exists
+			self._known_dirs.add(path)
+
+	def store(self, fileobj, remote_path, offset=0, callback=None):
+		"""Upload fileobj (already positioned at `offset`); appends to the remote file when offset > 0."""
+		command = f"APPE {remote_path}" if offset else f"STOR {remote_path}"
+		self._ftp.storbinary(command, fileobj, blocksize=BLOCK_SIZE, callback=callback)
+
+	def retrieve(self, remote_path, callback):
+		"""Download a remote file, passing each received block to callback."""
+		self._ftp.retrbinary(f"RETR {remote_path}", callback, blocksize=BLOCK_SIZE)
+
+	def delete(self, remote_path):
+		try:
+			self._ftp.delete(remote_path)
+		except ftplib.error_perm:
+			pass
+
+	def rename(self, remote_from, remote_to):
+		# RNTO does not overwrite on every server
+		self.delete(remote_to)
+		self._ftp.rename(remote_from, remote_to)
+
+
+class FTPSTransport(FTPTransport):
+	"""FTPTransport over explicit TLS (AUTH TLS), with the data channel encrypted too."""
+
+	def _new_client(self):
+		return ftplib.FTP_TLS()
+
+	def connect(self):
+		super().connect()
+		self._ftp.prot_p()
+		return self
+
+
+# CloudConfig.protocol -> transport class
+TRANSPORTS = {
+	"ftp": FTPTransport,
+	"ftps": FTPSTransport,
+}
+
+
+def open_transport(config):
+	"""Unconnected transport for a CloudConfig."""
+	transport_class = TRANSPORTS.get(config.protocol)
+	if transport_class is None:
+		raise ValueError(f"Unsupported cloud protocol: {config.protocol!r} "
+						 f"(supported: {', '.join(sorted(TRANSPORTS))})")
+	return transport_class(config.host, config.port, config.user, config.password)
+
+
+class TransportPool:
+	"""
+	Connected transports for one CloudConfig, reused across SyncUploader and
+	ModelFetcher runs. acquire() hands out an idle transport after a NOOP
+	check (or logs in a new one); release() returns it, or closes it when
+	`broken` or when `max_idle` are already waiting. Idle transports older
+	than `idle_timeout` are closed rather than reused, since servers drop
+	idle control connections.
+	"""
+
+	def __init__(self, config, max_idle=DEFAULT_WORKERS, idle_timeout=60.0):
+		open_transport(config)  # fail early on an unsupported protocol
+		self.config = config
+		self.max_idle = max_idle
+		self.idle_timeout = idle_timeout
+		self._idle = []                 # (released_at, transport)
+		self._lock = threading.Lock()
+
+	def acquire(self):
+		while True:
+			with self._lock:
+				if not self._idle:
+					break
+				released_at, transport = self._idle.pop()
+			if time.monotonic() - released_at < self.idle_timeout:
+				try:
+					transport.noop()
+					return transport
+				except ftplib.all_errors:
+					pass
+			transport.close()
+		return open_transport(self.config).connect()
+
+	def release(self, transport, broken=False):
+		if not broken:
+			with self._lock:
+				if len(self._idle) < self.max_idle:
+					self._idle.append((time.monotonic(), transport))
+					return
+		transport.close()
+
+	def close(self):
+		with self._lock:
+			idle, self._idle = self._idle, []
+		for _, transport in idle:
+			transport.close()
+
+
+class SyncUploader:
+	"""
+	Upload the recordings a RecordingCatalog reports as pending.
+
+	`transports` is the TransportPool the worker connections come from.
+	Remote paths mirror the catalog's relative paths under remote_root, plus
+	the codec suffix when `compression` is set ("auto" picks zstd if
+	available, else gzip; None uploads the raw CSV).
+
+	The catalog records the hash and codec of each upload; a pending file is
+	skipped only when both match. Re-sending with another codec removes the
+	copy under the old name. Recordings the catalog has no upload record for
+	(e.g. uploaded as raw CSV before the catalog existed) are first looked up
+	on the server: a raw copy of the same size is adopted as uploaded instead
+	of being sent again next to it.
+	"""
+
+	# Connection and transfer errors that are worth a reconnect and retry
+	TRANSIENT_ERRORS = ftplib.all_errors
+
+	def __init__(self, transports, catalog, remote_root,
+				 workers=DEFAULT_WORKERS, retries=DEFAULT_RETRIES, save_interval=2.0,
+				 compression="auto", level=None):
+		self.transports = transports
+		self.codec = resolve_codec(compression)
+		self.level = level
+		self.catalog = catalog
+		self.remote_root = remote_root.rstrip("/")
+		self.workers = workers
+		self.retries = retries
+		self.save_interval = save_interval
+		self._local = threading.local()
+		self._transports = []
+		self._lock = threading.Lock()
+		self._bytes_sent = 0
+		self._last_save = 0.0
+
+	def remote_path(self, local_path):
+		return self._remote_path(local_path, self.codec)
+
+	def _remote_path(self, local_path, codec):
+		rel_path = self.catalog.relative_path(local_path)
+		remote_path = posixpath.join(self.remote_root, *rel_path.split(os.sep))
+		if codec is not None:
+			remote_path += CODECS[codec][0]
+		return remote_path
+
+	def _open_source(self, local_path):
+		return UploadStream(local_path, self.codec, self.level)
+
+	def _transport(self, reconnect=False):
+		transport = getattr(self._local, "transport", None)
+		if transport is not None and reconnect:
+			with self._lock:
+				self._transports.remove(transport)
+			self.transports.release(transport, broken=True)
+			transport = None
+		if transport is None:
+			transport = self.transports.acquire()
+			self._local.transport = transport
+			with self._lock:
+				self._transports.append(transport)
+		return transport
+
+	def _count_bytes(self, block):
+		with self._lock:
+			self._bytes_sent += len(block)
+
+	def _mark_uploaded(self, local_path, digest, codec):
+		self.catalog.mark_uploaded(local_path, digest, codec, save=False)
+		now = time.monotonic()
+		with self._lock:
+			due = now - self._last_save >= self.save_interval
+			if due:
+				self._last_save = now
+		if due:
+			self.catalog.save()
+
+	def _upload_file(self, local_path):
+		"""Returns "uploaded" or "skipped"; raises after the last failed retry."""
+		digest = file_sha256(local_path)
+		remote_hash, remote_codec = self.catalog.upload_record(local_path)
+		if digest == remote_hash and remote_codec == self.codec:
+			self._mark_uploaded(local_path, digest, self.codec)
+			return "skipped"
+
+		remote_path = self.remote_path(local_path)
+		part_path = remote_path + PART_SUFFIX
+
+		for attempt in range(self.retries + 1):
+			try:
+				transport = self._transport(reconnect=attempt > 0)
+				if remote_hash is None:
+					# Never uploaded through the catalog; adopt an existing raw copy
+					raw_path = self._remote_path(local_path, None)
+					if transport.size(raw_path) == os.path.getsize(local_path):
+						self._mark_uploaded(local_path, digest, None)
+						return "skipped"
+				transport.makedirs(posixpath.dirname(remote_path))
+
+				# Resume from what the server already has of the partial file.
+				# Compressed output is regenerated and the uploaded prefix skipped.
+				offset = transport.size(part_path) or 0
+				with self._open_source(local_path) as source:
+					if offset and source.skip(offset) < offset:
+						# Server copy is longer than ours: not a prefix, start over
+						transport.delete(part_path)
+						raise OSError(f"Stale partial upload for {remote_path}")
+					transport.store(source, part_path, offset=offset, callback=self._count_bytes)
+					expected_size = source.produced
+
+				remote_size = transport.size(part_path)
+				if remote_size is not None and remote_size != expected_size:
+					# Corrupt partial upload; start over on the next attempt
+					transport.delete(part_path)
+					raise OSError(f"Size mismatch for {remote_path}: {remote_size} != {expected_size}")
+				transport.rename(part_path, remote_path)
+				if remote_hash is not None and remote_codec != self.codec:
+					# Replaces the copy uploaded with the previous codec
+					transport.delete(self._remote_path(local_path, remote_codec))
+				self._mark_uploaded(local_path, digest, self.codec)
+				return "uploaded"
+			except self.TRANSIENT_ERRORS as e:
+				if attempt == self.retries:
+					raise
+				print(f"[WARN] Upload of {os.path.basename(local_path)} interrupted ({e}), retrying")
+				time.sleep(min(2 ** attempt, 8))
+
+	def run(self, user_id=None, progress=None):
+		"""
+		Upload every pending recording (of one user, if given) and return a
+		SyncResult. `progress(done, total, bytes_sent)` is called from the
+		worker threads after each file.
+		"""
+		self.catalog.sync()
+		pending = self.catalog.pending_uploads(user_id)
+		self._local = threading.local()
+		self._bytes_sent = 0
+		self._last_save = time.monotonic()
+		counts = {"uploaded": 0, "skipped": 0, "failed": 0}
+		start = time.perf_counter()
+
+		try:
+			with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="SyncUploader") as pool:
+				futures = {pool.submit(self._upload_file, path): path for path in pending}
+				for done, future in enumerate(as_completed(futures), start=1):
+					try:
+						counts[future.result()] += 1
+					except (OSError, *self.TRANSIENT_ERRORS) as e:
+						counts["failed"] += 1
+						print(f"[ERROR] Upload failed for {futures[future]}: {e}")
+					if progress is not None:
+						progress(done, len(pending), self._bytes_sent)
+		finally:
+			# Back to the pool, still logged in for the next run
+			for transport in self._transports:
+				self.transports.release(transport)
+			self._transports = []
+			self.catalog.save()
+
+		return SyncResult(counts["uploaded"], counts["skipped"], counts["failed"],
+						  self._bytes_sent, time.perf_counter() - start)
+
+
+class ModelFetcher:
+	"""
+	Conditional download of the model files under remote_root.
+
+	The server publishes remote_root/manifest.json:
+
+		{"files": {"model_2x.pkl": {"sha256": "<hex>", "size": 735123}}}
+
+	fetch() downloads only the listed files whose local SHA-256 differs,
+	verifies size and hash, and atomically replaces the local file. A
+	running predictor needs no notification: ABMI_Utils_2x.loadModel caches
+	by file mtime, so the next prediction loads the swapped-in model.
+	"""
+
+	def __init__(self, transports, remote_root, local_root="Model/",
+				 retries=DEFAULT_RETRIES):
+		self.transports = transports
+		self.remote_root = remote_root.rstrip("/")
+		self.local_root = local_root
+		self.retries = retries
+		self._transport = None
+
+	def _connection(self, reconnect=False):
+		if self._transport is not None and reconnect:
+			self.transports.release(self._transport, broken=True)
+			self._transport = None
+		if self._transport is None:
+			self._transport = self.transports.acquire()
+		return self._transport
+
+	def _download(self, remote_path, local_path):
+		"""Retrieve into local_path; returns (bytes, sha256 hex)."""
+		digest = hashlib.sha256()
+		size = 0
+		with open(local_path, "wb") as f:
+			def write(block):
+				nonlocal size
+				f.write(block)
+				digest.update(block)
+				size += len(block)
+			self._connection().retrieve(remote_path, write)
+			f.flush()
+			os.fsync(f.fileno())
+		return size, digest.hexdigest()
+
+	def read_manifest(self):
+		"""The remote manifest's file table, or None when the server has no manifest."""
+		remote_path = posixpath.join(self.remote_root, MANIFEST_NAME)
+		if self._connection().size(remote_path) is None:
+			return None
+		chunks = []
+		self._connection().retrieve(remote_path, chunks.append)
+		files = json.loads(b"".join(chunks).decode("utf-8")).get("files", {})
+		for name in files:
+			# Manifest names are plain file names inside local_root
+			if posixpath.basename(name) != name or name in ("", ".", ".."):
+				raise ValueError(f"Invalid file name in model manifest: {name!r}")
+		return files
+
+	def _fetch_file(self, name, expected):
+		local_path = os.path.join(self.local_root, name)
+		tmp_path = local_path + DOWNLOAD_SUFFIX
+		remote_path = posixpath.join(self.remote_root, name)
+
+		for attempt in range(self.retries + 1):
+			try:
+				if attempt:
+					self._connection(reconnect=True)
+				size, digest = self._download(remote_path, tmp_path)
+				if digest != expected["sha256"] or ("size" in expected and size != expected["size"]):
+					raise OSError(f"Checksum mismatch for {name}")
+				os.replace(tmp_path, local_path)
+				return size
+			except ftplib.all_errors as e:
+				if attempt == self.retries:
+					raise
+				print(f"[WARN] Download of {name} interrupted ({e}), retrying")
+				time.sleep(min(2 ** attempt, 8))
+			finally:
+				if os.path.exists(tmp_path):
+					os.remove(tmp_path)
+
+	def fetch(self):
+		"""Bring local_root up to date; returns a FetchResult, or None without a remote manifest."""
+		start = time.perf_counter()
+		updated, unchanged = [], []
+		received = 0
+		try:
+			files = self.read_manifest()
+			if files is None:
+				return None
+			os.makedirs(self.local_root, exist_ok=True)
+			for name, expected in sorted(files.items()):
+				local_path = os.path.join(self.local_root, name)
+				if os.path.exists(local_path) and file_sha256(local_path) == expected["sha256"]:
+					unchanged.append(local_path)
+					continue
+				received += self._fetch_file(name, expected)
+				updated.append(local_path)
+		finally:
+			if self._transport is not None:
+				self.transports.release(self._transport)
+				self._transport = None
+
+		return FetchResult(updated, unchanged, received, time.perf_counter() - start)
+
+
+def probe(host, port, timeout=2.0):
+	"""TCP connect to host:port; returns the connect time in seconds, or None on failure."""
+	start = time.perf_counter()
+	try:
+		# Timeout applies to this socket only, not process-wide
+		with socket.create_connection((host, port), timeout=timeout):
+			return time.perf_counter() - start
+	except OSError:
+		return None
+
+
+class LockedSession:
+	"""Proxy that serializes method calls on a connection shared between threads."""
+
+	def __init__(self, connection):
+		self._connection = connection
+		self._lock = threading.Lock()
+
+	def __getattr__(self, name):
+		attr = getattr(self._connection, name)
+		if not callable(attr):
+			return attr
+
+		def call(*args, **kwargs):
+			with self._lock:
+				return attr(*args, **kwargs)
+		return call
+
+
+class ConnectivityMonitor:
+	"""
+	Probes each (host, port) in `probes` from a background thread.
+
+	status(name) returns the last ProbeStatus while it is younger than
+	`ttl`, else None ("unknown, still checking"). Probes repeat every
+	`retry_interval` while any target is down and every `interval` when all
+	are up; request() asks for an immediate round.
+
+	With a `session_factory` (a callable returning a connected cloud
+	connection), the monitor also keeps one session open once the "cloud"
+	probe succeeds; session() hands it out without blocking. Each round,
+	`session_check(session)` (a cheap call that raises when the connection
+	is dead) keeps it alive; on failure it is dropped and reconnected.
+	"""
+
+	def __init__(self, probes, session_factory=None, session_check=None, interval=15.0,
+				 retry_interval=3.0, ttl=30.0, timeout=2.0, history=20):
+		self.probes = dict(probes)
+		self.session_factory = session_factory
+		self.session_check = session_check
+		self.interval = interval
+		self.retry_interval = retry_interval
+		self.ttl = ttl
+		self.timeout = timeout
+		self._status = {}
+		self._latencies = {name: deque(maxlen=history) for name in self.probes}
+		self._failures = {name: 0 for name in self.probes}
+		self._session = None
+		self._lock = threading.Lock()
+		self._wake = threading.Event()
+		self._stop_event = threading.Event()
+		self._thread = None
+
+	def start(self):
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._run, name="ConnectivityMonitor", daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		self._stop_event.set()
+		self._wake.set()
+		if self._thread is not None:
+			self._thread.join(timeout=1)
+		self._thread = None
+
+	def request(self):
+		"""Probe again as soon as possible (e.g. when a scene that needs the network opens)."""
+		self._wake.set()
+
+	def _probe_all(self):
+		all_ok = True
+		for name, (host, port) in self.probes.items():
+			latency = probe(host, port, self.timeout)
+			with self._lock:
+				self._status[name] = ProbeStatus(latency is not None, latency, time.monotonic())
+				if latency is None:
+					self._failures[name] += 1
+					all_ok = False
+				else:
+					self._latencies[name].append(latency)
+		return all_ok
+
+	def _ensure_session(self):
+		"""Check or (re)open the shared session; returns False while there is none."""
+		if self.session_factory is None:
+			return True
+		with self._lock:
+			session = self._session
+		if session is not None:
+			if self.session_check is None:
+				return True
+			try:
+				self.session_check(session)
+				return True
+			except Exception as e:
+				print(f"[WARN] Cloud session lost, reconnecting: {e}")
+				with self._lock:
+					if self._session is session:
+						self._session = None
+		cloud = self.status("cloud")
+		if cloud is not None and not cloud.ok:
+			return False
+		try:
+			session = LockedSession(self.session_factory())
+		except Exception as e:
+			print(f"[WARN] Cloud session failed: {e}")
+			return False
+		with self._lock:
+			self._session = session
+		return True
+
+	def _run(self):
+		while not self._stop_event.is_set():
+			all_ok = self._probe_all()
+			all_ok = self._ensure_session() and all_ok
+			self._wake.wait(self.interval if all_ok else self.retry_interval)
+			self._wake.clear()
+
+	def status(self, name):
+		with self._lock:
+			status = self._status.get(name)
+		if status is None or time.monotonic() - status.checked_at > self.ttl:
+			return None
+		return status
+
+	def latency_stats(self, name):
+		"""Connect latency over the recent successful probes, in milliseconds."""
+		with self._lock:
+			samples = list(self._latencies[name])
+			failures = self._failures[name]
+		if not samples:
+			return {"samples": 0, "failures": failures}
+		return {
+			"samples": len(samples),
+			"failures": failures,
+			"min_ms": 1000 * min(samples),
+			"mean_ms": 1000 * sum(samples) / len(samples),
+			"max_ms": 1000 * max(samples),
+		}
+
+	def session(self):
+		"""The warm cloud session, or None while it is not connected yet (never blocks)."""
+		with self._lock:
+			session = self._session
+		if session is None:
+			self.request()
+		return session
+
+	def drop_session(self, session=None):
+		"""
+		Forget a session that failed; the monitor reconnects on its next round.
+		With `session`, only drops it if it is still the current one, so a
+		late failure on an old session cannot discard its replacement.
+		"""
+		with self._lock:
+			if session is not None and session is not self._session:
+				return
+			self._session = None
+		self.request()
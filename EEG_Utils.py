@@ -0,0 +1,529 @@
+"""
+EEG_Utils.py
+
+Process-isolated acquisition for the OpenBCI board (ABMI_Utils.BCIBoard).
+
+In daemon mode the board is opened, streamed and recorded in its own process,
+so pygame rendering, prediction (sosfiltfilt) and the UI loop can no longer
+hold the GIL while samples are read or labels are stamped.
+
+  - EEGRingBuffer      : preallocated single-writer ring of EEG rows with a
+                         windowed, zero-copy read API (latest(n), since(seq)).
+  - SharedRingBuffer   : the same ring in shared memory.
+  - BoardSampleBuffer  : in-process ring fed from a BCIBoard, for runs
+                         without the acquisition daemon.
+
+Both rings are filled where the board decodes a sample: the board class is
+wrapped so that every assignment to board._last_data_frame also appends the
+frame to the ring, so a burst of frames decoded between two polls is not
+lost. Polling _last_data_frame remains only as a fallback for boards that
+cannot be wrapped.
+  - AcquisitionService : owns the acquisition process and the shared memory.
+  - AcquisitionClient  : board-compatible proxy used by the UI process. It can
+                         be passed anywhere a BCIBoard is expected
+                         (startSingleTrainingSequence, handleRecording, ...).
+
+Labels: `stimulus_sound` / `sequence_id` live in shared integers. Inside the
+acquisition process the board class is wrapped so that reading
+board.stimulus_sound reads the shared value directly, i.e. the label is
+stamped at ingest time by the process that owns the samples.
+
+The service uses the "fork" start method (the B2J scripts are not import-safe
+for "spawn"), so start it before pygame.init().
+"""
+
+import multiprocessing as mp
+import threading
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+SAMPLE_RATE = 250
+NUM_CHANNELS = 8
+COLUMNS = ["Timestamp"] + [f"Ch{i}" for i in range(1, NUM_CHANNELS + 1)] + ["Label", "Seq"]
+NUM_COLUMNS = len(COLUMNS)
+CHANNEL_COLUMNS = slice(1, NUM_CHANNELS + 1)
+LABEL_COLUMN = COLUMNS.index("Label")
+SEQ_COLUMN = COLUMNS.index("Seq")
+
+DEFAULT_BUFFER_SECONDS = 60
+INGEST_POLL_S = 0.0005
+
+# Shared header (int64): samples written, samples dropped
+_HEADER_WRITE_COUNT = 0
+_HEADER_DROPPED = 1
+_HEADER_FIELDS = 4
+_HEADER_BYTES = _HEADER_FIELDS * 8
+
+# Shared status flags (AcquisitionService._flags)
+_FLAG_CONNECTED = 0
+_FLAG_STREAMING = 1
+_FLAG_RECORDING = 2
+_FLAG_RUNNING = 3
+
+
+class EEGRingBuffer:
+	"""
+	Fixed-capacity, preallocated ring of (Timestamp, Ch1..Ch8, Label, Seq)
+	rows. One thread/process appends, any number of readers use the windowed
+	read API:
+
+		latest(n)   -> view of the newest n rows (oldest first)
+		since(seq)  -> (view of rows with sample number >= seq, next seq)
+
+	Every row is stored twice (at i and i + capacity), so any window of up to
+	`capacity` rows is one contiguous slice and both calls return views, never
+	copies. Views stay valid until the writer laps them; copy a window that
+	has to outlive `capacity - len(window)` further samples.
+
+	Sample numbers ("seq" in since()) count every appended row from 0 and are
+	unrelated to the stimulus Seq column.
+	"""
+
+	def __init__(self, capacity, buffer=None):
+		self.capacity = int(capacity)
+		if buffer is None:
+			buffer = bytearray(self.nbytes(self.capacity))
+		self._header = np.ndarray((_HEADER_FIELDS,), dtype=np.int64, buffer=buffer)
+		self._data = np.ndarray(
+			(2 * self.capacity, NUM_COLUMNS), dtype=np.float64,
+			buffer=buffer, offset=_HEADER_BYTES)
+
+	@staticmethod
+	def nbytes(capacity):
+		return _HEADER_BYTES + 2 * int(capacity) * NUM_COLUMNS * 8
+
+	@property
+	def write_count(self):
+		return int(self._header[_HEADER_WRITE_COUNT])
+
+	@property
+	def dropped(self):
+		return int(self._header[_HEADER_DROPPED])
+
+	def add_dropped(self, count):
+		self._header[_HEADER_DROPPED] += count
+
+	def append(self, row):
+		count = int(self._header[_HEADER_WRITE_COUNT])
+		index = count % self.capacity
+		self._data[index] = row
+		self._data[index + self.capacity] = row
+		# Publish only after both copies are written
+		self._header[_HEADER_WRITE_COUNT] = count + 1
+
+	def _window(self, first, count):
+		start = first % self.capacity
+		return self._data[start:start + (count - first)]
+
+	def latest(self, n=1):
+		"""Zero-copy view of the most recent n rows (oldest first)."""
+		count = self.write_count
+		n = max(0, min(int(n), count, self.capacity))
+		return self._window(count - n, count)
+
+	def since(self, seq):
+		"""
+		Zero-copy view of every row with sample number >= seq, plus the seq to
+		pass next time. Rows already overwritten are skipped; a reader that
+		fell behind sees len(view) < next_seq - seq.
+		"""
+		count = self.write_count
+		first = min(max(int(seq), count - self.capacity, 0), count)
+		return self._window(first, count), count
+
+	@staticmethod
+	def channels(window):
+		"""Ch1..Ch8 columns of a window (still a view)."""
+		return window[:, CHANNEL_COLUMNS]
+
+	@staticmethod
+	def labels(window):
+		return window[:, LABEL_COLUMN]
+
+
+class SharedRingBuffer(EEGRingBuffer):
+	"""EEGRingBuffer whose storage is a multiprocessing shared-memory block."""
+
+	def __init__(self, capacity, name=None, create=False):
+		self._shm = shared_memory.SharedMemory(
+			name=name, create=create, size=EEGRingBuffer.nbytes(capacity))
+		self._owner = create
+		super().__init__(capacity, buffer=self._shm.buf)
+		if create:
+			self._header[:] = 0
+			self._data[:] = 0
+
+	@property
+	def name(self):
+		return self._shm.name
+
+	def close(self):
+		# Drop our views before releasing the mapping
+		self._header = None
+		self._data = None
+		self._shm.close()
+		if self._owner:
+			self._shm.unlink()
+
+
+class FrameIngest:
+	"""
+	Turns board frames into ring rows.
+
+	ingest() is called with every frame the board decodes (see
+	_frame_sink_board), or polled with the board's most recent one as a
+	fallback. Each new frame is appended once (keyed by its timestamp)
+	stamped with the current label / stimulus sequence, and timestamp gaps
+	are counted as dropped samples. The lock keeps the ring single-writer
+	when the push and the fallback poll overlap.
+	"""
+
+	def __init__(self, ring):
+		self.ring = ring
+		self.last_timestamp = None
+		self.max_gap = 1.5 / SAMPLE_RATE
+		self.pushed = 0
+		self._lock = threading.Lock()
+
+	def ingest(self, frame, label, seq):
+		if frame is None or len(frame) <= NUM_CHANNELS:
+			return False
+
+		with self._lock:
+			timestamp = float(frame[0])
+			if timestamp == self.last_timestamp:
+				return False
+
+			if self.last_timestamp is not None and timestamp - self.last_timestamp > self.max_gap:
+				self.ring.add_dropped(int(round((timestamp - self.last_timestamp) * SAMPLE_RATE)) - 1)
+			self.last_timestamp = timestamp
+
+			row = list(frame[:NUM_CHANNELS + 1])
+			row.append(label)
+			row.append(seq)
+			self.ring.append(row)
+			return True
+
+	def push(self, frame, label, seq):
+		"""ingest() called from the board's decode path."""
+		self.pushed += 1
+		return self.ingest(frame, label, seq)
+
+
+def _frame_sink_board(board_cls, sink):
+	"""Subclass board_cls so every frame stored in _last_data_frame is also passed to sink(board, frame)."""
+
+	def _get_frame(self):
+		return self.__dict__.get("_last_data_frame")
+
+	def _set_frame(self, frame):
+		self.__dict__["_last_data_frame"] = frame
+		sink(self, frame)
+
+	return type(
+		"Ring" + board_cls.__name__,
+		(board_cls,),
+		{"_last_data_frame": property(_get_frame, _set_frame)})
+
+
+class BoardSampleBuffer:
+	"""
+	In-process ring buffer fed from a BCIBoard, for runs without the
+	acquisition daemon. Exposes the same latest()/since() API as
+	AcquisitionClient, so previews, online features and impedance views do
+	not care which mode is active.
+
+	start() switches the board to a _frame_sink_board subclass, so frames
+	are appended by the board's own reader as they are decoded; only a board
+	whose class cannot be switched is polled from a background thread.
+	"""
+
+	def __init__(self, board, buffer_seconds=DEFAULT_BUFFER_SECONDS, poll_interval=0.002):
+		self.board = board
+		self.ring = EEGRingBuffer(int(buffer_seconds * SAMPLE_RATE))
+		self.poll_interval = poll_interval
+		self._ingest = FrameIngest(self.ring)
+		self._board_cls = None
+		self._stop_event = threading.Event()
+		self._thread = None
+
+	def _push(self, board, frame):
+		self._ingest.push(frame, getattr(board, "stimulus_sound", 0), getattr(board, "sequence_id", 0))
+
+	def start(self):
+		if self._board_cls is not None or (self._thread is not None and self._thread.is_alive()):
+			return self
+		board_cls = type(self.board)
+		try:
+			self.board.__class__ = _frame_sink_board(board_cls, self._push)
+			self._board_cls = board_cls
+			return self
+		except TypeError as e:
+			print(f"[WARN] Cannot hook board frames, polling instead: {e}")
+		self._stop_event.clear()
+		self._thread = threading.Thread(target=self._run, name="BoardSampleBuffer", daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		if self._board_cls is not None:
+			self.board.__class__ = self._board_cls
+			self._board_cls = None
+		self._stop_event.set()
+		if self._thread is not None:
+			self._thread.join(timeout=1)
+		self._thread = None
+
+	def _run(self):
+		board = self.board
+		while not self._stop_event.is_set():
+			self._ingest.ingest(
+				getattr(board, "_last_data_frame", None),
+				getattr(board, "stimulus_sound", 0),
+				getattr(board, "sequence_id", 0))
+			self._stop_event.wait(self.poll_interval)
+
+	def latest(self, n=1):
+		return self.ring.latest(n)
+
+	def since(self, seq):
+		return self.ring.since(seq)
+
+	@property
+	def dropped_samples(self):
+		return self.ring.dropped
+
+
+def _shared_label_board(board_cls, label, seq):
+	"""Subclass board_cls so its label attributes read/write shared integers."""
+
+	def _get_label(self):
+		return label.value
+
+	def _set_label(self, value):
+		label.value = int(value)
+
+	def _get_seq(self):
+		return seq.value
+
+	def _set_seq(self, value):
+		seq.value = int(value)
+
+	return type(
+		"Shared" + board_cls.__name__,
+		(board_cls,),
+		{
+			"stimulus_sound": property(_get_label, _set_label),
+			"sequence_id": property(_get_seq, _set_seq),
+		})
+
+
+def _acquisition_main(port, shm_name, capacity, conn, flags, label, seq):
+	"""Entry point of the acquisition process."""
+	import ABMI_Utils
+
+	ring = SharedRingBuffer(capacity, name=shm_name)
+	frame_ingest = FrameIngest(ring)
+	board_cls = _shared_label_board(ABMI_Utils.BCIBoard, label, seq)
+	# Samples go into the ring as the board decodes them
+	board = _frame_sink_board(
+		board_cls, lambda _board, frame: frame_ingest.push(frame, label.value, seq.value))(port=port)
+
+	def _update_flags():
+		flags[_FLAG_CONNECTED] = bool(getattr(board, "connected", False))
+		flags[_FLAG_STREAMING] = bool(getattr(board, "streaming", False))
+		flags[_FLAG_RECORDING] = bool(getattr(board, "recording", False))
+
+	try:
+		while flags[_FLAG_RUNNING]:
+
+			# Commands from the UI process
+			while conn.poll():
+				command, name, args, kwargs = conn.recv()
+				try:
+					if command == "call":
+						result = getattr(board, name)(*args, **kwargs)
+					elif command == "setattr":
+						setattr(board, name, args[0])
+						result = None
+					elif command == "getattr":
+						result = getattr(board, name)
+					else:
+						raise ValueError(f"Unknown command {command!r}")
+					conn.send(("ok", result))
+				except Exception as exc:
+					conn.send(("error", f"{type(exc).__name__}: {exc}"))
+				_update_flags()
+
+			# Fallback until the board has pushed a frame itself
+			if not frame_ingest.pushed:
+				frame_ingest.ingest(getattr(board, "_last_data_frame", None), label.value, seq.value)
+
+			_update_flags()
+			time.sleep(INGEST_POLL_S)
+
+	finally:
+		try:
+			if getattr(board, "recording", False):
+				board.stop_recording()
+			if getattr(board, "streaming", False):
+				board.stop_stream()
+		except Exception as exc:
+			print(f"[EEG] Acquisition shutdown error: {exc}")
+		flags[_FLAG_CONNECTED] = False
+		flags[_FLAG_STREAMING] = False
+		flags[_FLAG_RECORDING] = False
+		ring.close()
+		conn.close()
+
+
+class AcquisitionClient:
+	"""
+	BCIBoard-compatible proxy for a board running in the acquisition process.
+
+	Method calls are forwarded over a pipe; status flags, labels and samples
+	are read straight from shared memory without a round trip.
+	"""
+
+	def __init__(self, service):
+		self._service = service
+		self._conn = service._conn
+		self._conn_lock = threading.Lock()
+		self.ring = service.ring
+
+	def _request(self, command, name, *args, **kwargs):
+		with self._conn_lock:
+			self._conn.send((command, name, args, kwargs))
+			status, result = self._conn.recv()
+		if status != "ok":
+			raise RuntimeError(f"[EEG] {name}: {result}")
+		return result
+
+	# --- status (shared memory, no round trip) ---
+	@property
+	def connected(self):
+		return bool(self._service._flags[_FLAG_CONNECTED])
+
+	@property
+	def streaming(self):
+		return bool(self._service._flags[_FLAG_STREAMING])
+
+	@property
+	def recording(self):
+		return bool(self._service._flags[_FLAG_RECORDING])
+
+	@property
+	def stimulus_sound(self):
+		return self._service._label.value
+
+	@stimulus_sound.setter
+	def stimulus_sound(self, value):
+		self._service._label.value = int(value)
+
+	@property
+	def sequence_id(self):
+		return self._service._seq.value
+
+	@sequence_id.setter
+	def sequence_id(self, value):
+		self._service._seq.value = int(value)
+
+	@property
+	def _last_data_frame(self):
+		latest = self.ring.latest(1)
+		return latest[0] if len(latest) else None
+
+	@property
+	def minimum_recorded_rows(self):
+		return self._request("getattr", "minimum_recorded_rows")
+
+	@minimum_recorded_rows.setter
+	def minimum_recorded_rows(self, value):
+		self._request("setattr", "minimum_recorded_rows", value)
+
+	# --- zero-copy sample access ---
+	def latest(self, n=1):
+		return self.ring.latest(n)
+
+	def since(self, seq):
+		return self.ring.since(seq)
+
+	@property
+	def dropped_samples(self):
+		return self.ring.dropped
+
+	# --- forwarded board methods ---
+	def connect(self, *args, **kwargs):
+		return self._request("call", "connect", *args, **kwargs)
+
+	def stream(self, *args, **kwargs):
+		return self._request("call", "stream", *args, **kwargs)
+
+	def stop_stream(self, *args, **kwargs):
+		return self._request("call", "stop_stream", *args, **kwargs)
+
+	def start_recording(self, *args, **kwargs):
+		return self._request("call", "start_recording", *args, **kwargs)
+
+	def stop_recording(self, *args, **kwargs):
+		return self._request("call", "stop_recording", *args, **kwargs)
+
+	def check_impedance(self, *args, **kwargs):
+		return self._request("call", "check_impedance", *args, **kwargs)
+
+
+class AcquisitionService:
+	"""Owns the acquisition process and its shared ring buffer."""
+
+	def __init__(self, port="/dev/bci_dongle", buffer_seconds=DEFAULT_BUFFER_SECONDS):
+		self.port = port
+		self.capacity = int(buffer_seconds * SAMPLE_RATE)
+		self._ctx = mp.get_context("fork")
+		self.ring = None
+		self.client = None
+		self._process = None
+		self._conn = None
+		self._flags = self._ctx.Array("b", 4, lock=False)
+		self._label = self._ctx.Value("i", 0, lock=False)
+		self._seq = self._ctx.Value("i", 0, lock=False)
+
+	def start(self):
+		"""Start the acquisition process and return its AcquisitionClient."""
+		if self._process is not None and self._process.is_alive():
+			return self.client
+
+		self.ring = SharedRingBuffer(self.capacity, create=True)
+		self._conn, child_conn = self._ctx.Pipe()
+		self._flags[_FLAG_RUNNING] = True
+
+		self._process = self._ctx.Process(
+			target=_acquisition_main,
+			args=(self.port, self.ring.name, self.capacity, child_conn,
+				  self._flags, self._label, self._seq),
+			name="EEGAcquisition",
+			daemon=True)
+		self._process.start()
+		child_conn.close()
+
+		self.client = AcquisitionClient(self)
+		print(f"[EEG] Acquisition process started (pid {self._process.pid}, "
+			  f"{self.capacity / SAMPLE_RATE:.0f}s buffer)")
+		return self.client
+
+	def stop(self, timeout=3):
+		if self._process is None:
+			return
+		self._flags[_FLAG_RUNNING] = False
+		self._process.join(timeout)
+		if self._process.is_alive():
+			self._process.terminate()
+		self._process = None
+		if self._conn is not None:
+			self._conn.close()
+			self._conn = None
+		if self.ring is not None:
+			self.ring.close()
+			self.ring = None
+		self.client = None
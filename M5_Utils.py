@@ -0,0 +1,193 @@
+"""
+M5_Utils.py
+
+Serial helpers for the M5 display attached to the B2J runtimes.
+
+  - M5Link              : one persistent serial connection shared by every
+                          sender (LED commands, state messages, EEG preview),
+                          instead of re-opening the port for every line.
+  - EEGPreviewStreamer  : background thread that samples the most recent EEG
+                          frame at a fixed rate and sends it as a compact
+                          binary-packed line. Frames that arrive between two
+                          ticks are dropped, never queued.
+
+Preview line format ("EB,<base64>\\n"), little-endian:
+
+	uint8   frame counter (wraps at 256, lets the M5 detect dropped frames)
+	int16 x N   channel values divided by scale_uv, clipped to int16
+"""
+
+import base64
+import struct
+import threading
+import time
+
+import serial
+
+PREVIEW_PREFIX = "EB,"
+DEFAULT_PREVIEW_RATE_HZ = 25
+DEFAULT_PREVIEW_SCALE_UV = 8.0  # 1 LSB = 8 uV -> +/-262 mV, covers the ADS1299 rail (187500 uV)
+NUM_PREVIEW_CHANNELS = 8
+
+
+class M5Link:
+	"""Thread-safe, lazily (re)opened serial connection to the M5."""
+
+	def __init__(self, port, baud=115200, timeout=1, write_timeout=0.05):
+		self.port = port
+		self.baud = baud
+		self.timeout = timeout
+		self.write_timeout = write_timeout
+		self._serial = None
+		self._lock = threading.Lock()
+
+	def _ensure_open(self):
+		if self._serial is not None and self._serial.is_open:
+			return True
+		self._serial = serial.Serial(
+			self.port, self.baud,
+			timeout=self.timeout,
+			write_timeout=self.write_timeout)
+		return True
+
+	def send(self, message: str, log=True):
+		if not self.port:
+			print("[ERROR] No serial port selected")
+			return False
+
+		if not message:
+			return False
+
+		message = message.strip() + "\n"
+
+		with self._lock:
+			try:
+				self._ensure_open()
+				self._serial.write(message.encode("utf-8"))
+				if log:
+					print(f"[TX M5] {message.strip()}")
+				return True
+
+			except serial.SerialTimeoutException:
+				# Link is saturated; the caller decides whether the line matters.
+				return False
+
+			except (serial.SerialException, OSError) as e:
+				print(f"[ERROR] Serial error: {e}")
+				self._close_locked()
+				return False
+
+	def _close_locked(self):
+		if self._serial is not None:
+			try:
+				self._serial.close()
+			except Exception:
+				pass
+		self._serial = None
+
+	def close(self):
+		with self._lock:
+			self._close_locked()
+
+
+def frame_channels(frame, num_channels=NUM_PREVIEW_CHANNELS):
+	"""
+	Return the EEG channel values of a board frame.
+
+	Frames that mirror the recording CSV row (Timestamp, Ch1..Ch8, ...) have
+	the timestamp stripped; shorter frames are taken as channels only.
+	"""
+	if len(frame) > num_channels:
+		return frame[1:num_channels + 1]
+	return frame[:num_channels]
+
+
+def pack_preview_frame(channels, counter, scale_uv=DEFAULT_PREVIEW_SCALE_UV):
+	"""Pack channel values into the base64 payload of one preview line."""
+	values = []
+	for value in channels:
+		scaled = int(round(float(value) / scale_uv))
+		values.append(max(-32768, min(32767, scaled)))
+	raw = struct.pack(f"<B{len(values)}h", counter & 0xFF, *values)
+	return base64.b64encode(raw).decode("ascii")
+
+
+class EEGPreviewStreamer:
+	"""
+	Rate-limited EEG preview sender.
+
+	`source` is a callable returning the latest board frame (or None). It is
+	polled once per tick, so the stream is decimated to `rate_hz` and a slow
+	link only ever delays the newest frame rather than building a backlog.
+	"""
+
+	def __init__(self, link, source, rate_hz=DEFAULT_PREVIEW_RATE_HZ,
+				 scale_uv=DEFAULT_PREVIEW_SCALE_UV, max_payload_bytes=240,
+				 num_channels=NUM_PREVIEW_CHANNELS):
+		if rate_hz <= 0:
+			raise ValueError("rate_hz must be positive")
+
+		line_length = len(PREVIEW_PREFIX) + 4 * ((1 + 2 * num_channels + 2) // 3) + 1
+		if line_length > max_payload_bytes:
+			raise ValueError(
+				f"Preview line ({line_length} bytes) exceeds M5 payload limit ({max_payload_bytes})")
+
+		self.link = link
+		self.source = source
+		self.interval = 1.0 / rate_hz
+		self.scale_uv = scale_uv
+		self.num_channels = num_channels
+		self.frames_sent = 0
+		self.frames_skipped = 0
+		self._counter = 0
+		self._last_frame = None
+		self._stop_event = threading.Event()
+		self._thread = None
+
+	@property
+	def running(self):
+		return self._thread is not None and self._thread.is_alive()
+
+	def start(self):
+		if self.running:
+			return
+		self._stop_event.clear()
+		self._last_frame = None
+		self._thread = threading.Thread(target=self._run, name="EEGPreviewStreamer", daemon=True)
+		self._thread.start()
+
+	def stop(self):
+		self._stop_event.set()
+		if self._thread is not None and self._thread is not threading.current_thread():
+			self._thread.join(timeout=1)
+		self._thread = None
+
+	def _run(self):
+		next_time = time.monotonic()
+		while not self._stop_event.is_set():
+			frame = self.source()
+			if frame is not None:
+				frame = tuple(frame)
+
+			# Same values as last tick -> no new data arrived, nothing to send
+			if frame is None or frame == self._last_frame:
+				self.frames_skipped += 1
+			else:
+				self._last_frame = frame
+				try:
+					payload = pack_preview_frame(
+						frame_channels(frame, self.num_channels), self._counter, self.scale_uv)
+				except (TypeError, ValueError):
+					payload = None
+				if payload is not None and self.link.send(PREVIEW_PREFIX + payload, log=False):
+					self._counter = (self._counter + 1) & 0xFF
+					self.frames_sent += 1
+				else:
+					self.frames_skipped += 1
+
+			# Never try to catch up: a late tick is simply rescheduled from now
+			next_time += self.interval
+			now = time.monotonic()
+			if next_time < now:
+				next_time = now + self.interval
+			self._stop_event.wait(next_time - now)
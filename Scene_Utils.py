@@ -1,7 +1,6 @@
 import os
 import pygame
 import sys
-import socket
 import time
 import math
 import threading
@@ -10,6 +9,10 @@ import datetime
 
 #Audio BMI Code by MIKITO OGINO
 import ABMI_Utils
+import Catalog_Utils
+import Cloud_Utils
+import EEG_Utils
+import UI_Utils
 
 # Font Path
 notoFont = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
@@ -32,17 +35,49 @@ soft_green = (152,250,132)
 mint_green = (54,217,62)
 dark_green = (2,140,0)
 dark_yellow = (201,185,0)
+grey = (150,150,150)
+
+# Wrapped line surfaces and single-line labels, keyed by (text, font, ...).
+# Scenes redraw every frame, so each distinct string is laid out and
+# rasterized once and then only blitted.
+_text_surfaces = UI_Utils.LRUCache(max_entries=256)
+
+def render_text(font, text, color):
+	key = ("line", text, font, tuple(color))
+	text_surface = _text_surfaces.get(key)
+	if text_surface is None:
+		text_surface = font.render(text, True, color)
+		_text_surfaces.put(key, text_surface)
+	return text_surface
+
+def _fit_prefix(font, text, max_width):
+	# Longest prefix of `text` that fits; prefix widths only grow, so bisect.
+	# At least one character is always taken so wrapping makes progress.
+	if font.size(text)[0] <= max_width:
+		return len(text)
+	lo, hi = 1, len(text) - 1
+	while lo < hi:
+		mid = (lo + hi + 1) // 2
+		if font.size(text[:mid])[0] <= max_width:
+			lo = mid
+		else:
+			hi = mid - 1
+	return lo
 
-def draw_text_wrapped(surface, text, font, color, x, y, max_width, line_spacing=5, lang="en"):
+def wrap_text(text, font, max_width, lang="en"):
 	lines = []
 	for paragraph in text.split("\n"):
 		if lang == "jp":
-			words = list(paragraph)  # treat each character as a word
-		else:
-			words = paragraph.split(" ")
+			# Japanese breaks between any two characters
+			while paragraph:
+				cut = _fit_prefix(font, paragraph, max_width)
+				lines.append(paragraph[:cut])
+				paragraph = paragraph[cut:]
+			continue
+
 		current_line = ""
-		for word in words:
-			test_line = current_line + word if lang == "jp" else current_line + (" " if current_line else "") + word
+		for word in paragraph.split(" "):
+			test_line = current_line + (" " if current_line else "") + word
 			if font.size(test_line)[0] <= max_width:
 				current_line = test_line
 			else:
@@ -50,17 +85,139 @@ def draw_text_wrapped(surface, text, font, color, x, y, max_width, line_spacing=
 				current_line = word
 		if current_line:
 			lines.append(current_line)
+	return lines
+
+def draw_text_wrapped(surface, text, font, color, x, y, max_width, line_spacing=5, lang="en"):
+	key = ("wrapped", text, font, max_width, lang, tuple(color))
+	line_surfaces = _text_surfaces.get(key)
+	if line_surfaces is None:
+		line_surfaces = [font.render(line, True, color) for line in wrap_text(text, font, max_width, lang)]
+		_text_surfaces.put(key, line_surfaces)
 
 	# Render all lines
 	y_offset = y
-	for line in lines:
-		line_surface = font.render(line, True, color)
-		line_rect = line_surface.get_rect(topleft=(x, y_offset))
-		surface.blit(line_surface, line_rect)
+	for line_surface in line_surfaces:
+		surface.blit(line_surface, (x, y_offset))
 		y_offset += line_surface.get_height() + line_spacing
 
 	return y_offset - y  # total height drawn
 
+# --- Shared fonts and buttons ---
+# One Font object per size for every scene, loaded on first use
+fonts = UI_Utils.FontRegistry(notoFont)
+
+class Button:
+	"""
+	Filled, outlined button with a centered label. The normal, pressed and
+	disabled faces are rendered once and shared between buttons that look
+	the same, so drawing is a single blit.
+	"""
+
+	BORDER = 3
+	PRESS_FLASH = 0.15  # seconds the pressed face stays up after a tap
+	PRESS_DARKEN = 60
+
+	def __init__(self, text, rect, callback, font_size=28, color=white):
+		self.text = text
+		self.rect = pygame.Rect(rect)
+		self.callback = callback
+		self.font_size = font_size
+		self.color = color
+		self.enabled = True
+		self._pressed_at = None
+		self._faces = None
+
+	def _render_face(self, fill, label_color):
+		key = ("button", self.text, self.font_size, self.rect.size, tuple(fill), tuple(label_color))
+		face = _text_surfaces.get(key)
+		if face is None:
+			face = pygame.Surface(self.rect.size)
+			face.fill(fill)
+			pygame.draw.rect(face, black, face.get_rect(), self.BORDER)
+			text_surface = render_text(fonts.get(self.font_size), self.text, label_color)
+			face.blit(text_surface, text_surface.get_rect(center=face.get_rect().center))
+			_text_surfaces.put(key, face)
+		return face
+
+	def faces(self):
+		if self._faces is None:
+			pressed = tuple(max(0, c - self.PRESS_DARKEN) for c in self.color)
+			self._faces = {
+				"normal": self._render_face(self.color, black),
+				"pressed": self._render_face(pressed, black),
+				"disabled": self._render_face(white, grey),
+			}
+		return self._faces
+
+	@property
+	def pressed(self):
+		return self._pressed_at is not None and time.monotonic() - self._pressed_at < self.PRESS_FLASH
+
+	def press(self):
+		self._pressed_at = time.monotonic()
+		self.callback()
+
+	def draw(self, surface):
+		if not self.enabled:
+			face = "disabled"
+		elif self.pressed:
+			face = "pressed"
+		else:
+			face = "normal"
+		surface.blit(self.faces()[face], self.rect)
+
+class ButtonGroup:
+	"""
+	The buttons of one scene. Hit testing goes through a coarse grid of
+	`cell_size` pixel cells, so a tap only checks the buttons overlapping
+	its cell.
+	"""
+
+	def __init__(self, cell_size=40):
+		self.cell_size = cell_size
+		self._buttons = []
+		self._grid = {}
+
+	def add(self, text, x, y, w, h, callback, font_size=28, color=white):
+		button = Button(text, (x, y, w, h), callback, font_size=font_size, color=color)
+		self._buttons.append(button)
+		rect = button.rect
+		for cx in range(rect.left // self.cell_size, (rect.right - 1) // self.cell_size + 1):
+			for cy in range(rect.top // self.cell_size, (rect.bottom - 1) // self.cell_size + 1):
+				self._grid.setdefault((cx, cy), []).append(button)
+		return button
+
+	def clear(self):
+		self._buttons = []
+		self._grid = {}
+
+	def __iter__(self):
+		return iter(self._buttons)
+
+	def __len__(self):
+		return len(self._buttons)
+
+	def hit_test(self, pos):
+		cell = (pos[0] // self.cell_size, pos[1] // self.cell_size)
+		# Later buttons are drawn on top, so they win
+		for button in reversed(self._grid.get(cell, ())):
+			if button.rect.collidepoint(pos):
+				return button
+		return None
+
+	def handle_event(self, event):
+		"""Fire the tapped button's callback; returns True when a button took the event."""
+		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+			button = self.hit_test(event.pos)
+			if button is not None and button.enabled:
+				button.press()
+				return True
+		return False
+
+	def draw(self, surface):
+		for button in self._buttons:
+			button.draw(surface)
+
 # --- Base Scene Class ---
 class Scene:
 	def __init__(self, app):
@@ -82,8 +239,8 @@ class Scene:
 class WelcomeScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
-		self.font_en = pygame.font.Font(notoFont, 36)  # English
-		self.font_jp = pygame.font.Font(notoFont, 36)  # Japanese
+		self.font_en = fonts.get(36)  # English
+		self.font_jp = fonts.get(36)  # Japanese
 
 	def handle_events(self, event):
 		if event.type == pygame.KEYDOWN or event.type == pygame.MOUSEBUTTONDOWN:
@@ -92,12 +249,12 @@ class WelcomeScene(Scene):
 		surface.fill(white)
 
 		# English text (top)
-		text_surface_en = self.font_en.render("Welcome to BMI Trainer", True, black)
+		text_surface_en = render_text(self.font_en, "Welcome to BMI Trainer", black)
 		text_rect_en = text_surface_en.get_rect(center=(240, 110))
 		surface.blit(text_surface_en, text_rect_en)
 
 		# Japanese text (bottom)
-		text_surface_jp = self.font_jp.render("BMIトレーナーへようこそ", True, black)
+		text_surface_jp = render_text(self.font_jp, "BMIトレーナーへようこそ", black)
 		text_rect_jp = text_surface_jp.get_rect(center=(240, 190))
 		surface.blit(text_surface_jp, text_rect_jp)
 
@@ -105,11 +262,9 @@ class WelcomeScene(Scene):
 class WiFiCheckScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
-		self.font_en = pygame.font.Font(notoFont, 22)
-		self.font_jp = pygame.font.Font(notoFont, 22)
+		self.font_en = fonts.get(22)
+		self.font_jp = fonts.get(22)
 		self.status = "checking"  # "checking", "success", or "fail"
-		self.last_check_time = 0
-		self.retry_interval = 3  # seconds between retry attempts
   
 		# Spinner setup
 		self.spinner_angle = 0
@@ -122,35 +277,27 @@ class WiFiCheckScene(Scene):
 			if self.status == "success":
 				self.app.switch_scene("bci_connect")  # go to bci_connect
 
-	def check_internet(self, host="8.8.8.8", port=443, timeout=2):
-		try:
-			socket.setdefaulttimeout(timeout)
-			s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-			s.connect((host, port))
-			s.close()
-			return True
-		except Exception:
-			return False
+	def on_enter(self):
+		self.app.connectivity.request()
 
 	def update(self):
-		current_time = time.time()
-  
 		# Rotate spinner continuously
 		self.spinner_angle = (self.spinner_angle + self.spinner_speed) % 360
-  
-		# Only retry if not already successful AND retry interval has passed
-		if self.status != "success" and current_time - self.last_check_time > self.retry_interval:
-			self.last_check_time = current_time
-			self.status = "checking"  # show checking message first
-			pygame.display.flip()     # force draw immediately
-			
-			# Developer mode override - skip internet check
-			if self.app.developer_mode:
-				self.status = "success"
-			elif self.check_internet():
-				self.status = "success"
-			else:
-				self.status = "fail"
+
+		if self.status == "success":
+			return
+
+		# Developer mode override - skip internet check
+		if self.app.developer_mode:
+			self.status = "success"
+			return
+
+		# Probing runs in the connectivity monitor; only read its cached result here
+		internet = self.app.connectivity.status("internet")
+		if internet is None:
+			self.status = "checking"
+		else:
+			self.status = "success" if internet.ok else "fail"
 
 	def draw(self, surface):
 		surface.fill(white)
@@ -183,8 +330,8 @@ class WiFiCheckScene(Scene):
 class BCIConnectScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
-		self.font_en = pygame.font.Font(notoFont, 22)
-		self.font_jp = pygame.font.Font(notoFont, 22)
+		self.font_en = fonts.get(22)
+		self.font_jp = fonts.get(22)
 		self.status = "checking"  # "checking", "connected", "wait_cables", "failed"
 		self.last_check_time = 0
 		self.retry_interval = 3  # seconds between retries
@@ -230,7 +377,11 @@ class BCIConnectScene(Scene):
 			return
 			
 		try:
-			self.board = ABMI_Utils.BCIBoard(port="/dev/bci_dongle")
+			if self.app.acquisition_service is not None:
+				# Board lives in the acquisition process; reuse its client across retries
+				self.board = self.app.acquisition_service.client
+			else:
+				self.board = ABMI_Utils.BCIBoard(port="/dev/bci_dongle")
 			success = self.board.connect()
 			if success:
 				self.status = "connected"
@@ -284,8 +435,8 @@ class BCIConnectScene(Scene):
 class ImpedanceCheckSingleScene(Scene):
 	def __init__(self, app, cable_index, cable_name, cable_color_rgb):
 		super().__init__(app)
-		self.font_en = pygame.font.Font(notoFont, 24)
-		self.font_jp = pygame.font.Font(notoFont, 24)
+		self.font_en = fonts.get(24)
+		self.font_jp = fonts.get(24)
 		self.status = "waiting"  # "waiting", "checking", "done"
 		self.result = None
 		self.cable_index = cable_index  # 0-based index
@@ -423,9 +574,9 @@ class ImpedanceCheckSingleScene(Scene):
 class ImpedanceResultsSingleScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
-		self.font_en = pygame.font.Font(notoFont, 20)
-		self.font_jp = pygame.font.Font(notoFont, 18)
-		self.font_large = pygame.font.Font(notoFont, 24)
+		self.font_en = fonts.get(20)
+		self.font_jp = fonts.get(18)
+		self.font_large = fonts.get(24)
 		
 		# Results will be set when switching to this scene
 		self.cable_index = None
@@ -507,24 +658,24 @@ class ImpedanceResultsSingleScene(Scene):
 		# Titles
 		title_en = f"{self.cable_name} Cable Result"
 		title_jp = f"{self.cable_name}ケーブル結果"
-		title_surface_en = self.font_large.render(title_en, True, black)
-		title_surface_jp = self.font_large.render(title_jp, True, black)
+		title_surface_en = render_text(self.font_large, title_en, black)
+		title_surface_jp = render_text(self.font_large, title_jp, black)
 		surface.blit(title_surface_en, title_surface_en.get_rect(center=(240, 80 + y_offset)))
 		surface.blit(title_surface_jp, title_surface_jp.get_rect(center=(240, 120 + y_offset)))
 
 		# Impedance text (skip if NaN handled below)
 		if not np.isnan(self.impedance_value):
 			imp_text = f"{self.impedance_value:.1f} kΩ"
-			imp_surface = self.font_large.render(imp_text, True, value_color)
+			imp_surface = render_text(self.font_large, imp_text, value_color)
 			surface.blit(imp_surface, imp_surface.get_rect(center=(240, 170 + y_offset)))
 
-			status_surface_en = self.font_en.render(status_text, True, value_color)
-			status_surface_jp = self.font_jp.render(status_jp, True, value_color)
+			status_surface_en = render_text(self.font_en, status_text, value_color)
+			status_surface_jp = render_text(self.font_jp, status_jp, value_color)
 			surface.blit(status_surface_en, status_surface_en.get_rect(center=(240, 200 + y_offset)))
 			surface.blit(status_surface_jp, status_surface_jp.get_rect(center=(240, 230 + y_offset)))
 		else:
-			err_en = self.font_large.render("CONNECTION ERROR", True, red)
-			err_jp = self.font_jp.render("接続エラー", True, red)
+			err_en = render_text(self.font_large, "CONNECTION ERROR", red)
+			err_jp = render_text(self.font_jp, "接続エラー", red)
 			surface.blit(err_en, err_en.get_rect(center=(240, 180 + y_offset)))
 			surface.blit(err_jp, err_jp.get_rect(center=(240, 210 + y_offset)))
 
@@ -532,8 +683,8 @@ class ImpedanceResultsSingleScene(Scene):
 		if self.retry_needed:
 			msg_en = "Please fix the cable connection and retry."
 			msg_jp = "ケーブルの接続を直して、再試行してください。"
-			msg_surface_en = self.font_en.render(msg_en, True, black)
-			msg_surface_jp = self.font_jp.render(msg_jp, True, black)
+			msg_surface_en = render_text(self.font_en, msg_en, black)
+			msg_surface_jp = render_text(self.font_jp, msg_jp, black)
 			surface.blit(msg_surface_en, msg_surface_en.get_rect(center=(240, 280 + y_offset)))
 			surface.blit(msg_surface_jp, msg_surface_jp.get_rect(center=(240, 310 + y_offset)))
 
@@ -543,41 +694,33 @@ class TrainerScene(Scene):
 		super().__init__(app)
 		self.app = app
 		self.app.user_id = ABMI_Utils.getUserID("BMI Trainer Data/UserID.txt")
-		ABMI_Utils.deleteEmptyFolders(base_path="BMI Trainer Data/") #Delete empty folders before creating a Session Folder
+		#Delete empty folders before creating a Session Folder
+		self.app.catalog.sync()
+		self.app.catalog.delete_empty_folders()
 		self.app.session_Folder = ABMI_Utils.createSessionFolder(self.app.user_id, datetime.datetime.now(), base_path="BMI Trainer Data/")
 		self.app.model_Folder = ABMI_Utils.createModelFolder(base_path="Model/")
 		self.app.testing_Folder = ABMI_Utils.createTestingFolder(base_path="Testing/")
-		self.buttons = []
+		self.buttons = ButtonGroup()
 
 		# Button Creation
-		self.add_button("Train BMI", 10, 15, 200, 90, self.train_bmi, font_size=28, color=soft_green)
-		self.add_button("Delete Recent", 10, 115, 200, 90, self.delete_recent, font_size=24, color=light_red)
-		self.add_button("Check Impedance", 10, 215, 200, 90, self.check_impedance, font_size=20, color=cool_blue)
-		self.add_button("Left", 220, 215, 80, 90, self.audio_left, font_size=20, color=white)
-		self.add_button("Center", 305, 215, 80, 90, self.audio_center, font_size=20, color=white)
-		self.add_button("Right", 390, 215, 80, 90, self.audio_right, font_size=20, color=white)
-		self.add_button("Continue →", 255, 100, 180, 70, self.continue_upload, font_size=24, color=warning_orange)
+		self.buttons.add("Train BMI", 10, 15, 200, 90, self.train_bmi, font_size=28, color=soft_green)
+		self.buttons.add("Delete Recent", 10, 115, 200, 90, self.delete_recent, font_size=24, color=light_red)
+		self.buttons.add("Check Impedance", 10, 215, 200, 90, self.check_impedance, font_size=20, color=cool_blue)
+		self.buttons.add("Left", 220, 215, 80, 90, self.audio_left, font_size=20, color=white)
+		self.buttons.add("Center", 305, 215, 80, 90, self.audio_center, font_size=20, color=white)
+		self.buttons.add("Right", 390, 215, 80, 90, self.audio_right, font_size=20, color=white)
+		self.buttons.add("Continue →", 255, 100, 180, 70, self.continue_upload, font_size=24, color=warning_orange)
 
 		#Font for labels like "Test Audio"
-		self.label_font = pygame.font.Font(notoFont, 24)
-		self.userid_font = pygame.font.Font(notoFont, 22)
-
-	def add_button(self, text, x, y, w, h, callback, font_size=28, color=white):
-		button = {
-			"rect": pygame.Rect(x, y, w, h),
-			"text": text,
-			"callback": callback,
-			"font": pygame.font.Font(notoFont, font_size),
-			"color": color
-		}
-		self.buttons.append(button)
+		self.label_font = fonts.get(24)
+		self.userid_font = fonts.get(22)
 
 	def train_bmi(self):
 		print("Train BMI clicked! Switching to CollectDataSingleScene...")
 		self.app.switch_scene("collect_data_single")
 
 	def delete_recent(self):
-		ABMI_Utils.deleteMostRecent(base_path="BMI Trainer Data/")
+		self.app.catalog.delete_most_recent(self.app.user_id)
 		self.app.refresh_lcr_count()
 
 	def check_impedance(self):
@@ -613,11 +756,7 @@ class TrainerScene(Scene):
 		ABMI_Utils.play_single_sound('Sounds/beep_right.wav')
 
 	def handle_events(self, event):
-		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-			mx, my = event.pos
-			for btn in self.buttons:
-				if btn["rect"].collidepoint(mx, my):
-					btn["callback"]()
+		self.buttons.handle_event(event)
 
 	def update(self):
 		if self.app.developer_mode:
@@ -630,13 +769,13 @@ class TrainerScene(Scene):
 		surface.fill(white)
 
 		# --- Draw "Test Audio" label ---
-		label_surface = self.label_font.render("Test Audio", True, black)
+		label_surface = render_text(self.label_font, "Test Audio", black)
 		label_rect = label_surface.get_rect(center=(345, 195))  # center above audio buttons
 		surface.blit(label_surface, label_rect)
 
 		# --- Draw User ID (top right) ---
 		user_text = f"User ID: {self.app.user_id}"
-		user_surface = self.userid_font.render(user_text, True, black)
+		user_surface = render_text(self.userid_font, user_text, black)
 		user_rect = user_surface.get_rect(topright=(surface.get_width() - 30, 10))
 		surface.blit(user_surface, user_rect)
 
@@ -645,27 +784,22 @@ class TrainerScene(Scene):
 			if getattr(self.app, "recording_lcr_counts", None)
 			else (0, 0, 0))
 		lcr_text = f"L: {left_count}   C: {center_count}   R: {right_count}"
-		lcr_surface = self.userid_font.render(lcr_text, True, black)
+		lcr_surface = render_text(self.userid_font, lcr_text, black)
 		lcr_rect = lcr_surface.get_rect(topright=(surface.get_width() - 30, user_rect.bottom + 8))
 		surface.blit(lcr_surface, lcr_rect)
 
 		# --- Draw buttons ---
-		for btn in self.buttons:
-			pygame.draw.rect(surface, btn["color"], btn["rect"])
-			pygame.draw.rect(surface, black, btn["rect"], 3)  # border
-			text_surface = btn["font"].render(btn["text"], True, black)
-			text_rect = text_surface.get_rect(center=btn["rect"].center)
-			surface.blit(text_surface, text_rect)
+		self.buttons.draw(surface)
 
 # --- Upload To Cloud Scene ---
 class UploadToCloudScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
 		self.app = app
-		self.title_font = pygame.font.Font(notoFont, 28)
-		self.count_font = pygame.font.Font(notoFont, 24)
-		self.status_font = pygame.font.Font(notoFont, 20)
-		self.buttons = []
+		self.title_font = fonts.get(28)
+		self.count_font = fonts.get(24)
+		self.status_font = fonts.get(20)
+		self.buttons = ButtonGroup()
 		self.cloudConnection = None
 		self.isConnected = False
 		self.cloudDataCount = 0
@@ -679,43 +813,38 @@ class UploadToCloudScene(Scene):
 		self.spinner_center = (self.app.render_w - 40, self.app.render_h - 40)
 		self.spinner_speed = -2
 
-		self.add_button("← Trainer", 15, 150, 140, 70, self.go_back, font_size=22, color=cool_blue)
-		self.add_button("Upload", 170, 140, 120, 90, self.upload_action, font_size=26, color=soft_green)
-		self.add_button("Download →", 305, 150, 160, 70, self.go_download, font_size=22, color=warning_orange)
-
-	def add_button(self, text, x, y, w, h, callback, font_size=28, color=white):
-		button = {
-			"rect": pygame.Rect(x, y, w, h),
-			"text": text,
-			"callback": callback,
-			"font": pygame.font.Font(notoFont, font_size),
-			"color": color
-		}
-		self.buttons.append(button)
+		self.buttons.add("← Trainer", 15, 150, 140, 70, self.go_back, font_size=22, color=cool_blue)
+		self.upload_button = self.buttons.add("Upload", 170, 140, 120, 90, self.upload_action, font_size=26, color=soft_green)
+		self.buttons.add("Download →", 305, 150, 160, 70, self.go_download, font_size=22, color=warning_orange)
 
 	def on_enter(self):
 		self.status_message = ""
 		self.uploading = False
-		if not self.cloudConnection:
-			try:
-				self.cloudConnection = ABMI_Utils.CloudConnection(self.app.cloud_ip, self.app.cloud_user, self.app.cloud_password)
-				self.cloudConnection.connect()
-				self.isConnected = True
-			except Exception as err:
-				print(f"Cloud connection failed: {err}")
-				self.cloudConnection = None
-				self.isConnected = False
-		if self.cloudConnection:
-			try:
-				if not self.cloudConnection.folder_exists("/Training_Data/" + self.app.user_id):
-					print('User Folder not found, creating user folder for ' + str(self.app.user_id))
-					self.cloudConnection.create_user_folder("/Training_Data/" + self.app.user_id)
-				self.cloudDataCount = self.cloudConnection.count_files_in_folder("/Training_Data/" + self.app.user_id)
-				self.status_message = ""
-			except Exception as err:
-				print(f"Failed to refresh cloud data count: {err}")
-				self.status_message = "Failed to load cloud count"
-				self.cloudDataCount = 0
+		# The shared session is picked up in update() once the monitor has it
+		self.cloudConnection = None
+		self.isConnected = False
+		self.app.connectivity.request()
+
+	def _drop_connection(self, connection):
+		# update() picks up the monitor's replacement session
+		if self.cloudConnection is connection:
+			self.cloudConnection = None
+			self.isConnected = False
+		self.app.connectivity.drop_session(connection)
+
+	def _refresh_cloud_count(self):
+		connection = self.cloudConnection
+		try:
+			if not connection.folder_exists("/Training_Data/" + self.app.user_id):
+				print('User Folder not found, creating user folder for ' + str(self.app.user_id))
+				connection.create_user_folder("/Training_Data/" + self.app.user_id)
+			self.cloudDataCount = connection.count_files_in_folder("/Training_Data/" + self.app.user_id)
+			self.status_message = ""
+		except Exception as err:
+			print(f"Failed to refresh cloud data count: {err}")
+			self.status_message = "Failed to load cloud count"
+			self.cloudDataCount = 0
+			self._drop_connection(connection)
 
 	def go_back(self):
 		self.app.switch_scene("trainer")
@@ -723,7 +852,7 @@ class UploadToCloudScene(Scene):
 	def upload_action(self):
 		print("Uploading all files to cloud!")
 		if not self.cloudConnection:
-			self.status_message = "Not connected to cloud"
+			self.status_message = "Connecting to cloud..." if self.app.connectivity.status("cloud") is None else "Not connected to cloud"
 			return
 		if self.uploading:
 			return
@@ -732,12 +861,31 @@ class UploadToCloudScene(Scene):
 		self.upload_thread = threading.Thread(target=self._run_upload, daemon=True)
 		self.upload_thread.start()
 
+	def _upload_progress(self, done, total, bytes_sent):
+		self.status_message = f"Uploading {done}/{total}..."
+
 	def _run_upload(self):
+		connection = self.cloudConnection
 		try:
-			files_uploaded = self.cloudConnection.upload_all_files(remote_root="/Training_Data/" + self.app.user_id, user_id=self.app.user_id, local_root="BMI Trainer Data")
-			print(f"Uploaded {files_uploaded} files to cloud.")
-			self.cloudDataCount = self.cloudConnection.count_files_in_folder("/Training_Data/" + self.app.user_id)
-			self.status_message = "Upload complete!" if files_uploaded else "No files to upload"
+			# Only recordings that changed since the last upload are sent
+			uploader = Cloud_Utils.SyncUploader(
+				self.app.cloud_transports, self.app.catalog, remote_root="/Training_Data/" + self.app.user_id,
+				compression=self.app.upload_compression, level=self.app.upload_compression_level)
+			result = uploader.run(self.app.user_id, progress=self._upload_progress)
+			rate_kb = Cloud_Utils.throughput(result) / 1024
+			print(f"Uploaded {result.uploaded} files to cloud ({result.skipped} unchanged, {result.failed} failed, {rate_kb:.1f} KB/s).")
+			# The upload itself is done; a failed recount must not report it as failed
+			try:
+				self.cloudDataCount = connection.count_files_in_folder("/Training_Data/" + self.app.user_id)
+			except Exception as err:
+				print(f"Failed to refresh cloud data count: {err}")
+				self._drop_connection(connection)
+			if result.failed:
+				self.status_message = f"Upload incomplete: {result.failed} failed"
+			elif result.uploaded:
+				self.status_message = f"Upload complete! ({rate_kb:.0f} KB/s)"
+			else:
+				self.status_message = "No files to upload"
 		except Exception as err:
 			print(f"Upload failed: {err}")
 			self.status_message = "Upload failed"
@@ -748,28 +896,30 @@ class UploadToCloudScene(Scene):
 		self.app.switch_scene("download_from_cloud")
 
 	def handle_events(self, event):
-		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-			mx, my = event.pos
-			for btn in self.buttons:
-				if btn["rect"].collidepoint(mx, my):
-					btn["callback"]()
+		self.buttons.handle_event(event)
 
 	def update(self):
+		if not self.cloudConnection:
+			self.cloudConnection = self.app.connectivity.session()
+			if self.cloudConnection:
+				self.isConnected = True
+				threading.Thread(target=self._refresh_cloud_count, daemon=True).start()
+		self.upload_button.enabled = not self.uploading
 		if self.uploading:
 			self.spinner_angle = (self.spinner_angle + self.spinner_speed) % 360
 
 	def draw(self, surface):
 		surface.fill(white)
 		
-		title_surface = self.title_font.render("Upload To Cloud", True, black)
+		title_surface = render_text(self.title_font, "Upload To Cloud", black)
 		title_rect = title_surface.get_rect(center=(surface.get_width() // 2, 60))
 		surface.blit(title_surface, title_rect)
   
-		count_surface = self.count_font.render(f"Data Count: {self.cloudDataCount}", True, black)
+		count_surface = render_text(self.count_font, f"Data Count: {self.cloudDataCount}", black)
 		count_rect = count_surface.get_rect(center=(surface.get_width() // 2, 100))
 		surface.blit(count_surface, count_rect)
 
-		status_surface = self.status_font.render(self.status_message, True, black)
+		status_surface = render_text(self.status_font, self.status_message, black)
 		status_rect = status_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() - 30))
 		surface.blit(status_surface, status_rect)
 
@@ -782,22 +932,17 @@ class UploadToCloudScene(Scene):
 				y = self.spinner_center[1] + self.spinner_radius * math.sin(angle_rad)
 				pygame.draw.circle(surface, black, (int(x), int(y)), 3)
 
-		for btn in self.buttons:
-			pygame.draw.rect(surface, btn["color"], btn["rect"])
-			pygame.draw.rect(surface, black, btn["rect"], 3)
-			text_surface = btn["font"].render(btn["text"], True, black)
-			text_rect = text_surface.get_rect(center=btn["rect"].center)
-			surface.blit(text_surface, text_rect)
+		self.buttons.draw(surface)
 
 # --- Download From Cloud Scene ---
 class DownloadFromCloudScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
 		self.app = app
-		self.title_font = pygame.font.Font(notoFont, 28)
-		self.status_font = pygame.font.Font(notoFont, 24)
-		self.message_font = pygame.font.Font(notoFont, 20)
-		self.buttons = []
+		self.title_font = fonts.get(28)
+		self.status_font = fonts.get(24)
+		self.message_font = fonts.get(20)
+		self.buttons = ButtonGroup()
 		self.cloudConnection = None
 		self.model_available = False
 		self.availability_message = "Checking..."
@@ -810,45 +955,33 @@ class DownloadFromCloudScene(Scene):
 		self.spinner_center = (self.app.render_w - 40, self.app.render_h - 40)
 		self.spinner_speed = -2
 
-		self.add_button("← Upload", 15, 150, 140, 70, self.go_upload, font_size=22, color=cool_blue)
-		self.add_button("Download", 170, 140, 140, 90, self.download_action, font_size=24, color=soft_green)
-		self.add_button("Test →", 325, 150, 140, 70, self.go_test, font_size=22, color=warning_orange)
-
-	def add_button(self, text, x, y, w, h, callback, font_size=28, color=white):
-		button = {
-			"rect": pygame.Rect(x, y, w, h),
-			"text": text,
-			"callback": callback,
-			"font": pygame.font.Font(notoFont, font_size),
-			"color": color
-		}
-		self.buttons.append(button)
-
-	def ensure_connection(self):
-		if not self.cloudConnection:
-			try:
-				self.cloudConnection = ABMI_Utils.CloudConnection(self.app.cloud_ip, self.app.cloud_user, self.app.cloud_password)
-				self.cloudConnection.connect()
-			except Exception as err:
-				print(f"Cloud connection failed: {err}")
-				self.cloudConnection = None
+		self.buttons.add("← Upload", 15, 150, 140, 70, self.go_upload, font_size=22, color=cool_blue)
+		self.download_button = self.buttons.add("Download", 170, 140, 140, 90, self.download_action, font_size=24, color=soft_green)
+		self.buttons.add("Test →", 325, 150, 140, 70, self.go_test, font_size=22, color=warning_orange)
 
 	def on_enter(self):
 		self.bottom_message = ""
 		self.downloading = False
-		self.ensure_connection()
-		if not self.cloudConnection:
-			self.availability_message = "Unable to connect"
-			self.model_available = False
-			return
+		# The shared session is picked up in update() once the monitor has it
+		self.cloudConnection = None
+		self.model_available = False
+		self.availability_message = "Connecting..."
+		self.app.connectivity.request()
+
+	def _refresh_availability(self):
+		connection = self.cloudConnection
 		try:
-			count = self.cloudConnection.count_files_in_folder("/Models/" + self.app.user_id)
+			count = connection.count_files_in_folder("/Models/" + self.app.user_id)
 			self.model_available = count > 0
 			self.availability_message = "Model Available" if self.model_available else "No Model Available"
 		except Exception as err:
 			print(f"Failed to query cloud data: {err}")
 			self.availability_message = "Failed to load"
 			self.model_available = False
+			# update() picks up the monitor's replacement session
+			if self.cloudConnection is connection:
+				self.cloudConnection = None
+			self.app.connectivity.drop_session(connection)
 
 	def go_upload(self):
 		self.app.switch_scene("upload_to_cloud")
@@ -865,11 +998,21 @@ class DownloadFromCloudScene(Scene):
 		self.download_thread.start()
 
 	def _run_download(self):
+		connection = self.cloudConnection
 		try:
-			# Placeholder for future download logic
-			self.cloudConnection.download_all_files(remote_root="/Models/" + self.app.user_id, local_root="Model/")
-			self.bottom_message = "Download Complete"
-			print("Successfully downloaded model from cloud.")
+			# Only fetch model files whose hash differs from the local copy
+			fetcher = Cloud_Utils.ModelFetcher(self.app.cloud_transports, remote_root="/Models/" + self.app.user_id, local_root="Model/")
+			result = fetcher.fetch()
+			if result is None:
+				# Server has no manifest yet; fall back to a full download
+				connection.download_all_files(remote_root="/Models/" + self.app.user_id, local_root="Model/")
+				self.bottom_message = "Download Complete"
+				print("Successfully downloaded model from cloud.")
+			elif result.updated:
+				self.bottom_message = "Model Updated"
+				print(f"Downloaded {len(result.updated)} model files ({result.bytes_received} bytes) in {result.elapsed:.1f}s.")
+			else:
+				self.bottom_message = "Model Up To Date"
 		except Exception as err:
 			print(f"Download failed: {err}")
 			self.bottom_message = "Download failed"
@@ -880,34 +1023,34 @@ class DownloadFromCloudScene(Scene):
 		self.app.switch_scene("model_test")
 
 	def handle_events(self, event):
-		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-			mx, my = event.pos
-			for btn in self.buttons:
-				if btn["rect"].collidepoint(mx, my):
-					btn["callback"]()
+		self.buttons.handle_event(event)
 
 	def update(self):
+		if not self.cloudConnection:
+			self.cloudConnection = self.app.connectivity.session()
+			if self.cloudConnection:
+				threading.Thread(target=self._refresh_availability, daemon=True).start()
+			else:
+				cloud = self.app.connectivity.status("cloud")
+				if cloud is not None and not cloud.ok:
+					self.availability_message = "Unable to connect"
+		self.download_button.enabled = not self.downloading
 		if self.downloading:
 			self.spinner_angle = (self.spinner_angle + self.spinner_speed) % 360
 
 	def draw(self, surface):
 		surface.fill(white)
-		title_surface = self.title_font.render("Download From Cloud", True, black)
+		title_surface = render_text(self.title_font, "Download From Cloud", black)
 		title_rect = title_surface.get_rect(center=(surface.get_width() // 2, 60))
 		surface.blit(title_surface, title_rect)
 
-		status_surface = self.status_font.render(self.availability_message, True, black)
+		status_surface = render_text(self.status_font, self.availability_message, black)
 		status_rect = status_surface.get_rect(center=(surface.get_width() // 2, 100))
 		surface.blit(status_surface, status_rect)
 
-		for btn in self.buttons:
-			pygame.draw.rect(surface, btn["color"], btn["rect"])
-			pygame.draw.rect(surface, black, btn["rect"], 3)
-			text_surface = btn["font"].render(btn["text"], True, black)
-			text_rect = text_surface.get_rect(center=btn["rect"].center)
-			surface.blit(text_surface, text_rect)
+		self.buttons.draw(surface)
 
-		bottom_surface = self.message_font.render(self.bottom_message, True, black)
+		bottom_surface = render_text(self.message_font, self.bottom_message, black)
 		bottom_rect = bottom_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() - 30))
 		surface.blit(bottom_surface, bottom_rect)
 
@@ -925,9 +1068,9 @@ class ModelTestScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
 		self.app = app
-		self.title_font = pygame.font.Font(notoFont, 28)
-		self.status_font = pygame.font.Font(notoFont, 22)
-		self.buttons = []
+		self.title_font = fonts.get(28)
+		self.status_font = fonts.get(22)
+		self.buttons = ButtonGroup()
 		self.state = "idle"  # idle, collecting, confirm, label
 		self.bottom_message = ""
 		self.prediction_message = ""
@@ -945,30 +1088,20 @@ class ModelTestScene(Scene):
 
 		self.configure_buttons()
 
-	def add_button(self, text, x, y, w, h, callback, font_size=28, color=white):
-		button = {
-			"rect": pygame.Rect(x, y, w, h),
-			"text": text,
-			"callback": callback,
-			"font": pygame.font.Font(notoFont, font_size),
-			"color": color
-		}
-		self.buttons.append(button)
-
 	def configure_buttons(self):
-		self.buttons = []
+		self.buttons.clear()
 		if self.state == "idle":
-			self.add_button("← Download", 25, 160, 170, 70, self.go_back, font_size=22, color=cool_blue)
-			self.add_button("Begin", 210, 145, 160, 100, self.begin_action, font_size=30, color=soft_green)
+			self.buttons.add("← Download", 25, 160, 170, 70, self.go_back, font_size=22, color=cool_blue)
+			self.buttons.add("Begin", 210, 145, 160, 100, self.begin_action, font_size=30, color=soft_green)
 		elif self.state == "collecting":
-			self.add_button("Cancel", 165, 160, 150, 70, self.cancel_action, font_size=26, color=light_red)
+			self.buttons.add("Cancel", 165, 160, 150, 70, self.cancel_action, font_size=26, color=light_red)
 		elif self.state == "confirm":
-			self.add_button("No", 60, 170, 140, 80, self.discard_action, font_size=26, color=light_red)
-			self.add_button("Yes", 260, 170, 160, 80, self.save_action, font_size=26, color=soft_green)
+			self.buttons.add("No", 60, 170, 140, 80, self.discard_action, font_size=26, color=light_red)
+			self.buttons.add("Yes", 260, 170, 160, 80, self.save_action, font_size=26, color=soft_green)
 		elif self.state == "label":
-			self.add_button("Left", 20, 165, 130, 80, lambda: self.label_action(1), font_size=24, color=white)
-			self.add_button("Center", 175, 165, 130, 80, lambda: self.label_action(2), font_size=24, color=white)
-			self.add_button("Right", 330, 165, 130, 80, lambda: self.label_action(3), font_size=24, color=white)
+			self.buttons.add("Left", 20, 165, 130, 80, lambda: self.label_action(1), font_size=24, color=white)
+			self.buttons.add("Center", 175, 165, 130, 80, lambda: self.label_action(2), font_size=24, color=white)
+			self.buttons.add("Right", 330, 165, 130, 80, lambda: self.label_action(3), font_size=24, color=white)
 
 	def set_state(self, new_state):
 		self.state = new_state
@@ -1107,11 +1240,7 @@ class ModelTestScene(Scene):
 		self.set_state("idle")
 
 	def handle_events(self, event):
-		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-			mx, my = event.pos
-			for btn in self.buttons:
-				if btn["rect"].collidepoint(mx, my):
-					btn["callback"]()
+		self.buttons.handle_event(event)
 
 	def update(self):
 		if self.is_collecting:
@@ -1130,7 +1259,7 @@ class ModelTestScene(Scene):
 		else:
 			title = "Test Current Model"
 
-		title_surface = self.title_font.render(title, True, black)
+		title_surface = render_text(self.title_font, title, black)
 		title_rect = title_surface.get_rect(center=(surface.get_width() // 2, 60))
 		surface.blit(title_surface, title_rect)
 
@@ -1140,18 +1269,13 @@ class ModelTestScene(Scene):
 			description = "Which direction did you choose?"
 		else:
 			description = "Successful tests can be saved."
-		desc_surface = self.status_font.render(description, True, black)
+		desc_surface = render_text(self.status_font, description, black)
 		desc_rect = desc_surface.get_rect(center=(surface.get_width() // 2, 110))
 		surface.blit(desc_surface, desc_rect)
 
-		for btn in self.buttons:
-			pygame.draw.rect(surface, btn["color"], btn["rect"])
-			pygame.draw.rect(surface, black, btn["rect"], 3)
-			text_surface = btn["font"].render(btn["text"], True, black)
-			text_rect = text_surface.get_rect(center=btn["rect"].center)
-			surface.blit(text_surface, text_rect)
+		self.buttons.draw(surface)
 
-		bottom_surface = self.status_font.render(self.bottom_message, True, black)
+		bottom_surface = render_text(self.status_font, self.bottom_message, black)
 		bottom_rect = bottom_surface.get_rect(center=(surface.get_width() // 2, surface.get_height() - 30))
 		surface.blit(bottom_surface, bottom_rect)
 
@@ -1169,13 +1293,14 @@ class CollectDataSingleScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
 		self.app = app
-		self.font_en = pygame.font.Font(notoFont, 20)
-		self.font_jp = pygame.font.Font(notoFont, 20)
+		self.font_en = fonts.get(20)
+		self.font_jp = fonts.get(20)
 		self.message_en = "Collecting training data, in case of problem, please press Cancel..."
 		self.message_jp = "データ収集中。問題があればキャンセルを押してください..."
-		self.buttons = []
+		self.buttons = ButtonGroup()
 		self.sequence_thread = None
 		self.sequence_stop_event = None
+		self.recording_path = None
 
 		# Spinner setup
 		self.spinner_angle = 0
@@ -1184,17 +1309,7 @@ class CollectDataSingleScene(Scene):
 		self.spinner_speed = -2  # degrees per frame
 
 		# --- Cancel Button ---
-		self.add_button("Cancel", 165, 220, 150, 70, self.cancel_action, font_size=26, color=light_red)
-
-	def add_button(self, text, x, y, w, h, callback, font_size=28, color=white):
-		button = {
-			"rect": pygame.Rect(x, y, w, h),
-			"text": text,
-			"callback": callback,
-			"font": pygame.font.Font(notoFont, font_size),
-			"color": color
-		}
-		self.buttons.append(button)
+		self.buttons.add("Cancel", 165, 220, 150, 70, self.cancel_action, font_size=26, color=light_red)
 
 	def cancel_action(self):
 		print("Cancel pressed — returning to Trainer Scene")
@@ -1215,11 +1330,7 @@ class CollectDataSingleScene(Scene):
 		self.app.switch_scene("trainer")
 
 	def handle_events(self, event):
-		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-			mx, my = event.pos
-			for btn in self.buttons:
-				if btn["rect"].collidepoint(mx, my):
-					btn["callback"]()
+		self.buttons.handle_event(event)
 
 	def update(self):
 		# Rotate spinner continuously
@@ -1245,11 +1356,13 @@ class CollectDataSingleScene(Scene):
 		if not self.sequence_thread:
 			timestamp = datetime.datetime.now()
 			lcr_choice = ABMI_Utils.chooseNewLCRValue(self.app.recording_lcr_counts)
+			self.recording_path = os.path.join(self.app.session_Folder, f"{self.app.user_id}-{timestamp.strftime('%Y-%m-%d-%H-%M-%S')}-{lcr_choice}.csv")
 			self.sequence_thread, self.sequence_stop_event = ABMI_Utils.startSingleTrainingSequence(board, self.app.user_id, timestamp, lcr_choice, self.app.session_Folder)
 
 		if self.sequence_thread:
 			if not self.sequence_thread.is_alive():
 				self.sequence_thread = None
+				self.app.catalog.add(self.recording_path)
 				self.app.switch_scene("trainer")
 
 	def draw(self, surface):
@@ -1263,12 +1376,7 @@ class CollectDataSingleScene(Scene):
 		y_after_jp = draw_text_wrapped(surface, self.message_jp, self.font_jp, black, 50, start_y + y_after_en + 5, max_width, 8, 'jp')
 
 		# --- Buttons ---
-		for btn in self.buttons:
-			pygame.draw.rect(surface, btn['color'], btn['rect'])
-			pygame.draw.rect(surface, black, btn['rect'], 3)
-			text_surface = btn['font'].render(btn['text'], True, black)
-			text_rect = text_surface.get_rect(center=btn['rect'].center)
-			surface.blit(text_surface, text_rect)
+		self.buttons.draw(surface)
 
 		# Draw spinner
 		num_lines = 12
@@ -1284,31 +1392,17 @@ class EmergencyDisconnectedScene(Scene):
 	def __init__(self, app):
 		super().__init__(app)
 		self.app = app
-		self.font_en = pygame.font.Font(notoFont, 22)
-		self.font_jp = pygame.font.Font(notoFont, 22)
-		self.buttons = []
-		self.add_button("Reconnect", 150, 220, 180, 70, self.reconnect_action, font_size=26, color=light_green)
-
-	def add_button(self, text, x, y, w, h, callback, font_size=28, color=white):
-		button = {
-			"rect": pygame.Rect(x, y, w, h),
-			"text": text,
-			"callback": callback,
-			"font": pygame.font.Font(notoFont, font_size),
-			"color": color
-		}
-		self.buttons.append(button)
+		self.font_en = fonts.get(22)
+		self.font_jp = fonts.get(22)
+		self.buttons = ButtonGroup()
+		self.buttons.add("Reconnect", 150, 220, 180, 70, self.reconnect_action, font_size=26, color=light_green)
 
 	def reconnect_action(self):
 		print("Reconnect pressed")
 		self.app.bciboard.connect()
 
 	def handle_events(self, event):
-		if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-			mx, my = event.pos
-			for btn in self.buttons:
-				if btn["rect"].collidepoint(mx, my):
-					btn["callback"]()
+		self.buttons.handle_event(event)
 
 	def update(self):
 		if self.app.bciboard.connected:	
@@ -1321,24 +1415,103 @@ class EmergencyDisconnectedScene(Scene):
 		en_text = "Emergency: BCIBoard connection is lost!"
 		jp_text = "緊急: BCIボードの接続が失われました!"
 
-		en_surface = self.font_en.render(en_text, True, red)
+		en_surface = render_text(self.font_en, en_text, red)
 		en_rect = en_surface.get_rect(center=(surface.get_width() // 2, 100))
 		surface.blit(en_surface, en_rect)
 
-		jp_surface = self.font_jp.render(jp_text, True, red)
+		jp_surface = render_text(self.font_jp, jp_text, red)
 		jp_rect = jp_surface.get_rect(center=(surface.get_width() // 2, en_rect.bottom + 40))
 		surface.blit(jp_surface, jp_rect)
 
-		for btn in self.buttons:
-			pygame.draw.rect(surface, btn["color"], btn["rect"])
-			pygame.draw.rect(surface, black, btn["rect"], 3)
-			text_surface = btn["font"].render(btn["text"], True, black)
-			text_rect = text_surface.get_rect(center=btn["rect"].center)
-			surface.blit(text_surface, text_rect)
+		self.buttons.draw(surface)
+
+# --- Scene Registry ---
+class SceneRegistry:
+	"""
+	Scene factories by name. A scene is constructed the first time it is
+	looked up, so startup only pays for the scenes that are actually shown.
+	items() only covers the scenes built so far; the others are still fresh.
+	"""
+
+	def __init__(self):
+		self._factories = {}
+		self._scenes = {}
+		self.build_times = {}
+
+	def register(self, name, factory):
+		self._factories[name] = factory
+
+	def __contains__(self, name):
+		return name in self._factories
+
+	def __getitem__(self, name):
+		scene = self._scenes.get(name)
+		if scene is None:
+			start = time.perf_counter()
+			scene = self._factories[name]()
+			self.build_times[name] = time.perf_counter() - start
+			self._scenes[name] = scene
+		return scene
+
+	def items(self):
+		return list(self._scenes.items())
+
+# Sounds the trainer plays; read ahead so the first playback does not wait on the SD card
+PRELOAD_SOUNDS = [
+	"Sounds/beep_left.wav", "Sounds/beep_center.wav", "Sounds/beep_right.wav", "Sounds/beep_silent.wav",
+	"Sounds/instruction_left.wav", "Sounds/instruction_center.wav", "Sounds/instruction_right.wav",
+	"Sounds/instruction_starting.wav",
+	"Sounds/prediction_left.wav", "Sounds/prediction_center.wav", "Sounds/prediction_right.wav",
+	"Sounds/prediction_unknown.wav",
+]
+
+class AssetPreloader:
+	"""
+	Background thread that reads the shared font and the trainer sounds from
+	disk while the Welcome scene is up. It only does file I/O; pygame
+	objects are still created on the main thread.
+	"""
+
+	def __init__(self, font_registry, sound_paths=PRELOAD_SOUNDS):
+		self.font_registry = font_registry
+		self.sound_paths = sound_paths
+		self.bytes_read = 0
+		self.elapsed = None
+		self.done = threading.Event()
+		self._thread = None
+
+	def start(self):
+		self._thread = threading.Thread(target=self._run, name="AssetPreloader", daemon=True)
+		self._thread.start()
+		return self
+
+	def _run(self):
+		start = time.perf_counter()
+		try:
+			self.font_registry.preload()
+		except OSError as e:
+			print(f"[WARN] Font preload failed: {e}")
+		for path in self.sound_paths:
+			try:
+				with open(path, "rb") as f:
+					self.bytes_read += len(f.read())
+			except OSError as e:
+				print(f"[WARN] Sound preload failed: {e}")
+		self.elapsed = time.perf_counter() - start
+		self.done.set()
 
 # --- Main App Class ---
 class BMITrainer:
-	def __init__(self):
+	def __init__(self, acquisition_daemon=False):
+		self.startup_time = time.perf_counter()
+		self.first_frame_time = None
+
+		# Acquisition process is forked, so it has to start before pygame
+		self.acquisition_service = None
+		if acquisition_daemon:
+			self.acquisition_service = EEG_Utils.AcquisitionService(port="/dev/bci_dongle")
+			self.acquisition_service.start()
+
 		# Initialize Pygame
 		pygame.init()
 
@@ -1366,32 +1539,48 @@ class BMITrainer:
 		self.model_Folder = None
 		self.testing_Folder = None
 		self.recording_lcr_counts = None
+
+		# Index of the recordings in BMI Trainer Data, updated incrementally
+		self.catalog = Catalog_Utils.RecordingCatalog(base_folder="BMI Trainer Data/")
   
-		#TCP credentials
-		self.cloud_ip = "131.113.139.72"
-		self.cloud_user = "ext_guest"
-		self.cloud_password = "GuestMoonshot01"
-
-		# Scenes
-		self.scenes = {
-			"welcome": WelcomeScene(self),
-			"wifi_check": WiFiCheckScene(self),
-			"bci_connect": BCIConnectScene(self),
-			"impedance_results_single": ImpedanceResultsSingleScene(self),
-			"trainer": TrainerScene(self),
-			"upload_to_cloud": UploadToCloudScene(self),
-			"download_from_cloud": DownloadFromCloudScene(self),
-			"model_test": ModelTestScene(self),
-			"collect_data_single": CollectDataSingleScene(self),
-			"emergency": EmergencyDisconnectedScene(self)
-		}
-		
+		#Cloud server settings, shared by CloudConnection, the upload/download transports and the probe
+		self.cloud = Cloud_Utils.CloudConfig(
+			host="131.113.139.72", port=21, protocol="ftp",
+			user="ext_guest", password="GuestMoonshot01")
+		self.cloud_ip, self.cloud_user, self.cloud_password = self.cloud.host, self.cloud.user, self.cloud.password
+		# Logged-in upload/download connections, reused between presses
+		self.cloud_transports = Cloud_Utils.TransportPool(self.cloud)
+		# Internet/cloud reachability and a warm cloud session, kept up in the background
+		self.connectivity = Cloud_Utils.ConnectivityMonitor(
+			probes={"internet": ("8.8.8.8", 443), "cloud": (self.cloud.host, self.cloud.port)},
+			session_factory=self.connect_cloud,
+			session_check=lambda session: session.folder_exists("/Training_Data")).start()
+
+		# Recordings are compressed while uploading: "auto" (zstd if installed, else gzip), "gzip", "zstd" or None
+		self.upload_compression = "auto"
+		self.upload_compression_level = None
+
+		# Start reading fonts and sounds while the Welcome scene is shown
+		self.preloader = AssetPreloader(fonts).start()
+
+		# Scenes are built on first entry
+		self.scenes = SceneRegistry()
+		self.scenes.register("welcome", lambda: WelcomeScene(self))
+		self.scenes.register("wifi_check", lambda: WiFiCheckScene(self))
+		self.scenes.register("bci_connect", lambda: BCIConnectScene(self))
+		self.scenes.register("impedance_results_single", lambda: ImpedanceResultsSingleScene(self))
+		self.scenes.register("trainer", lambda: TrainerScene(self))
+		self.scenes.register("upload_to_cloud", lambda: UploadToCloudScene(self))
+		self.scenes.register("download_from_cloud", lambda: DownloadFromCloudScene(self))
+		self.scenes.register("model_test", lambda: ModelTestScene(self))
+		self.scenes.register("collect_data_single", lambda: CollectDataSingleScene(self))
+		self.scenes.register("emergency", lambda: EmergencyDisconnectedScene(self))
+
 		# Add individual cable check scenes from canonical list in ABMI_Utils
 		for i, (name_lc, color) in enumerate(zip(ABMI_Utils.CABLE_COLORS, ABMI_Utils.CABLE_COLORS_RGB)):
 			name_title = name_lc.title()
 			scene_name = f"impedance_check_{name_lc}"
-			self.scenes[scene_name] = ImpedanceCheckSingleScene(self, i, name_title, color)
-		self.current_scene = self.scenes["welcome"]
+			self.scenes.register(scene_name, lambda i=i, name_title=name_title, color=color: ImpedanceCheckSingleScene(self, i, name_title, color))
 
 		# Set starting scene
 		if self.developer_mode and self.dev_start_scene in self.scenes:
@@ -1401,9 +1590,10 @@ class BMITrainer:
 
 	def switch_scene(self, scene_name):
 		if scene_name in self.scenes:
+			# Building the trainer scene sets user_id, which the count needs
+			self.current_scene = self.scenes[scene_name]
 			if scene_name == 'trainer':
 				self.refresh_lcr_count()
-			self.current_scene = self.scenes[scene_name]
 			if hasattr(self.current_scene, 'on_enter'):
 				self.current_scene.on_enter()
 			if hasattr(self.current_scene, 'refresh_lcr_count'):
@@ -1412,8 +1602,15 @@ class BMITrainer:
 				except Exception:
 					pass
    
+	def connect_cloud(self):
+		# Same server as the transports; self.cloud's port/protocol must be the ones CloudConnection uses
+		connection = ABMI_Utils.CloudConnection(self.cloud.host, self.cloud.user, self.cloud.password)
+		connection.connect()
+		return connection
+
 	def refresh_lcr_count(self):
-		self.recording_lcr_counts = ABMI_Utils.countRecordings(self.user_id, base_folder="BMI Trainer Data/")
+		self.catalog.sync()
+		self.recording_lcr_counts = self.catalog.counts(self.user_id)
 
 	def handle_events(self):
 		for event in pygame.event.get():
@@ -1429,8 +1626,15 @@ class BMITrainer:
 			self.current_scene.update()
 			self.current_scene.draw(self.screen)
 			pygame.display.flip()
+			if self.first_frame_time is None:
+				self.first_frame_time = time.perf_counter() - self.startup_time
+				print(f"[OK] First frame after {self.first_frame_time:.2f}s")
 			self.clock.tick(60)
 
 	def quit(self):
+		self.connectivity.stop()
+		self.cloud_transports.close()
+		if self.acquisition_service is not None:
+			self.acquisition_service.stop()
 		pygame.quit()
 		sys.exit()
@@ -0,0 +1,245 @@
+"""
+UI_Utils.py
+
+Shared pygame drawing helpers for the 480x320 arm UIs (ALS-User, genericTemplate).
+
+  - LRUCache     : small least-recently-used mapping shared by the caches
+                   below and Scene_Utils' text layout cache.
+  - FontRegistry : one pygame Font per size, loaded from disk on first use
+                   instead of on every frame.
+  - TextCache    : LRU cache of rendered text surfaces keyed by
+                   (text, size, color, language), so static labels are
+                   rasterized once.
+  - FrameTimer   : rolling average of the per-frame draw time with a small
+                   on-screen readout.
+  - RetainedRenderer : dirty-rectangle renderer. Draw functions declare keyed
+                   widgets every frame; only regions whose widgets changed
+                   are repainted and pushed with pygame.display.update(rects).
+"""
+
+import io
+import time
+from collections import OrderedDict, deque
+
+import pygame
+
+DEFAULT_FONT_PATH = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
+
+
+class LRUCache:
+	"""Mapping with a size bound; the least recently used entry is evicted first."""
+
+	def __init__(self, max_entries=256):
+		self.max_entries = max_entries
+		self.hits = 0
+		self.misses = 0
+		self._entries = OrderedDict()
+
+	def get(self, key):
+		value = self._entries.get(key)
+		if value is None:
+			self.misses += 1
+			return None
+		self._entries.move_to_end(key)
+		self.hits += 1
+		return value
+
+	def put(self, key, value):
+		self._entries[key] = value
+		self._entries.move_to_end(key)
+		if len(self._entries) > self.max_entries:
+			self._entries.popitem(last=False)
+
+	def clear(self):
+		self._entries.clear()
+
+	def __len__(self):
+		return len(self._entries)
+
+
+class FontRegistry:
+	"""
+	Loads each font size once and hands out the shared pygame Font.
+
+	preload() may run on a background thread: it only reads the font file
+	into memory. Font objects are still created on the caller's (main)
+	thread in get(), from that in-memory copy when it is ready.
+	"""
+
+	def __init__(self, path=DEFAULT_FONT_PATH):
+		self.path = path
+		self._fonts = {}
+		self._data = None
+
+	def preload(self):
+		if self._data is None and self.path is not None:
+			with open(self.path, "rb") as f:
+				self._data = f.read()
+
+	def get(self, size):
+		font = self._fonts.get(size)
+		if font is None:
+			source = io.BytesIO(self._data) if self._data is not None else self.path
+			font = pygame.font.Font(source, size)
+			self._fonts[size] = font
+		return font
+
+
+class TextCache:
+	"""
+	Rendered-text cache with LRU eviction.
+
+	Surfaces are shared between callers and must be treated as read-only.
+	"""
+
+	def __init__(self, fonts, max_entries=256):
+		self.fonts = fonts
+		self._surfaces = LRUCache(max_entries)
+
+	@property
+	def hits(self):
+		return self._surfaces.hits
+
+	@property
+	def misses(self):
+		return self._surfaces.misses
+
+	def render(self, text, size, color, lang=None):
+		key = (text, size, tuple(color), lang)
+		surface = self._surfaces.get(key)
+		if surface is None:
+			surface = self.fonts.get(size).render(text, True, color)
+			self._surfaces.put(key, surface)
+		return surface
+
+	def clear(self):
+		self._surfaces.clear()
+
+
+class FrameTimer:
+	"""Average draw time over the last `window` frames."""
+
+	def __init__(self, window=60):
+		self._samples = deque(maxlen=window)
+		self._start = None
+
+	def begin(self):
+		self._start = time.perf_counter()
+
+	def end(self):
+		if self._start is not None:
+			self._samples.append(time.perf_counter() - self._start)
+			self._start = None
+
+	@property
+	def average_ms(self):
+		if not self._samples:
+			return 0.0
+		return 1000.0 * sum(self._samples) / len(self._samples)
+
+	def readout(self):
+		# Rounded to 0.1 ms so the readout reuses cached surfaces
+		return f"{self.average_ms:.1f} ms"
+
+	def draw(self, surface, text_cache, topright, color=(255, 246, 120), size=13):
+		text_surf = text_cache.render(self.readout(), size, color)
+		surface.blit(text_surf, text_surf.get_rect(topright=topright))
+		return text_surf.get_rect(topright=topright)
+
+
+class RetainedRenderer:
+	"""
+	Retained-mode drawing onto a fixed-size UI surface shown on `screen` at
+	`offset`.
+
+	Every frame the draw code calls begin(scene), then declares its widgets
+	with add(key, rect, state, paint) or blit(key, surface, **anchor), in
+	back-to-front order. present() compares them with the previous frame: a
+	widget is dirty when it is new, gone, moved or its `state` changed.
+	Only the dirty regions are cleared and repainted (every overlapping widget,
+	clipped, in declaration order) and pushed to the display. A scene change
+	or invalidate() repaints everything.
+
+	`state` must compare equal exactly when the widget looks the same; cached
+	text surfaces compare by identity, which suits TextCache.
+	"""
+
+	def __init__(self, surface, screen, background=(0, 0, 0), offset=(0, 0)):
+		self.surface = surface
+		self.screen = screen
+		self.background = background
+		self.offset = offset
+		self.frames = 0
+		self.repainted_frames = 0
+		self._scene = None
+		self._full = True
+		self._widgets = {}
+		self._previous = {}
+
+	def begin(self, scene):
+		if scene != self._scene:
+			self._scene = scene
+			self._full = True
+		self._widgets = {}
+
+	def invalidate(self):
+		self._full = True
+
+	def add(self, key, rect, state, paint):
+		rect = pygame.Rect(rect)
+		self._widgets[key] = (rect, state, paint)
+		return rect
+
+	def blit(self, key, source, **anchor):
+		rect = source.get_rect(**anchor)
+		return self.add(key, rect, source, lambda target: target.blit(source, rect))
+
+	def _dirty_regions(self):
+		if self._full:
+			return [self.surface.get_rect()]
+		dirty = []
+		for key, (rect, state, _) in self._widgets.items():
+			previous = self._previous.get(key)
+			if previous is None:
+				dirty.append(rect)
+			elif previous[0] != rect or previous[1] != state:
+				dirty.extend((previous[0], rect))
+		for key, (rect, _) in self._previous.items():
+			if key not in self._widgets:
+				dirty.append(rect)
+
+		# Merge overlapping regions so no pixel is repainted twice
+		merged = []
+		for rect in dirty:
+			rect = rect.clip(self.surface.get_rect())
+			if not rect.width or not rect.height:
+				continue
+			i = rect.collidelist(merged)
+			while i != -1:
+				rect.union_ip(merged.pop(i))
+				i = rect.collidelist(merged)
+			merged.append(rect)
+		return merged
+
+	def present(self):
+		"""Repaint and push the dirty regions; returns them (empty when nothing changed)."""
+		dirty = self._dirty_regions()
+		for area in dirty:
+			self.surface.set_clip(area)
+			self.surface.fill(self.background)
+			for rect, _, paint in self._widgets.values():
+				if rect.colliderect(area):
+					paint(self.surface)
+		self.surface.set_clip(None)
+
+		if dirty:
+			screen_rects = [area.move(self.offset) for area in dirty]
+			for area, screen_rect in zip(dirty, screen_rects):
+				self.screen.blit(self.surface, screen_rect, area)
+			pygame.display.update(screen_rects)
+			self.repainted_frames += 1
+
+		self.frames += 1
+		self._previous = {key: (rect, state) for key, (rect, state, _) in self._widgets.items()}
+		self._full = False
+		return dirty
@@ -4,6 +4,7 @@ import random
 import math
 import threading
 import Arm_Utils
+import UI_Utils
 from dynamixel_sdk import *
 
 def match_lists(expected, actual):
@@ -36,80 +37,67 @@ def detect_arm_ports():
 
 def ping_arm(index):
 
-	global RightArm, LeftArm
 	global right_arm_motors_alive, left_arm_motors_alive
 
-	def worker(arm, expected_ids, update_alive):
-		if arm.ping_thread_running:
-			return
-		arm.ping_thread_running = True
-		successful_ids = arm.ping_motors()
-		update_alive(match_lists(expected_ids, successful_ids))
-		arm.ping_thread_running = False
-		
-	if index == 0 and RightArm: # Motors 1-9
-		threading.Thread(
-			target=worker,
-			args=(RightArm, right_arm_expected_motors, lambda v: globals().__setitem__('right_arm_motors_alive', v)),
-			daemon=True
-		).start()
-
-	elif index == 1 and LeftArm: # Motors 11-18
-		threading.Thread(
-			target=worker,
-			args=(LeftArm, left_arm_expected_motors, lambda v: globals().__setitem__('left_arm_motors_alive', v)),
-			daemon=True
-		).start()
+	# Alive values come from the arm's telemetry snapshot; nothing touches the bus here
+	telemetry = arm_telemetry[index]
+	if telemetry is None:
+		return
+
+	if index == 0: # Motors 1-9
+		right_arm_motors_alive = match_lists(right_arm_expected_motors, telemetry.snapshot.alive)
+
+	elif index == 1: # Motors 11-18
+		left_arm_motors_alive = match_lists(left_arm_expected_motors, telemetry.snapshot.alive)
+
+def present():
+	# Optional draw-time readout in the top-right corner, then flip
+	if SHOW_FRAME_TIME:
+		frame_timer.draw(screen, text_cache, (render_surface.get_width() - 5, 5))
+	pygame.display.flip()
 
 def draw_language_selection():
 	render_surface.fill(black)
 
-	font = pygame.font.Font("/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf", 23)
-	bigfont = pygame.font.Font("/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf", 40)
-	smallfont = pygame.font.Font("/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf", 16)
-
 	# Warning if controller not connected
 	if pygame.joystick.get_count() == 0:
 		warning_text = "WARNING: CONTROLLER NOT DETECTED"
-		warning_surface = smallfont.render(warning_text, True, soft_red)
+		warning_surface = text_cache.render(warning_text, 16, soft_red, language)
 		warning_rect = warning_surface.get_rect(center=(render_surface.get_width() // 2, 35))
 		render_surface.blit(warning_surface, warning_rect)
 
 	# Prompt
 	prompt = "Select Language / 言語を選択してください"
-	prompt_surface = font.render(prompt, True, white)
+	prompt_surface = text_cache.render(prompt, 23, white, language)
 	prompt_rect = prompt_surface.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() // 3 - 30))
 	render_surface.blit(prompt_surface, prompt_rect)
 
 	# Languages
 	for i, lang in enumerate(languages):
 		color = cool_blue if i == selected_lang_index else white
-		lang_surface = bigfont.render(lang, True, color)
+		lang_surface = text_cache.render(lang, 40, color, language)
 		offset_x = -100 if i == 0 else 100
 		lang_rect = lang_surface.get_rect(center=(render_surface.get_width() // 2 + offset_x, render_surface.get_height() // 2))
 		render_surface.blit(lang_surface, lang_rect)
 
 	# Confirm text
 	confirm_text = "Press ♥ to confirm / 決定するには♥を押してください"
-	confirm_surface = smallfont.render(confirm_text, True, white)
+	confirm_surface = text_cache.render(confirm_text, 16, white, language)
 	confirm_rect = confirm_surface.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() - 80))
 	render_surface.blit(confirm_surface, confirm_rect)
 
 	# Draw to screen
 	screen.blit(render_surface, (0, 0))
 	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	present()
 
 def draw_motor_readings(index):
 	render_surface.fill(black)
 	
 	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	title_font = pygame.font.Font(font_path, 20)
-	status_font = pygame.font.Font(font_path, 16)
-	instruction_font = pygame.font.Font(font_path, 13)
-	notice_font = pygame.font.Font(font_path, 18)
-	controls_font = pygame.font.Font(font_path, 30)
+	instruction_font = fonts.get(13)
+	notice_font = fonts.get(18)
+	controls_font = fonts.get(30)
 
 	# Ping for motor alive values
 	ping_arm(index)
@@ -155,13 +143,13 @@ def draw_motor_readings(index):
 		controls = "♥: 次へ\n–: 戻る"
 
 	# Draw status line
-	status_surf = status_font.render(status_text, True, white)
+	status_surf = text_cache.render(status_text, 16, white, language)
 	render_surface.blit(status_surf, (left_margin, top_margin))
 
 	# Draw instruction text
 	lines = instructions.split("\n")
 	for i, line in enumerate(lines):
-		line_surf = instruction_font.render(line, True, warning_orange)
+		line_surf = text_cache.render(line, 13, warning_orange, language)
 		y = top_margin + 35 + i * (instruction_font.get_height() + text_spacing)
 		render_surface.blit(line_surf, (left_margin, y))
 
@@ -169,7 +157,7 @@ def draw_motor_readings(index):
 	notice_lines = notice.split("\n")
 	notice_start_y = top_margin + 35 + len(lines) * (instruction_font.get_height() + text_spacing) + 10
 	for i, line in enumerate(notice_lines):
-		line_surf = notice_font.render(line, True, white)
+		line_surf = text_cache.render(line, 18, white, language)
 		y = notice_start_y + i * (notice_font.get_height() + text_spacing)
 		render_surface.blit(line_surf, (left_margin + 5, y))
 
@@ -178,7 +166,7 @@ def draw_motor_readings(index):
 	controls_x = 325
 	controls_y = top_margin + 10
 	for i, line in enumerate(controls_lines):
-		line_surf = controls_font.render(line, True, white)
+		line_surf = text_cache.render(line, 30, white, language)
 		y = controls_y + i * (controls_font.get_height() + text_spacing)
 		render_surface.blit(line_surf, (controls_x, y))
 
@@ -206,7 +194,7 @@ def draw_motor_readings(index):
 
 			if motor_status[idx] == 1:
 				pygame.draw.circle(render_surface, white, (cx, cy), circle_radius, 1)
-				num_surf = title_font.render(str(num), True, white)
+				num_surf = text_cache.render(str(num), 20, white, language)
 				num_rect = num_surf.get_rect(center=(cx, cy))
 				render_surface.blit(num_surf, num_rect)
 			else:
@@ -219,7 +207,7 @@ def draw_motor_readings(index):
 		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
 
 	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	present()
 
 def draw_lock_release():
 
@@ -227,11 +215,8 @@ def draw_lock_release():
 	render_surface.fill(black)
 
 	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	message_font = pygame.font.Font(font_path, 30)
-	controls_font = pygame.font.Font(font_path, 30)
-	button_font = pygame.font.Font(font_path, 40)
-	warning_font = pygame.font.Font(font_path, 18)
+	message_font = fonts.get(30)
+	controls_font = fonts.get(30)
 
 	# Text by language
 	if language == "en":
@@ -252,7 +237,7 @@ def draw_lock_release():
 	# Render top-left message (multi-line)
 	message_lines = message.split("\n")
 	for i, line in enumerate(message_lines):
-		line_surf = message_font.render(line, True, white)
+		line_surf = text_cache.render(line, 30, white, language)
 		render_surface.blit(line_surf, (30, 25 + i * (message_font.get_height() + 5)))
 
 	# Render controls (top right)
@@ -260,7 +245,7 @@ def draw_lock_release():
 	controls_x = 325
 	controls_y = 25
 	for i, line in enumerate(controls_lines):
-		line_surf = controls_font.render(line, True, white)
+		line_surf = text_cache.render(line, 30, white, language)
 		y = controls_y + i * (controls_font.get_height() + 5)
 		render_surface.blit(line_surf, (controls_x, y))
 
@@ -277,8 +262,8 @@ def draw_lock_release():
 
 	# Render LOCK and RELEASE text centered horizontally, below message and controls
 	mid_y = 125
-	lock_surf = button_font.render(lock_text, True, lock_text_color)
-	release_surf = button_font.render(release_text, True, release_text_color)
+	lock_surf = text_cache.render(lock_text, 40, lock_text_color, language)
+	release_surf = text_cache.render(release_text, 40, release_text_color, language)
 
 	# Calculate positions
 	screen_width = render_surface.get_width()
@@ -302,7 +287,7 @@ def draw_lock_release():
 		pygame.draw.circle(surface, color, (x + w - radius, y + radius), radius)
 		pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
 		# draw text centered in pill
-		text_surf = button_font.render(text, True, text_color)
+		text_surf = text_cache.render(text, 40, text_color, language)
 		text_rect = text_surf.get_rect(center=(x + w//2, -2 + y + h//2))
 		surface.blit(text_surf, text_rect)
 
@@ -311,7 +296,7 @@ def draw_lock_release():
 	draw_pill(render_surface, release_x - capsule_width//2, pill_y, capsule_width, capsule_height, release_pill_color, "R")
 
 	# Final warning message at the bottom
-	warning_surf = warning_font.render(warning_text, True, white)
+	warning_surf = text_cache.render(warning_text, 18, white, language)
 	warning_rect = warning_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() - 35))
 	render_surface.blit(warning_surf, warning_rect)
 
@@ -321,19 +306,13 @@ def draw_lock_release():
 		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
 
 	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	present()
 
 def draw_recording_stage():
 	global recording_states, playback_button_states
 	render_surface.fill(black)
 
 	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	title_font = pygame.font.Font(font_path, 30)
-	label_font = pygame.font.Font(font_path, 22)
-	status_font = pygame.font.Font(font_path, 25)
-	letter_font = pygame.font.Font(font_path, 36)
-	hint_font = pygame.font.Font(font_path, 20)
  
 	# Text by language
 	if language == "en":
@@ -350,7 +329,7 @@ def draw_recording_stage():
 		hint_text = "♥: 次へ          –: 戻る"
 
 	# Top Title
-	title_surf = title_font.render(title_text, True, white)
+	title_surf = text_cache.render(title_text, 30, white, language)
 	title_rect = title_surf.get_rect(center=(render_surface.get_width() // 2, 40))
 	render_surface.blit(title_surf, title_rect)
 
@@ -363,17 +342,17 @@ def draw_recording_stage():
 		section_x = center_x + (i - 1) * section_spacing
 
 		# "Press X/Y/Z to"
-		press_surf = label_font.render(press_texts[i], True, white)
+		press_surf = text_cache.render(press_texts[i], 22, white, language)
 		press_rect = press_surf.get_rect(center=(section_x, base_y))
 		render_surface.blit(press_surf, press_rect)
 
 		# "START"/"STOP"
-		status_surf = status_font.render(status_texts[i], True, red if status_texts[i] in ["START", "開始"] else green)
+		status_surf = text_cache.render(status_texts[i], 25, red if status_texts[i] in ["START", "開始"] else green, language)
 		status_rect = status_surf.get_rect(center=(section_x, base_y + 40))
 		render_surface.blit(status_surf, status_rect)
 
 		# "Playback 1/2/3"
-		playback_surf = label_font.render(playback_labels[i], True, white)
+		playback_surf = text_cache.render(playback_labels[i], 22, white, language)
 		playback_rect = playback_surf.get_rect(center=(section_x, base_y + 90))
 		render_surface.blit(playback_surf, playback_rect)
 
@@ -384,12 +363,12 @@ def draw_recording_stage():
 		playback_colors = [t if b else f for b, t, f in zip(playback_button_states, pressed_colors, unpressed_colors)]
 		letters = ["A", "B", "C"]
 		pygame.draw.circle(render_surface, playback_colors[i], (section_x, circle_y), 25)
-		letter_surf = letter_font.render(letters[i], True, black)
+		letter_surf = text_cache.render(letters[i], 36, black, language)
 		letter_rect = letter_surf.get_rect(center=(section_x, circle_y-2))
 		render_surface.blit(letter_surf, letter_rect)
 
 	# Bottom-center control hint
-	hint_surf = hint_font.render(hint_text, True, white)
+	hint_surf = text_cache.render(hint_text, 20, white, language)
 	hint_rect = hint_surf.get_rect(
 		center=(render_surface.get_width() // 2, render_surface.get_height() - 30)
 	)
@@ -401,26 +380,19 @@ def draw_recording_stage():
 		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
   
 	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	present()
 
 def draw_live_mode():
 	global lock_button_held, release_button_held, playback_button_states
 	render_surface.fill(black)
 
 	# Fonts
-	font_path = "/home/b2j/Desktop/AugmentedArms/Font/NotoSansJP-Bold.otf"
-	title_font = pygame.font.Font(font_path, 30)
-	letter_font = pygame.font.Font(font_path, 36)
-	hint_font = pygame.font.Font(font_path, 20)
-	button_font = pygame.font.Font(font_path, 40)
-	label_font = pygame.font.Font(font_path, 22)
 
 	# Watermark background: "LIVE\nMODE"
-	watermark_font = pygame.font.Font(font_path, 150)  # Large font size
 	watermark_color = (40, 40, 40)  # Very low brightness gray
 
-	live_surf = watermark_font.render("LIVE", True, watermark_color)
-	mode_surf = watermark_font.render("MODE", True, watermark_color)
+	live_surf = text_cache.render("LIVE", 150, watermark_color, language)
+	mode_surf = text_cache.render("MODE", 150, watermark_color, language)
 
 	live_rect = live_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() // 2 - 90))
 	mode_rect = mode_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() // 2 + 70))
@@ -462,13 +434,13 @@ def draw_live_mode():
 		pygame.draw.circle(surface, color, (x + radius, y + radius), radius)
 		pygame.draw.circle(surface, color, (x + w - radius, y + radius), radius)
 		pygame.draw.rect(surface, color, (x + radius, y, w - 2*radius, h))
-		text_surf = button_font.render(text, True, white)
+		text_surf = text_cache.render(text, 40, white, language)
 		text_rect = text_surf.get_rect(center=(x + w//2, y + h//2 - 2))
 		surface.blit(text_surf, text_rect)
 
 	# Lock/Release Labels
-	lock_label = button_font.render(lock_text, True, lock_text_color)
-	release_label = button_font.render(release_text, True, release_text_color)
+	lock_label = text_cache.render(lock_text, 40, lock_text_color, language)
+	release_label = text_cache.render(release_text, 40, release_text_color, language)
 	render_surface.blit(lock_label, (lock_x - lock_label.get_width()//2 + capsule_width//2, 25))
 	render_surface.blit(release_label, (release_x - release_label.get_width()//2 + capsule_width//2, 25))
 
@@ -489,18 +461,18 @@ def draw_live_mode():
 		x = center_x + (i - 1) * section_spacing
 
 		# Playback labels above buttons
-		label_surf = label_font.render(playback_labels[i], True, white)
+		label_surf = text_cache.render(playback_labels[i], 22, white, language)
 		label_rect = label_surf.get_rect(center=(x, base_y))
 		render_surface.blit(label_surf, label_rect)
 
 		# Circle button with A/B/C
 		pygame.draw.circle(render_surface, playback_colors[i], (x, circle_y), 25)
-		letter_surf = letter_font.render(letters[i], True, black)
+		letter_surf = text_cache.render(letters[i], 36, black, language)
 		letter_rect = letter_surf.get_rect(center=(x, circle_y - 2))
 		render_surface.blit(letter_surf, letter_rect)
 
 	# Bottom hint
-	hint_surf = hint_font.render(hint_text, True, white)
+	hint_surf = text_cache.render(hint_text, 20, white, language)
 	hint_rect = hint_surf.get_rect(center=(render_surface.get_width() // 2, render_surface.get_height() - 30))
 	render_surface.blit(hint_surf, hint_rect)
 
@@ -509,7 +481,7 @@ def draw_live_mode():
 	if not joystick_connected:
 		screen.blit(controller_disconnected_icon_scaled, controller_icon_pos)
 	pygame.draw.rect(screen, cool_blue, render_surface.get_rect(topleft=(0, 0)), 1)
-	pygame.display.flip()
+	present()
 
 #--------------------------------------------------------------------
 #----Main Code
@@ -517,6 +489,7 @@ def draw_live_mode():
 
 # Developer Mode
 DEVELOPER_MODE = False
+SHOW_FRAME_TIME = False  # Draw the average frame draw time on screen
 
 # Scene Vars
 SCENE_LANGUAGE_SELECT = "language_select"
@@ -588,9 +561,17 @@ if not DEVELOPER_MODE:
 	RightArm = arm if (arm := Arm_Utils.RoboticArm(RIGHTARM_PORT_NAME, [1,2,3,4,5,6,7,8,9])).open_port() else None
 	LeftArm = arm if (arm := Arm_Utils.RoboticArm(LEFTARM_PORT_NAME, [11,12,13,14,15,16,17,18])).open_port() else None
 
+# One telemetry poller per arm (Right, Left) feeds the motor-readings screens
+arm_telemetry = [Arm_Utils.ArmTelemetry(arm).start() if arm else None for arm in (RightArm, LeftArm)]
+
 # Initialize Pygame
 pygame.init()
 
+# Fonts are loaded once per size and text surfaces are reused across frames
+fonts = UI_Utils.FontRegistry()
+text_cache = UI_Utils.TextCache(fonts)
+frame_timer = UI_Utils.FrameTimer()
+
 #Create Display
 info = pygame.display.Info()
 screen = pygame.display.set_mode((info.current_w, info.current_h), pygame.FULLSCREEN)
@@ -931,6 +912,7 @@ while True:
 					playback_button_states[2] = False
 
 	# --- Scene drawing ---
+	frame_timer.begin()
 	if current_scene == SCENE_LANGUAGE_SELECT:
 		draw_language_selection()
 	elif current_scene == SCENE_MOTOR_READINGS:
@@ -942,4 +924,6 @@ while True:
 	elif current_scene == SCENE_LIVE_MODE:
 		draw_live_mode()
 
+	frame_timer.end()
+
 	clock.tick(30)
@@ -11,6 +11,7 @@ main.pyからはpredict(file_path)を呼ぶ。
 """
 
 import os, itertools, warnings
+from functools import lru_cache
 import numpy as np
 import pandas as pd
 import joblib
@@ -29,6 +30,9 @@ warnings.filterwarnings("ignore")
 DATA_FOLDER = "./muto_8ch_seq5"
 MODEL_PATH  = "model_2x.pkl"
 
+# recordings synced from the cloud may be compressed; pd.read_csv infers the codec from the suffix
+DATA_SUFFIXES = (".csv", ".csv.gz", ".csv.zst")
+
 # ---- winning hyperparams ----
 BEST = dict(
     lc1=0.21118197873848127,
@@ -54,9 +58,19 @@ EC   = [0, 1, 2]  # indices into labels [1,2,3]
 
 # ---- signal processing ----
 
+@lru_cache(maxsize=16)
+def _bandpass_sos(lc, hc, fs=250):
+    return butter(4, [lc, hc], btype="bandpass", fs=fs, output="sos")
+
 def _bandpass(sig, lc, hc, fs=250):
-    sos = butter(4, [lc, hc], btype="bandpass", fs=fs, output="sos")
-    return sosfiltfilt(sos, sig, axis=0)
+    return sosfiltfilt(_bandpass_sos(lc, hc, fs), sig, axis=0)
+
+def prewarm_filters(p=None):
+    """Design the band-pass filters used by extract_features ahead of the first prediction."""
+    if p is None:
+        p = BEST
+    _bandpass_sos(p["lc1"], p["hc1"])
+    _bandpass_sos(p["lc2"], p["hc2"])
 
 def _zscore(v):
     return (v - v.mean()) / (v.std() + 1e-10)
@@ -186,7 +200,7 @@ def _load_dataset():
     X, y = [], []
     for root, _, files in os.walk(DATA_FOLDER):
         for fname in sorted(files):
-            if not fname.endswith(".csv"):
+            if not fname.endswith(DATA_SUFFIXES):
                 continue
             try:
                 lbl = int(fname.split("_")[-1].split(".")[0])